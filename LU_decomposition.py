@@ -1,5 +1,121 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple, Union
+
 import numpy as np
-from typing import Tuple
+
+from common.dtype import float_dtype
+from common.pivot import check_pivot
+from banded_lu import BandedLUFactorization, banded_lu, bandwidth, thomas_lu, to_banded
+from sparse_lu import sparse_lu
+from triangular_solve import forward_substitution, back_substitution
+
+
+class LUFactorization:
+    """LU factors of a square matrix stored LAPACK style in a single buffer.
+
+    The strictly lower triangle of `lu` holds the multipliers of the unit
+    lower triangular L and the upper triangle holds U. L and U are only
+    materialized when the corresponding attribute is accessed.
+
+    With row pivoting the factors satisfy A[perm] = L @ U, with row and
+    column pivoting A[perm][:, col_perm] = L @ U.
+
+    Attributes:
+        lu (np.ndarray): the packed factors of size n-by-n.
+        perm (np.ndarray): the row permutation as an index array,
+            None if no pivoting was done.
+        col_perm (np.ndarray): the column permutation as an index array,
+            None if no column pivoting was done.
+        tol (float): diagonal entries of U of magnitude at most tol are
+            treated as zero by solve.
+    """
+
+    def __init__(
+        self,
+        lu: np.ndarray,
+        perm: Optional[np.ndarray] = None,
+        col_perm: Optional[np.ndarray] = None,
+        tol: float = 1e-8,
+    ):
+        self.lu = lu
+        self.perm = perm
+        self.col_perm = col_perm
+        self.tol = tol
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.lu.shape
+
+    @property
+    def L(self) -> np.ndarray:
+        """np.ndarray: a new unit lower triangular matrix of size n-by-n."""
+        return _unpack(self.lu)[0]
+
+    @property
+    def U(self) -> np.ndarray:
+        """np.ndarray: a new upper triangular matrix of size n-by-n."""
+        return np.triu(self.lu)
+
+    def __iter__(self):
+        return iter(_unpack(self.lu))
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve Ax = b with the stored factors in O(n^2) per right hand side.
+
+        Args:
+            b (np.ndarray): a vector of size n or a matrix of size n-by-k.
+
+        Raises:
+            ValueError: raises if the size of b does not match the factors.
+
+        Returns:
+            np.ndarray: the solution x with the same shape as b.
+        """
+        n = self.lu.shape[0]
+        if b.shape[0] != n:
+            raise ValueError("The size of b does not match the factorization.")
+
+        x = np.array(
+            b if self.perm is None else b[self.perm], dtype=float_dtype(self.lu, b)
+        )
+        x = forward_substitution(self.lu, x, unit_diagonal=True, overwrite_b=True)
+        x = back_substitution(self.lu, x, overwrite_b=True, tol=self.tol)
+        if self.col_perm is not None:
+            x[self.col_perm] = x.copy()
+        return x
+
+
+def _working_copy(
+    A: np.ndarray, overwrite_a: bool, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Return the buffer an in-place kernel should factor.
+
+    A itself is only used if it already has a floating point dtype, any other
+    input is copied to float64 so that the divisions are not truncated.
+    """
+    if out is not None:
+        if out.shape != A.shape:
+            raise ValueError("The shape of out does not match the input.")
+        if out is not A:
+            np.copyto(out, A)
+        return out
+    if overwrite_a and A.dtype == float_dtype(A):
+        return A
+    return np.array(A, dtype=float_dtype(A))
+
+
+def _unpack(LU: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split packed LU factors into L and U without extra temporaries.
+
+    For packed factors of size m-by-n, L is m-by-r and U is r-by-n with
+    r = min(m, n). LU may also be a stack of packed factors.
+    """
+    r = min(LU.shape[-2:])
+    L: np.ndarray = np.tril(LU[..., :r], -1)
+    L[..., np.arange(r), np.arange(r)] = 1.0
+    U: np.ndarray = np.triu(LU[..., :r, :])
+    return (L, U)
 
 
 def gaussian_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -25,18 +141,19 @@ def gaussian_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     if m != n:
         raise ValueError("LU decomposition is only valid for square matrix.")
 
-    L = np.eye(n)
-    I = np.eye(n)
+    U = np.array(A, dtype=float_dtype(A))
+    L = np.eye(n, dtype=U.dtype)
     for k in range(n):
-        if abs(A[k, k]) <= 1e-8:
+        if abs(U[k, k]) <= 1e-8:
             raise ZeroDivisionError("pivot should not be zero")
-        tau = np.zeros((n, 1))
-        tau[k + 1 :, 0] = A[k + 1 :, k] / A[k, k]
-        M = np.eye(n) - tau @ I[:, k : k + 1].T
-        A = M @ A
-        L += tau @ I[:, k : k + 1].T
+        tau = U[k + 1 :, k] / U[k, k]
+        # M_k = I - tau e_k^T only touches rows k+1: of U, apply it as a
+        # rank-1 update instead of forming M_k.
+        U[k + 1 :, k + 1 :] -= np.outer(tau, U[k, k + 1 :])
+        U[k + 1 :, k] = 0.0
+        L[k + 1 :, k] = tau
 
-    return (L, A)
+    return (L, U)
 
 
 def out_product_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -62,20 +179,10 @@ def out_product_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     if m != n:
         raise ValueError("LU decomposition is only valid for square matrix.")
 
-    for i in range(n):
-        pivot = A[i, i]
-        # check if the pivot is non-zero, equivalent to A is invertible.
-        if abs(pivot) <= 1e-8:
-            raise ZeroDivisionError("pivot should not be zero")
-        A[i + 1 :, i : i + 1] = A[i + 1 :, i : i + 1] / pivot
-        A[i + 1 :, i + 1 :] = (
-            A[i + 1 :, i + 1 :] - A[i + 1 :, i : i + 1] @ A[i : i + 1, i + 1 :]
-        )
-
-    L: np.ndarray = np.eye(n) + np.tril(A, -1)
-    U: np.ndarray = np.triu(A)
+    A = _working_copy(A, overwrite_a=True)
+    out_product_kernel(A)
 
-    return (L, U)
+    return _unpack(A)
 
 
 def gaxpy_LU(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -100,21 +207,22 @@ def gaxpy_LU(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     if m != n:
         raise ValueError("LU decomposition is only valid for square matrix.")
 
-    L: np.ndarray = np.eye(n)
-    U: np.ndarray = np.zeros((n, n))
+    dtype = float_dtype(A)
+    L: np.ndarray = np.eye(n, dtype=dtype)
+    U: np.ndarray = np.zeros((n, n), dtype=dtype)
 
-    v: np.ndarray = np.zeros(n)
+    v: np.ndarray = np.zeros(n, dtype=dtype)
     for i in range(n):
         if i == 0:
-            v = A[:, 0:1]
+            v = A[:, 0:1].astype(dtype)
         else:
             a = A[:, i : i + 1]
-            z = np.linalg.solve(L[:i, :i], a[:i])
+            z = forward_substitution(L[:i, :i], a[:i], unit_diagonal=True)
             U[:i, i : i + 1] = z
             v[i:] = a[i:] - L[i:, :i] @ z
 
-        U[i, i] = v[i]
-        L[i + 1 :, i : i + 1] = v[i + 1 :] / v[i]
+        U[i, i] = v[i, 0]
+        L[i + 1 :, i : i + 1] = v[i + 1 :] / v[i, 0]
 
     return (L, U)
 
@@ -134,63 +242,719 @@ def rectangular_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         U (np.ndarray): an square upper triangular matrix  of size r-by-n.
         where r = min(m, n).
     """
+    A = _working_copy(A, overwrite_a=True)
+    out_product_kernel(A)
+
+    return _unpack(A)
+
+
+def out_product_kernel(A: np.ndarray) -> None:
+    """Overwrite the m-by-n matrix A with its packed LU factors (no pivoting).
+
+    The strictly lower part of A[:, :r] holds the multipliers of L and the
+    upper trapezoid holds U, where r = min(m, n). This is the panel kernel of
+    the blocked and out-of-core factorizations, so A must already have a
+    floating point dtype.
+
+    Args:
+        A (np.ndarray): a rectangular matrix of size m-by-n, modified in place.
+
+    Raises:
+        ZeroDivisionError: raises if A[:k, :k] is singular for some 1 <= k <= r
+    """
     m, n = A.shape
+    for i in range(min(m, n)):
+        pivot = A[i, i]
+        # check if the pivot is non-zero, equivalent to A is invertible.
+        if abs(pivot) <= 1e-8:
+            raise ZeroDivisionError("pivot should not be zero")
+        A[i + 1 :, i] /= pivot
+        A[i + 1 :, i + 1 :] -= np.outer(A[i + 1 :, i], A[i, i + 1 :])
 
-    if m == n:
-        return out_product_lu(A)
-    elif m > n:
-        for i in range(n):
-            pivot = A[i, i]
-            # check if the pivot is non-zero, equivalent to A is invertible.
-            if abs(pivot) <= 1e-8:
-                raise ZeroDivisionError("pivot should not be zero")
-            A[i + 1 :, i : i + 1] = A[i + 1 :, i : i + 1] / pivot
-            if i < n:
-                A[i + 1 :, i + 1 :] = (
-                    A[i + 1 :, i + 1 :] - A[i + 1 :, i : i + 1] @ A[i : i + 1, i + 1 :]
-                )
-        L: np.ndarray = np.eye(m)[:, :n] + np.tril(A, -1)
-        U: np.ndarray = np.triu(A)[:n, :]
-    else:  # m < n
-        for i in range(m):
-            pivot = A[i, i]
-            # check if the pivot is non-zero, equivalent to A is invertible.
-            if abs(pivot) <= 1e-8:
-                raise ZeroDivisionError("pivot should not be zero")
-            A[i + 1 :, i : i + 1] = A[i + 1 :, i : i + 1] / pivot
-            A[i + 1 :, i + 1 :] = (
-                A[i + 1 :, i + 1 :] - A[i + 1 :, i : i + 1] @ A[i : i + 1, i + 1 :]
-            )
-
-        L: np.ndarray = np.eye(m) + np.tril(A, -1)[:, :m]
-        U: np.ndarray = np.triu(A)
 
-    return (L, U)
+def _block_update(A: np.ndarray, r: int) -> None:
+    """Update the blocks to the right of and below an already factored panel.
+
+    With A = [[A11, A12], [A21, A22]] where A11 is r-by-r and the panel
+    [A11; A21] already holds its packed LU factors, compute U12 = L11^{-1} A12
+    and the Schur complement A22 - L21 @ U12 in place.
+
+    Args:
+        A (np.ndarray): a matrix whose first r columns are factored.
+        r (int): the width of the factored panel.
+    """
+    A[:r, r:] = forward_substitution(
+        A[:r, :r], A[:r, r:], unit_diagonal=True, overwrite_b=True
+    )
+    A[r:, r:] -= A[r:, :r] @ A[:r, r:]
+
+
+def _recursive_block_kernel(A: np.ndarray, block_size: int) -> None:
+    m, n = A.shape
+    if n <= block_size:
+        out_product_kernel(A)
+        return
+
+    n1 = n // 2
+    _recursive_block_kernel(A[:, :n1], block_size)
+    _block_update(A, n1)
+    _recursive_block_kernel(A[n1:, n1:], block_size)
+
+
+def _non_recursive_block_kernel(A: np.ndarray, block_size: int) -> None:
+    n = A.shape[1]
+    for k in range(0, n, block_size):
+        r = min(block_size, n - k)
+        out_product_kernel(A[k:, k : k + r])
+        if k + r < n:
+            _block_update(A[k:, k:], r)
+
+
+def _parallel_block_kernel(A: np.ndarray, block_size: int, n_workers: int) -> None:
+    """The right-looking block method with the trailing update run in threads.
+
+    The trailing columns are split into tiles of block_size columns and the
+    update of every tile is an independent task. With one step of lookahead
+    the next panel is factored as soon as its own tile is updated, while the
+    other tiles of the current step are still being processed. The tasks
+    spend almost all of their time in matrix products, which release the GIL.
+    """
+    n = A.shape[1]
+    starts = list(range(0, n, block_size))
+    ends = starts[1:] + [n]
+
+    def update(k: int, j: int, previous: Optional[Future]) -> None:
+        # the tile must have received the updates of all earlier panels.
+        if previous is not None:
+            previous.result()
+        k0, k1 = starts[k], ends[k]
+        j0, j1 = starts[j], ends[j]
+        A[k0:k1, j0:j1] = forward_substitution(
+            A[k0:k1, k0:k1], A[k0:k1, j0:j1], unit_diagonal=True, overwrite_b=True
+        )
+        A[k1:, j0:j1] -= A[k1:, k0:k1] @ A[k0:k1, j0:j1]
+
+    pending = [None] * len(starts)
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        out_product_kernel(A[:, starts[0] : ends[0]])
+        for k in range(len(starts)):
+            # tasks are queued in order, so a task only ever waits on a task
+            # which has already been picked up by another worker.
+            for j in range(k + 1, len(starts)):
+                pending[j] = pool.submit(update, k, j, pending[j])
+            if k + 1 < len(starts):
+                pending[k + 1].result()
+                k0, k1 = starts[k + 1], ends[k + 1]
+                out_product_kernel(A[k0:, k0:k1])
+
+
+def recursive_block_lu(
+    A: np.ndarray, block_size: int = 64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Use the recursive block method to compute the LU decomposition of A
+
+    The columns are split in halves: the left half is factored recursively,
+    then U12 and the Schur complement are formed with a triangular solve and
+    a matrix-matrix product before recursing on the trailing block. Panels
+    of at most block_size columns fall back to the out product method.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        block_size (int, optional): the width below which the recursion stops.
+            Defaults to 64.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is not invertible
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: LU decomposition of matrix A
+        L (np.ndarray): an square unit lower triangular matrix  of size n-by-n.
+        U (np.ndarray): an square upper triangular matrix  of size n-by-n.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 3.2.11
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+    if block_size < 1:
+        raise ValueError("block_size should be a positive integer.")
+
+    A = _working_copy(A, overwrite_a=True)
+    _recursive_block_kernel(A, block_size)
+
+    return _unpack(A)
+
+
+def non_recursive_block_lu(
+    A: np.ndarray, block_size: int = 64
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Use the right-looking block method to compute the LU decomposition of A
+
+    Each step factors a panel of block_size columns with the out product
+    method and then applies it to the trailing submatrix with a single
+    matrix-matrix product, so most of the flops are level-3.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        block_size (int, optional): the number of columns in a panel.
+            Defaults to 64.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is not invertible
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: LU decomposition of matrix A
+        L (np.ndarray): an square unit lower triangular matrix  of size n-by-n.
+        U (np.ndarray): an square upper triangular matrix  of size n-by-n.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 3.2.11
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+    if block_size < 1:
+        raise ValueError("block_size should be a positive integer.")
+
+    A = _working_copy(A, overwrite_a=True)
+    _non_recursive_block_kernel(A, block_size)
+
+    return _unpack(A)
+
+
+def parallel_block_lu(
+    A: np.ndarray, block_size: int = 128, n_workers: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Use the block method with a multi-threaded trailing update to compute LU
+
+    The trailing submatrix is updated tile by tile on a thread pool, and the
+    next panel is factored while the rest of the trailing update is running.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        block_size (int, optional): the number of columns in a panel and in
+            a tile of the trailing update. Defaults to 128.
+        n_workers (int, optional): the number of threads.
+            Defaults to the number of CPUs.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is not invertible
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: LU decomposition of matrix A
+        L (np.ndarray): an square unit lower triangular matrix  of size n-by-n.
+        U (np.ndarray): an square upper triangular matrix  of size n-by-n.
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+    if block_size < 1:
+        raise ValueError("block_size should be a positive integer.")
+
+    A = _working_copy(A, overwrite_a=True)
+    _parallel_block_kernel(A, block_size, n_workers or os.cpu_count())
+
+    return _unpack(A)
+
+
+def lu_factor(
+    A: np.ndarray,
+    overwrite_a: bool = False,
+    out: Optional[np.ndarray] = None,
+    block_size: int = 64,
+    n_workers: int = 1,
+    structure: str = "auto",
+) -> Union[LUFactorization, BandedLUFactorization]:
+    """Compute the packed LU decomposition of A without allocating L and U
+
+    The factorization is done in place by the right-looking block method, so
+    the only n-by-n buffer in use is the one holding the result.
+
+    With structure="auto", sparse matrices are factored by sparse_lu, and a
+    dense matrix whose band covers at most a quarter of its columns is
+    factored in band storage in O(n * kl * ku), by the Thomas algorithm if
+    it is tridiagonal. The band paths leave A unchanged, so they are only
+    taken automatically when neither overwrite_a nor out asks for the
+    factors in a dense buffer. Their BandedLUFactorization unpacks into
+    (L, U) and solves like an LUFactorization, without an lu attribute.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n, or a
+            sparse matrix providing tocsr().
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Only honored if A is a floating point array. Defaults to False.
+        out (np.ndarray, optional): a float array of size n-by-n that receives
+            the packed factors. Takes precedence over overwrite_a.
+            Defaults to None.
+        block_size (int, optional): the number of columns in a panel.
+            Defaults to 64.
+        n_workers (int, optional): the number of threads for the trailing
+            update, see parallel_block_lu. Defaults to 1.
+        structure (str, optional): one of "auto", "dense", "banded" or
+            "sparse". Defaults to "auto".
+
+    Raises:
+        ValueError: raises if A is not a square matrix, out has a wrong shape,
+            out or overwrite_a is given with structure="banded" or structure
+            is unknown.
+        ZeroDivisionError: raises if A is not invertible
+
+    Returns:
+        Union[LUFactorization, BandedLUFactorization]: the packed factors,
+            both unpack into (L, U) and provide solve(b).
+    """
+    if structure not in ("auto", "dense", "banded", "sparse"):
+        raise ValueError(f"Unknown matrix structure {structure}.")
+    if structure == "sparse" or (structure == "auto" and hasattr(A, "tocsr")):
+        return sparse_lu(A)
+
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+    if block_size < 1:
+        raise ValueError("block_size should be a positive integer.")
+
+    if structure == "banded" and (out is not None or overwrite_a):
+        raise ValueError("out and overwrite_a need the dense factorization.")
+    if structure == "banded" or (
+        structure == "auto" and out is None and not overwrite_a
+    ):
+        kl, ku = bandwidth(A)
+        if structure == "banded" or 4 * (kl + ku + 1) <= n:
+            if (kl, ku) == (1, 1):
+                diagonals = (np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1))
+                return thomas_lu(*diagonals)
+            return banded_lu(to_banded(A, kl, ku), kl, ku, overwrite_ab=True)
+
+    LU = _working_copy(A, overwrite_a, out)
+    if n_workers > 1:
+        _parallel_block_kernel(LU, block_size, n_workers)
+    else:
+        _non_recursive_block_kernel(LU, block_size)
+
+    return LUFactorization(LU)
+
+
+def partial_pivot_out_product_lu(
+    A: np.ndarray,
+    overwrite_a: bool = False,
+    tol: float = 1e-8,
+    min_pivot: Optional[float] = None,
+) -> LUFactorization:
+    """Use the out product method with partial pivoting to compute PA = LU
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+        tol (float, optional): pivots of magnitude at most tol are treated
+            as zero, also by solve. Defaults to 1e-8.
+        min_pivot (float, optional): floor pivots smaller than min_pivot in
+            magnitude at min_pivot, keeping their phase, instead of raising,
+            see common.pivot.check_pivot. Defaults to None.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular and min_pivot is None
+
+    Returns:
+        LUFactorization: the packed factors and the row permutation perm
+            such that A[perm] = L @ U.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 3.4.1
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    A = _working_copy(A, overwrite_a)
+    perm = np.arange(n)
+    for k in range(n):
+        p = k + np.argmax(np.abs(A[k:, k]))
+        if p != k:
+            A[[k, p]] = A[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        pivot = A[k, k] = check_pivot(A[k, k], tol, min_pivot)
+        A[k + 1 :, k] /= pivot
+        A[k + 1 :, k + 1 :] -= np.outer(A[k + 1 :, k], A[k, k + 1 :])
+
+    # floored pivots are at least min_pivot, none is singular anymore
+    return LUFactorization(A, perm, tol=tol if min_pivot is None else 0.0)
+
+
+def partial_pivot_gaxpy_lu(A: np.ndarray, overwrite_a: bool = False) -> LUFactorization:
+    """Use the gaxpy method with partial pivoting to compute PA = LU
+
+    Column j is updated with the previously computed columns of L before its
+    pivot is chosen, so A is accessed column by column.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular
+
+    Returns:
+        LUFactorization: the packed factors and the row permutation perm
+            such that A[perm] = L @ U.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 3.4.2
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    A = _working_copy(A, overwrite_a)
+    perm = np.arange(n)
+    for j in range(n):
+        # U[:j, j] solves L[:j, :j] z = A[:j, j]
+        A[:j, j] = forward_substitution(
+            A[:j, :j], A[:j, j], unit_diagonal=True, overwrite_b=True
+        )
+        A[j:, j] -= A[j:, :j] @ A[:j, j]
+
+        p = j + np.argmax(np.abs(A[j:, j]))
+        if p != j:
+            A[[j, p]] = A[[p, j]]
+            perm[[j, p]] = perm[[p, j]]
+        pivot = A[j, j]
+        if abs(pivot) <= 1e-8:
+            raise ZeroDivisionError("pivot should not be zero")
+        A[j + 1 :, j] /= pivot
+
+    return LUFactorization(A, perm)
+
+
+def _complete_pivot_search(A: np.ndarray, k: int) -> Tuple[int, int]:
+    """Locate the entry of largest magnitude in A[k:, k:]."""
+    i, j = np.unravel_index(np.argmax(np.abs(A[k:, k:])), A[k:, k:].shape)
+    return (k + i, k + j)
+
+
+def _rook_pivot_search(A: np.ndarray, k: int) -> Tuple[int, int]:
+    """Locate an entry of A[k:, k:] that is largest in its row and column.
+
+    Alternates column and row searches starting from column k; every search
+    is a single vectorized argmax over O(n) entries.
+    """
+    j = k
+    i = k + np.argmax(np.abs(A[k:, j]))
+    while True:
+        q = k + np.argmax(np.abs(A[i, k:]))
+        if abs(A[i, q]) <= abs(A[i, j]):
+            return (i, j)
+        j = q
+        p = k + np.argmax(np.abs(A[k:, j]))
+        if abs(A[p, j]) <= abs(A[i, j]):
+            return (i, j)
+        i = p
+
+
+def _two_sided_pivot_kernel(A: np.ndarray, search) -> Tuple[np.ndarray, np.ndarray]:
+    """Overwrite A with its packed LU factors using row and column pivoting.
+
+    Args:
+        A (np.ndarray): an square matrix of size n-by-n, modified in place.
+        search (Callable): returns the pivot position (p, q) in A[k:, k:]
+            at step k.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the row and column permutations.
+    """
+    n = A.shape[0]
+    perm = np.arange(n)
+    col_perm = np.arange(n)
+    for k in range(n):
+        p, q = search(A, k)
+        # the permutations are recorded as index arrays, only the two rows
+        # and columns involved are exchanged in the buffer.
+        if p != k:
+            A[[k, p]] = A[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        if q != k:
+            A[:, [k, q]] = A[:, [q, k]]
+            col_perm[[k, q]] = col_perm[[q, k]]
+        pivot = A[k, k]
+        if abs(pivot) <= 1e-8:
+            raise ZeroDivisionError("pivot should not be zero")
+        A[k + 1 :, k] /= pivot
+        A[k + 1 :, k + 1 :] -= np.outer(A[k + 1 :, k], A[k, k + 1 :])
+
+    return (perm, col_perm)
+
+
+def complete_pivot_out_product_lu(
+    A: np.ndarray, overwrite_a: bool = False
+) -> LUFactorization:
+    """Use the out product method with complete pivoting to compute PAQ = LU
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular
+
+    Returns:
+        LUFactorization: the packed factors and the permutations perm and
+            col_perm such that A[perm][:, col_perm] = L @ U.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 3.4.3
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    A = _working_copy(A, overwrite_a)
+    perm, col_perm = _two_sided_pivot_kernel(A, _complete_pivot_search)
 
+    return LUFactorization(A, perm, col_perm)
 
-def recursive_block_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
 
+def rook_pivot_out_product_lu(
+    A: np.ndarray, overwrite_a: bool = False
+) -> LUFactorization:
+    """Use the out product method with rook pivoting to compute PAQ = LU
 
-def non_recursive_block_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+    Each pivot is the largest entry in both its row and its column of the
+    trailing submatrix, which is usually found after a few O(n) searches
+    instead of the O(n^2) search of complete pivoting.
 
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular
+
+    Returns:
+        LUFactorization: the packed factors and the permutations perm and
+            col_perm such that A[perm][:, col_perm] = L @ U.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 3.4.7
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    A = _working_copy(A, overwrite_a)
+    perm, col_perm = _two_sided_pivot_kernel(A, _rook_pivot_search)
+
+    return LUFactorization(A, perm, col_perm)
+
+
+def complete_pivot_gaxpy_lu(
+    A: np.ndarray, overwrite_a: bool = False
+) -> LUFactorization:
+    """Use complete pivoting to compute PAQ = LU
 
-def partial_pivot_out_product_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+    Choosing a complete pivot needs every entry of the current Schur
+    complement, so the delayed column updates of the gaxpy method cannot be
+    used and the trailing matrix is updated at every step as in
+    complete_pivot_out_product_lu.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular
+
+    Returns:
+        LUFactorization: the packed factors and the permutations perm and
+            col_perm such that A[perm][:, col_perm] = L @ U.
+    """
+    return complete_pivot_out_product_lu(A, overwrite_a)
 
 
-def partial_pivot_gaxpy_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+def _batched_kernel(A: np.ndarray, perm: Optional[np.ndarray] = None) -> np.ndarray:
+    """Overwrite a stack of matrices with their packed LU factors.
 
+    Every elimination step is vectorized over the batch axis. A matrix whose
+    pivot vanishes is flagged and eliminated with a unit pivot so that the
+    rest of the batch is unaffected.
 
-def complete_pivot_out_product_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+    Args:
+        A (np.ndarray): a stack of square matrices of size batch-by-n-by-n,
+            modified in place.
+        perm (np.ndarray, optional): row permutations of size batch-by-n,
+            partial pivoting is used if given. Defaults to None.
+
+    Returns:
+        np.ndarray: info of size batch, 0 on success or k if the k-th pivot
+            (counting from 1) of that matrix is zero.
+    """
+    batch, n, _ = A.shape
+    index = np.arange(batch)
+    info = np.zeros(batch, dtype=int)
+    for k in range(n):
+        if perm is not None:
+            p = k + np.argmax(np.abs(A[:, k:, k]), axis=1)
+            row = A[index, k].copy()
+            A[index, k] = A[index, p]
+            A[index, p] = row
+            perm[index, k], perm[index, p] = perm[index, p], perm[index, k]
 
+        pivot = A[:, k, k]
+        singular = np.abs(pivot) <= 1e-8
+        info[singular & (info == 0)] = k + 1
+        pivot = np.where(singular, 1.0, pivot)
+        A[:, k + 1 :, k] /= pivot[:, None]
+        A[:, k + 1 :, k + 1 :] -= A[:, k + 1 :, k, None] * A[:, k, None, k + 1 :]
 
-def rook_pivot_out_product_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+    return info
+
+
+def batched_out_product_lu(
+    A: np.ndarray, overwrite_a: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Use the out product method to compute the LU decompositions of a stack
+
+    Args:
+        A (np.ndarray): a stack of square matrices of size batch-by-n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
 
+    Raises:
+        ValueError: raises if A is not a stack of square matrices.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: LU decompositions of A
+        L (np.ndarray): unit lower triangular matrices of size batch-by-n-by-n.
+        U (np.ndarray): upper triangular matrices of size batch-by-n-by-n.
+        info (np.ndarray): 0 if A[i] was factored, k > 0 if its k-th pivot
+            is zero, in which case L[i] and U[i] are meaningless.
+    """
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Batched LU decomposition expects a stack of square matrix.")
+
+    A = _working_copy(A, overwrite_a)
+    info = _batched_kernel(A)
+    L, U = _unpack(A)
+
+    return (L, U, info)
+
+
+def batched_partial_pivot_lu(
+    A: np.ndarray, overwrite_a: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Use the out product method with partial pivoting on a stack of matrices
+
+    Args:
+        A (np.ndarray): a stack of square matrices of size batch-by-n-by-n
+        overwrite_a (bool, optional): factor A in place instead of a copy.
+            Defaults to False.
+
+    Raises:
+        ValueError: raises if A is not a stack of square matrices.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the factors
+            such that A[i][perm[i]] = L[i] @ U[i]
+        L (np.ndarray): unit lower triangular matrices of size batch-by-n-by-n.
+        U (np.ndarray): upper triangular matrices of size batch-by-n-by-n.
+        perm (np.ndarray): row permutations of size batch-by-n.
+        info (np.ndarray): 0 if A[i] was factored, k > 0 if A[i] is singular
+            and its k-th pivot is zero.
+    """
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Batched LU decomposition expects a stack of square matrix.")
+
+    batch, n, _ = A.shape
+    A = _working_copy(A, overwrite_a)
+    perm = np.tile(np.arange(n), (batch, 1))
+    info = _batched_kernel(A, perm)
+    L, U = _unpack(A)
+
+    return (L, U, perm, info)
+
+
+def solve_refined(
+    A: np.ndarray,
+    b: np.ndarray,
+    factor_dtype: np.dtype = np.float32,
+    tol: Optional[float] = None,
+    max_iterations: int = 30,
+) -> Tuple[np.ndarray, int, np.ndarray]:
+    """Solve Ax = b with a low precision LU and iterative refinement
+
+    A is factored once by partial pivoting in factor_dtype, which is where
+    the O(n^3) work happens. The residual r = b - Ax is then computed in the
+    working precision of A and b and the correction is solved with the low
+    precision factors, until the normwise backward error
+    ||r|| / (||A|| ||x|| + ||b||) drops below tol.
+
+    Args:
+        A (np.ndarray): an square invertible matrix of size n-by-n
+        b (np.ndarray): a vector of size n or a matrix of size n-by-k
+        factor_dtype (np.dtype, optional): the dtype of the factorization.
+            Defaults to np.float32.
+        tol (float, optional): the backward error to reach. Defaults to
+            sqrt(n) times the machine epsilon of the working precision.
+        max_iterations (int, optional): maximum refinement steps.
+            Defaults to 30.
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if A is singular in factor_dtype
+
+    Returns:
+        Tuple[np.ndarray, int, np.ndarray]: the solution x in the working
+            precision, the number of refinement steps and the infinity norm
+            of the residual before each step (and after the last one).
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 3.5.3
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
 
-def complete_pivot_gaxpy_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    pass
+    dtype = float_dtype(A, b)
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(dtype).eps
+
+    factor = partial_pivot_out_product_lu(A.astype(factor_dtype))
+    x = factor.solve(b.astype(factor_dtype)).astype(dtype)
+
+    norm_A = np.max(np.sum(np.abs(A), axis=1))
+    norm_b = np.max(np.abs(b))
+    residual_norms = []
+    iterations = 0
+    while True:
+        r = b - A @ x
+        residual_norms.append(np.max(np.abs(r)))
+        if residual_norms[-1] <= tol * (norm_A * np.max(np.abs(x)) + norm_b):
+            break
+        if iterations == max_iterations:
+            break
+        x += factor.solve(r.astype(factor_dtype))
+        iterations += 1
+
+    return (x, iterations, np.array(residual_norms))
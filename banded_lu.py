@@ -0,0 +1,346 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from common.dtype import float_dtype
+from common.pivot import check_pivot
+
+
+class BandedLUFactorization:
+    """LU factors of a band matrix stored LAPACK style in band storage.
+
+    Entry A[i, j] with -kl <= j - i <= ku is stored in ab[ku + i - j, j].
+    Without pivoting L has lower bandwidth kl and U has upper bandwidth ku,
+    so the factors overwrite the band in place. If the matrix was reordered
+    symmetrically the factors satisfy A[perm][:, perm] = L @ U.
+
+    With partial pivoting, rows k and pivots[k] were interchanged at step k,
+    LAPACK style, and U has upper bandwidth ku, which then includes the fill
+    of the interchanges. The factors satisfy A[row_perm] = L @ U.
+
+    Attributes:
+        ab (np.ndarray): the packed factors of size (kl + ku + 1)-by-n.
+        kl (int): the lower bandwidth.
+        ku (int): the upper bandwidth.
+        perm (np.ndarray): the symmetric permutation as an index array,
+            None if the matrix was not reordered.
+        pivots (np.ndarray): the row interchanges, None if no pivoting was done.
+    """
+
+    def __init__(
+        self,
+        ab: np.ndarray,
+        kl: int,
+        ku: int,
+        perm: Optional[np.ndarray] = None,
+        pivots: Optional[np.ndarray] = None,
+    ):
+        self.ab = ab
+        self.kl = kl
+        self.ku = ku
+        self.perm = perm
+        self.pivots = pivots
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        n = self.ab.shape[1]
+        return (n, n)
+
+    @property
+    def row_perm(self) -> Optional[np.ndarray]:
+        """np.ndarray: the row permutation of the pivoting, None without pivoting."""
+        if self.pivots is None:
+            return None
+        perm = np.arange(self.ab.shape[1])
+        for k, p in enumerate(self.pivots):
+            perm[[k, p]] = perm[[p, k]]
+        return perm
+
+    @property
+    def L(self) -> np.ndarray:
+        """np.ndarray: a new dense unit lower triangular matrix of size n-by-n."""
+        n = self.ab.shape[1]
+        if self.pivots is None:
+            L = np.eye(n, dtype=self.ab.dtype)
+            for s in range(1, self.kl + 1):
+                L += np.diag(self.ab[self.ku + s, : n - s], -s)
+            return L
+
+        # the multipliers are stored before the later interchanges of their rows
+        L = np.zeros((n, n), dtype=self.ab.dtype)
+        for k, p in enumerate(self.pivots):
+            L[[k, p], :k] = L[[p, k], :k]
+            q = min(self.kl, n - 1 - k)
+            L[k + 1 : k + 1 + q, k] = self.ab[self.ku + 1 : self.ku + 1 + q, k]
+        return L + np.eye(n, dtype=self.ab.dtype)
+
+    @property
+    def U(self) -> np.ndarray:
+        """np.ndarray: a new dense upper triangular matrix of size n-by-n."""
+        n = self.ab.shape[1]
+        U = np.zeros((n, n), dtype=self.ab.dtype)
+        for t in range(self.ku + 1):
+            U += np.diag(self.ab[self.ku - t, t:], t)
+        return U
+
+    def __iter__(self):
+        return iter((self.L, self.U))
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        """Solve Ax = b with the stored factors in O(n(kl + ku)) per right hand side.
+
+        Args:
+            b (np.ndarray): a vector of size n or a matrix of size n-by-k.
+
+        Raises:
+            ValueError: raises if the size of b does not match the factors.
+
+        Returns:
+            np.ndarray: the solution x with the same shape as b.
+        """
+        ab, kl, ku = self.ab, self.kl, self.ku
+        n = ab.shape[1]
+        if b.shape[0] != n:
+            raise ValueError("The size of b does not match the factorization.")
+
+        x = np.array(b if self.perm is None else b[self.perm], dtype=float_dtype(ab, b))
+        if kl == ku == 1 and self.pivots is None:
+            _bidiagonal_solves(ab, x)
+            if self.perm is not None:
+                x[self.perm] = x.copy()
+            return x
+
+        # column oriented, the multipliers of column k are ab[ku + 1 :, k]
+        for k in range(n - 1):
+            if self.pivots is not None and self.pivots[k] != k:
+                x[[k, self.pivots[k]]] = x[[self.pivots[k], k]]
+            p = min(kl, n - 1 - k)
+            x[k + 1 : k + 1 + p] -= np.multiply.outer(ab[ku + 1 : ku + 1 + p, k], x[k])
+        # U[k - q : k, k] is stored in ab[ku - q : ku, k]
+        for k in range(n - 1, -1, -1):
+            x[k] /= ab[ku, k]
+            q = min(ku, k)
+            x[k - q : k] -= np.multiply.outer(ab[ku - q : ku, k], x[k])
+
+        if self.perm is not None:
+            x[self.perm] = x.copy()
+        return x
+
+
+def _bidiagonal_solves(ab: np.ndarray, x: np.ndarray) -> None:
+    """Solve LUx = b in place with tridiagonal factors, as the Thomas algorithm."""
+    # plain lists, indexing numpy scalars one by one is several times slower
+    upper, diagonal, lower = ab.tolist()
+    rows = list(x)
+    n = len(rows)
+    for k in range(1, n):
+        rows[k] = rows[k] - lower[k - 1] * rows[k - 1]
+    rows[n - 1] = rows[n - 1] / diagonal[n - 1]
+    for k in range(n - 2, -1, -1):
+        rows[k] = (rows[k] - upper[k + 1] * rows[k + 1]) / diagonal[k]
+    x[:] = rows
+
+
+def bandwidth(A: np.ndarray, chunk_size: int = 1024) -> Tuple[int, int]:
+    """Compute the lower and upper bandwidth of a dense matrix
+
+    Rows are scanned in chunks, so the temporary storage is O(chunk_size * n).
+
+    Args:
+        A (np.ndarray): a matrix of size m-by-n
+        chunk_size (int, optional): the number of rows scanned at once.
+            Defaults to 1024.
+
+    Returns:
+        Tuple[int, int]: (kl, ku) such that A[i, j] == 0 whenever
+            j - i < -kl or j - i > ku.
+    """
+    m, n = A.shape
+    kl, ku = 0, 0
+    for start in range(0, m, chunk_size):
+        mask = A[start : start + chunk_size] != 0
+        rows = np.nonzero(mask.any(axis=1))[0]
+        if rows.size == 0:
+            continue
+        first = np.argmax(mask[rows], axis=1)
+        last = n - 1 - np.argmax(mask[rows, ::-1], axis=1)
+        rows = rows + start
+        kl = max(kl, int(np.max(rows - first)))
+        ku = max(ku, int(np.max(last - rows)))
+    return (kl, ku)
+
+
+def to_banded(A: np.ndarray, kl: int, ku: int) -> np.ndarray:
+    """Copy the band of a dense square matrix into band storage
+
+    Args:
+        A (np.ndarray): an square matrix of size n-by-n
+        kl (int): the lower bandwidth.
+        ku (int): the upper bandwidth.
+
+    Returns:
+        np.ndarray: ab of size (kl + ku + 1)-by-n with ab[ku + i - j, j] = A[i, j].
+    """
+    n = A.shape[0]
+    ab = np.zeros((kl + ku + 1, n), dtype=float_dtype(A))
+    for d in range(-kl, ku + 1):
+        # the d-th diagonal holds A[i, i + d]
+        if d >= 0:
+            ab[ku - d, d:] = np.diagonal(A, d)
+        else:
+            ab[ku - d, : n + d] = np.diagonal(A, d)
+    return ab
+
+
+def banded_lu(
+    ab: np.ndarray,
+    kl: int,
+    ku: int,
+    overwrite_ab: bool = False,
+    pivoting: bool = False,
+    tol: float = 1e-8,
+    min_pivot: Optional[float] = None,
+) -> BandedLUFactorization:
+    """Use band gaussian elimination to compute the LU decomposition of A
+
+    Every step only touches the kl-by-ku window below and to the right of the
+    pivot, so the cost is O(n * kl * ku) instead of O(n^3).
+
+    With partial pivoting the largest of the kl + 1 candidates in the column
+    becomes the pivot. The interchanges let U fill in up to kl more
+    superdiagonals, so the factors are returned in a new band storage with
+    upper bandwidth kl + ku and the cost is O(n * kl * (kl + ku)).
+
+    Args:
+        ab (np.ndarray): the band storage of A of size (kl + ku + 1)-by-n,
+            see to_banded.
+        kl (int): the lower bandwidth.
+        ku (int): the upper bandwidth.
+        overwrite_ab (bool, optional): factor ab in place instead of a copy.
+            Ignored with pivoting. Defaults to False.
+        pivoting (bool, optional): use partial pivoting. Defaults to False.
+        tol (float, optional): pivots of magnitude at most tol are treated
+            as zero. Defaults to 1e-8.
+        min_pivot (float, optional): floor pivots smaller than min_pivot in
+            magnitude at min_pivot, keeping their phase, instead of raising,
+            see common.pivot.check_pivot. Defaults to None.
+
+    Raises:
+        ValueError: raises if the shape of ab does not match the bandwidth.
+        ZeroDivisionError: raises if a pivot is zero and min_pivot is None,
+            without pivoting if a leading principal submatrix of A is singular
+
+    Returns:
+        BandedLUFactorization: the factors in band storage.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 4.3.1 and Section 4.3.5
+    """
+    if ab.ndim != 2 or ab.shape[0] != kl + ku + 1:
+        raise ValueError("The band storage does not match the bandwidth.")
+
+    n = ab.shape[1]
+    pivots = None
+    if pivoting:
+        # kl extra rows on top receive the fill of U
+        work = np.zeros((2 * kl + ku + 1, n), dtype=float_dtype(ab))
+        work[kl:] = ab
+        ab, ku = work, kl + ku
+        pivots = np.arange(n)
+    elif not (overwrite_ab and ab.dtype == float_dtype(ab)):
+        ab = np.array(ab, dtype=float_dtype(ab))
+
+    # A[k + 1 + s, k + 1 + t] is stored in ab[ku + s - t, k + 1 + t]
+    s = np.arange(kl)[:, None]
+    t = np.arange(ku)[None, :]
+    for k in range(n):
+        p = min(kl, n - 1 - k)
+        q = min(ku, n - 1 - k)
+        if pivoting:
+            r = int(np.argmax(np.abs(ab[ku : ku + 1 + p, k])))
+            if r > 0:
+                # rows k and k + r, in the columns k to k + q
+                columns = np.arange(k, k + q + 1)
+                rows = ku + k - columns
+                ab[[rows, rows + r], columns] = ab[[rows + r, rows], columns]
+                pivots[k] = k + r
+        pivot = ab[ku, k] = check_pivot(ab[ku, k], tol, min_pivot)
+        if p == 0:
+            continue
+        ab[ku + 1 : ku + 1 + p, k] /= pivot
+        if q == 0:
+            continue
+        l = ab[ku + 1 : ku + 1 + p, k]
+        u = ab[ku - 1 - t[0, :q], k + 1 + t[0, :q]]
+        ab[ku + s[:p] - t[:, :q], k + 1 + t[:, :q]] -= np.outer(l, u)
+
+    return BandedLUFactorization(ab, kl, ku, pivots=pivots)
+
+
+def thomas_lu(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> BandedLUFactorization:
+    """Factor a tridiagonal matrix with the Thomas algorithm in O(n)
+
+    Without pivoting the factors of a tridiagonal matrix are bidiagonal:
+    l_i = a_{i-1} / u_{i-1} and u_i = b_i - l_i c_{i-1}, while U keeps the
+    super-diagonal c.
+
+    Args:
+        a (np.ndarray): the sub-diagonal of size n - 1.
+        b (np.ndarray): the diagonal of size n.
+        c (np.ndarray): the super-diagonal of size n - 1.
+
+    Raises:
+        ValueError: raises if the sizes of the diagonals do not match.
+        ZeroDivisionError: raises if a pivot is zero, the algorithm does
+            not pivot.
+
+    Returns:
+        BandedLUFactorization: the factors in band storage with kl = ku = 1.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 6.7
+    """
+    n = b.size
+    if a.size != n - 1 or c.size != n - 1:
+        raise ValueError("The sizes of the diagonals do not match.")
+
+    ab = np.zeros((3, n), dtype=float_dtype(a, b, c))
+    ab[0, 1:] = c
+    ab[1] = b
+    ab[2, :-1] = a
+    for i in range(n):
+        if i > 0:
+            ab[2, i - 1] /= ab[1, i - 1]
+            ab[1, i] -= ab[2, i - 1] * c[i - 1]
+        check_pivot(ab[1, i])
+    return BandedLUFactorization(ab, 1, 1)
+
+
+def thomas_algorithm(
+    a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray
+) -> np.ndarray:
+    """Solve a tridiagonal system with the Thomas algorithm in O(n)
+
+    Args:
+        a (np.ndarray): the sub-diagonal of size n - 1.
+        b (np.ndarray): the diagonal of size n.
+        c (np.ndarray): the super-diagonal of size n - 1.
+        d (np.ndarray): the right hand side, a vector of size n or a matrix
+            of size n-by-k.
+
+    Raises:
+        ValueError: raises if the sizes of the diagonals do not match.
+        ZeroDivisionError: raises if a pivot is zero, the algorithm does
+            not pivot.
+
+    Returns:
+        np.ndarray: the solution x with the same shape as d.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 6.7
+    """
+    if d.shape[0] != b.size:
+        raise ValueError("The sizes of the diagonals do not match.")
+    return thomas_lu(a, b, c).solve(d)
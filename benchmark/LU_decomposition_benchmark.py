@@ -0,0 +1,130 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from common.rng import spawn
+from LU_decomposition import out_product_lu, gaxpy_LU
+from LU_decomposition import recursive_block_lu, non_recursive_block_lu
+from LU_decomposition import partial_pivot_out_product_lu
+from LU_decomposition import complete_pivot_out_product_lu, rook_pivot_out_product_lu
+from LU_decomposition import batched_partial_pivot_lu, parallel_block_lu
+from LU_decomposition import solve_refined
+
+
+def random_matrix(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Generate a diagonally dominant matrix so that no pivoting is needed."""
+    return rng.random((n, n)) + n * np.eye(n)
+
+
+def timeit(lu: Callable, A: np.ndarray, repeat: int = 3) -> float:
+    """Return the best wall time of lu(A.copy()) over several runs in seconds."""
+    best = np.inf
+    for _ in range(repeat):
+        B = A.copy()
+        start = time.perf_counter()
+        lu(B)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_block_lu(sizes=(256, 512, 1024, 2048), block_sizes=(32, 64, 128), seed=0):
+    print(f"{'n':>6} {'method':>24} {'block':>6} {'time (s)':>10} {'GFlop/s':>8}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = random_matrix(n, rng)
+        flops = 2 * n**3 / 3
+
+        results = [("out_product_lu", "-", timeit(out_product_lu, A))]
+        # gaxpy_LU is far slower than the others, keep it to small sizes.
+        if n <= 512:
+            results.append(("gaxpy_LU", "-", timeit(gaxpy_LU, A, repeat=1)))
+        for r in block_sizes:
+            results.append(
+                (
+                    "non_recursive_block_lu",
+                    r,
+                    timeit(lambda B: non_recursive_block_lu(B, block_size=r), A),
+                )
+            )
+            results.append(
+                (
+                    "recursive_block_lu",
+                    r,
+                    timeit(lambda B: recursive_block_lu(B, block_size=r), A),
+                )
+            )
+
+        for name, r, t in results:
+            print(f"{n:>6} {name:>24} {r:>6} {t:>10.4f} {flops / t / 1e9:>8.2f}")
+
+
+def benchmark_pivoting(sizes=(128, 256, 512, 1024), seed=0):
+    methods = [
+        ("partial", partial_pivot_out_product_lu),
+        ("rook", rook_pivot_out_product_lu),
+        ("complete", complete_pivot_out_product_lu),
+    ]
+    print(f"{'n':>6} {'pivoting':>10} {'time (s)':>10} {'vs partial':>10}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = rng.standard_normal((n, n))
+        base = timeit(partial_pivot_out_product_lu, A)
+        for name, lu in methods:
+            t = timeit(lu, A)
+            print(f"{n:>6} {name:>10} {t:>10.4f} {t / base:>10.2f}")
+
+
+def benchmark_batched(batch=10000, sizes=(4, 16, 64), seed=0):
+    print(f"{'batch':>6} {'n':>4} {'loop (s)':>10} {'batched (s)':>12} {'speedup':>8}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = rng.standard_normal((batch, n, n))
+        t_loop = timeit(
+            lambda B: [partial_pivot_out_product_lu(B[i]) for i in range(batch)],
+            A,
+            repeat=1,
+        )
+        t_batched = timeit(batched_partial_pivot_lu, A)
+        print(
+            f"{batch:>6} {n:>4} {t_loop:>10.4f} {t_batched:>12.4f} "
+            f"{t_loop / t_batched:>8.1f}"
+        )
+
+
+# Run with the BLAS thread count limited (e.g. OMP_NUM_THREADS=1), otherwise
+# the serial baseline already uses several cores inside each matrix product.
+def benchmark_parallel(
+    sizes=(2048, 4096), n_workers=(1, 2, 4, 8, 16), block_size=256, seed=0
+):
+    print(f"{'n':>6} {'workers':>8} {'time (s)':>10} {'speedup':>8}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = random_matrix(n, rng)
+        serial = timeit(lambda B: non_recursive_block_lu(B, block_size), A, repeat=1)
+        print(f"{n:>6} {'serial':>8} {serial:>10.4f} {1.0:>8.2f}")
+        for w in n_workers:
+            t = timeit(lambda B: parallel_block_lu(B, block_size, w), A, repeat=1)
+            print(f"{n:>6} {w:>8} {t:>10.4f} {serial / t:>8.2f}")
+
+
+def benchmark_mixed_precision(sizes=(256, 512, 1024), seed=0):
+    print(
+        f"{'n':>6} {'float64 (s)':>12} {'refined (s)':>12} {'steps':>6} {'error':>10}"
+    )
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = rng.standard_normal((n, n))
+        x = rng.standard_normal(n)
+        b = A @ x
+        t_double = timeit(lambda B: partial_pivot_out_product_lu(B).solve(b), A)
+        t_refined = timeit(lambda B: solve_refined(B, b), A)
+        test_x, iterations, _ = solve_refined(A, b)
+        error = np.max(np.abs(test_x - x))
+        print(
+            f"{n:>6} {t_double:>12.4f} {t_refined:>12.4f} {iterations:>6} "
+            f"{error:>10.2e}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_block_lu()
+    benchmark_pivoting()
+    benchmark_batched()
+    benchmark_parallel()
+    benchmark_mixed_precision()
@@ -0,0 +1,38 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from root_finding.single_variable.horner import horner_evaluate, horner_method
+
+
+def best_time(f: Callable, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_horner(degrees=(5, 50), m=10**6, scalar_points=10**4, seed=0):
+    """Evaluate P and P' at m points, the scalar loop is timed on fewer points."""
+    print(f"{'degree':>7} {'m':>8} {'scalar loop (s)':>16} {'vectorized (s)':>15}")
+    rng = np.random.default_rng(seed)
+    x = np.linspace(-1.0, 1.0, m)
+    for degree in degrees:
+        coeff_P = rng.standard_normal(degree + 1)
+        t_scalar = best_time(
+            lambda: [horner_method(coeff_P, x0) for x0 in x[:scalar_points]],
+            repeat=1,
+        )
+        t_vectorized = best_time(lambda: horner_evaluate(coeff_P, x))
+        # extrapolate the scalar loop to all m points
+        print(
+            f"{degree:>7} {m:>8} {t_scalar * m / scalar_points:>16.2f} "
+            f"{t_vectorized:>15.4f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_horner()
@@ -0,0 +1,100 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from interpolation.barycentric import BarycentricInterpolator
+from interpolation.chebyshev import ChebyshevInterpolant, chebyshev_points
+from interpolation.lagrangian import lagrangian_interpolation
+from interpolation.newton import NewtonInterpolant
+
+
+def best_time(f: Callable, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def lagrangian_double_loop(data: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """The former O(n^2 m) lagrangian_interpolation, kept as the baseline."""
+    result = np.zeros_like(x)
+    n = data.shape[0]
+    for i in range(n):
+        numerator, dominator = 1.0, 1.0
+        for j in range(n):
+            if j == i:
+                continue
+            numerator = numerator * (x - data[j, 0])
+            dominator = dominator * (data[i, 0] - data[j, 0])
+        result = result + data[i, 1] * numerator / dominator
+    return result
+
+
+def benchmark_barycentric(sizes=(10, 50, 200), points=(10**4, 10**6)):
+    print(f"{'n':>5} {'m':>9} {'double loop':>12} {'weights':>9} {'evaluate':>9}")
+    for n in sizes:
+        nodes = np.cos(np.pi * np.arange(n) / (n - 1))
+        data = np.column_stack([nodes, np.exp(nodes)])
+        t_weights = best_time(lambda: BarycentricInterpolator(nodes, data[:, 1]))
+        P = BarycentricInterpolator(nodes, data[:, 1])
+        for m in points:
+            x = np.linspace(-1.0, 1.0, m)
+            t_loop = best_time(lambda: lagrangian_double_loop(data, x), repeat=1)
+            t_evaluate = best_time(lambda: P(x))
+            print(f"{n:>5} {m:>9} {t_loop:>12.4f} {t_weights:>9.5f} {t_evaluate:>9.4f}")
+
+
+def benchmark_chebyshev(sizes=(100, 1000, 10000), m=10**5):
+    """Chebyshev coefficients by FFT and Clenshaw evaluation at m points."""
+    print(
+        f"{'n':>6} {'coefficients':>13} {'clenshaw':>9} {'barycentric':>12} {'error':>9}"
+    )
+    f = lambda x: 1.0 / (1.0 + 25.0 * x**2)
+    x = np.linspace(-1.0, 1.0, m)
+    for n in sizes:
+        values = f(chebyshev_points(n))
+        t_coefficients = best_time(lambda: ChebyshevInterpolant(values))
+        p = ChebyshevInterpolant(values)
+        t_clenshaw = best_time(lambda: p(x))
+        P = BarycentricInterpolator(chebyshev_points(n), values)
+        t_barycentric = best_time(lambda: P(x), repeat=1)
+        error = np.max(np.abs(p(x) - f(x)))
+        print(
+            f"{n:>6} {t_coefficients:>13.5f} {t_clenshaw:>9.4f} "
+            f"{t_barycentric:>12.4f} {error:>9.1e}"
+        )
+
+
+def benchmark_streaming(windows=(8, 32), steps=2000, m=100):
+    """Interpolate the last `window` samples of a stream after every sample."""
+    print(f"{'window':>7} {'rebuild (s)':>12} {'newton (s)':>11}")
+    nodes = np.linspace(0.0, 1.0, steps)
+    values = np.sin(20 * nodes)
+    for window in windows:
+
+        def rebuild():
+            for i in range(window, steps):
+                data = np.column_stack([nodes[i - window : i], values[i - window : i]])
+                lagrangian_interpolation(
+                    data, np.linspace(nodes[i - window], nodes[i - 1], m)
+                )
+
+        def stream():
+            P = NewtonInterpolant(max_nodes=window)
+            for i in range(steps):
+                P.append(nodes[i], values[i])
+                if i + 1 >= window:
+                    P(np.linspace(nodes[i + 1 - window], nodes[i], m))
+
+        t_rebuild = best_time(rebuild, repeat=1)
+        t_stream = best_time(stream, repeat=1)
+        print(f"{window:>7} {t_rebuild:>12.4f} {t_stream:>11.4f}")
+
+
+if __name__ == "__main__":
+    benchmark_barycentric()
+    benchmark_chebyshev()
+    benchmark_streaming()
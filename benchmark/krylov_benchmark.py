@@ -0,0 +1,56 @@
+import numpy as np
+
+from common.linear_operator import LinearOperator
+from common.rng import spawn
+from krylov import lanczos
+from power_iteration import orthogonal_iteration
+
+
+def counting_operator(A: np.ndarray):
+    """Wrap A so that every matrix-vector product is counted."""
+    count = [0]
+
+    def matvec(x):
+        count[0] += 1
+        return A @ x
+
+    def matmat(X):
+        count[0] += X.shape[1]
+        return A @ X
+
+    return LinearOperator(A.shape, matvec, matmat), count
+
+
+def ritz_residuals(A: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    theta, Y = np.linalg.eigh(Q.T @ A @ Q)
+    X = Q @ Y
+    return np.linalg.norm(A @ X - X * theta, axis=0)
+
+
+def benchmark_top_k(
+    sizes=(500, 2000), ks=(5, 10), tol=1e-8, max_matvecs=200000, seed=0
+):
+    """Count the matrix-vector products needed for the top-k eigenpairs."""
+    print(f"{'n':>6} {'k':>4} {'lanczos':>10} {'orthogonal iteration':>21}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        Q, _ = np.linalg.qr(rng.standard_normal((n, n)))
+        # a slowly decaying spectrum, |lambda_{k+1} / lambda_k| is close to 1
+        A = Q @ np.diag(1.0 / np.arange(1.0, n + 1.0) ** 0.5) @ Q.T
+        for k in ks:
+            operator, count = counting_operator(A)
+            _, _, residuals = lanczos(operator, k=k, tol=tol, rng=rng)
+            n_lanczos = count[0]
+
+            operator, count = counting_operator(A)
+            V = rng.standard_normal((n, k))
+            # resume orthogonal iteration until it reaches the same accuracy
+            while count[0] < max_matvecs:
+                V, _ = orthogonal_iteration(operator, k=k, max_iterations=10, V=V)
+                if np.all(ritz_residuals(A, V) <= np.max(residuals)):
+                    break
+            n_orthogonal = count[0] if count[0] < max_matvecs else f">{max_matvecs}"
+            print(f"{n:>6} {k:>4} {n_lanczos:>10} {n_orthogonal:>21}")
+
+
+if __name__ == "__main__":
+    benchmark_top_k()
@@ -0,0 +1,72 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from root_finding.single_variable.horner import horner, horner_evaluate, horner_method
+from root_finding.single_variable.polynomial import polynomial_roots
+
+
+def best_time(f: Callable, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def newton_horner_deflation(
+    coeff_P: np.ndarray, tol: float = 1e-14, max_iterations: int = 100
+) -> np.ndarray:
+    """The chained approach: Newton's method with horner_method, then deflate by horner."""
+    coeff_Q = coeff_P.astype(complex)
+    roots = []
+    start = 0.5 + 0.5j
+    while coeff_Q.size > 1:
+        x = start
+        for _ in range(max_iterations):
+            P_x, dP_x = horner_method(coeff_Q, x)
+            step = P_x / dP_x if dP_x != 0 else 1e-8
+            x -= step
+            if not np.isfinite(x):
+                # Newton overshot far outside the roots, start elsewhere
+                start *= np.exp(1j)
+                x = start
+            elif abs(step) <= tol * abs(x):
+                break
+        roots.append(x)
+        coeff_Q = horner(coeff_Q, x)
+    return np.array(roots)
+
+
+def backward_error(coeff_P: np.ndarray, roots: np.ndarray) -> float:
+    """max |P(z)| / sum |a_i| |z|^i over the roots, evaluated as P(z) / z^n outside the unit disk."""
+    inside = np.abs(roots) <= 1
+    z = np.where(inside, roots, 1 / roots)
+    coeff = np.where(inside[:, None], coeff_P, coeff_P[::-1])
+    P = horner_evaluate(coeff, z, 0)[0]
+    scale = horner_evaluate(np.abs(coeff), np.abs(z), 0)[0]
+    return np.max(np.abs(P) / scale)
+
+
+def benchmark_polynomial_roots(degrees=(10, 30, 100, 300, 1000), seed=0):
+    print(
+        f"{'degree':>7} {'deflation (s)':>14} {'error':>9} "
+        f"{'aberth (s)':>11} {'error':>9}"
+    )
+    rng = np.random.default_rng(seed)
+    for n in degrees:
+        coeff_P = rng.standard_normal(n + 1)
+        t_deflation = best_time(lambda: newton_horner_deflation(coeff_P), repeat=1)
+        e_deflation = backward_error(coeff_P, newton_horner_deflation(coeff_P))
+        t_aberth = best_time(lambda: polynomial_roots(coeff_P))
+        e_aberth = backward_error(coeff_P, polynomial_roots(coeff_P))
+        print(
+            f"{n:>7} {t_deflation:>14.4f} {e_deflation:>9.1e} "
+            f"{t_aberth:>11.4f} {e_aberth:>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_polynomial_roots()
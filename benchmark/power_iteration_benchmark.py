@@ -0,0 +1,107 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from banded_lu import banded_lu
+from common.rng import spawn
+from hessenberg import hessenberg_lu, hessenberg_reduction
+from LU_decomposition import partial_pivot_out_product_lu
+from power_iteration import rayleigh_quotient_iteration
+from power_iteration import batched_power_iteration, power_iteration
+
+
+def best_time(f: Callable, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_eigenproblems(n: int, rng: np.random.Generator):
+    """Yield symmetric and nonsymmetric matrices with eigenvalues 1, ..., n."""
+    Q, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    X = Q + 0.1 * rng.standard_normal((n, n))
+    eig_values = np.arange(1.0, n + 1.0)
+    yield "symmetric", Q @ np.diag(eig_values) @ Q.T, Q[:, n // 2]
+    yield "nonsymmetric", X @ np.diag(eig_values) @ np.linalg.inv(X), X[:, n // 2]
+
+
+def reduced_step(H: np.ndarray, shift: float, symmetric: bool, v: np.ndarray):
+    """Factor the shifted Hessenberg, or tridiagonal if symmetric, H and solve."""
+    if symmetric:
+        ab = np.zeros((3, H.shape[0]))
+        ab[0, 1:] = np.diagonal(H, 1)
+        ab[1] = np.diagonal(H) - shift
+        ab[2, :-1] = np.diagonal(H, -1)
+        return banded_lu(ab, 1, 1, pivoting=True).solve(v)
+    return hessenberg_lu(H - shift * np.eye(H.shape[0])).solve(v)
+
+
+def benchmark_rayleigh_quotient_step(sizes=(100, 200, 400, 800), seed=0):
+    """Compare the cost of one iteration with the former explicit inverse.
+
+    The reduction to Hessenberg form is paid once per solve, every iteration
+    then factors the shifted Hessenberg (O(n^2)) or tridiagonal (O(n)) matrix.
+    """
+    print(
+        f"{'n':>6} {'matrix':>14} {'inverse step':>13} {'lu step':>9} "
+        f"{'reduction':>10} {'reduced step':>13}"
+    )
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        for name, A, _ in random_eigenproblems(n, rng):
+            v = rng.standard_normal(n)
+            shift = 0.5 + n // 2
+            t_inverse = best_time(lambda: np.linalg.inv(A - shift * np.eye(n)) @ v)
+            t_lu = best_time(
+                lambda: partial_pivot_out_product_lu(A - shift * np.eye(n)).solve(v)
+            )
+            t_reduction = best_time(lambda: hessenberg_reduction(A), repeat=1)
+            H, _ = hessenberg_reduction(A)
+            t_step = best_time(lambda: reduced_step(H, shift, name == "symmetric", v))
+            print(
+                f"{n:>6} {name:>14} {t_inverse:>13.5f} {t_lu:>9.5f} "
+                f"{t_reduction:>10.5f} {t_step:>13.5f}"
+            )
+
+
+def benchmark_rayleigh_quotient(sizes=(100, 200, 400, 800), seed=0):
+    """Time full solves to the default tolerance."""
+    print(f"{'n':>6} {'matrix':>14} {'method':>22} {'time (s)':>10}")
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        for name, A, eigenvector in random_eigenproblems(n, rng):
+            v = eigenvector + 0.01 * rng.standard_normal(n)
+            for method, kwargs in [
+                ("lu", {"hessenberg": False}),
+                ("hessenberg", {}),
+                ("hessenberg, frozen x3", {"shift_update_interval": 3}),
+            ]:
+                t = best_time(
+                    lambda: rayleigh_quotient_iteration(A, v=v.copy(), **kwargs)
+                )
+                print(f"{n:>6} {name:>14} {method:>22} {t:>10.4f}")
+
+
+def benchmark_batched(batches=(100, 1000, 10000), n=8, seed=0):
+    """Compare batched_power_iteration with a loop of power_iteration calls."""
+    print(f"{'batch':>6} {'n':>4} {'loop (s)':>10} {'batched (s)':>12}")
+    for batch, rng in zip(batches, spawn(seed, len(batches))):
+        X = rng.standard_normal((batch, n, n))
+        eig_values = rng.random((batch, n))
+        eig_values[:, 0] = 1.0 + rng.random(batch)
+        A = X @ (eig_values[..., None] * np.linalg.inv(X))
+        v = rng.random((batch, n))
+        t_loop = best_time(
+            lambda: [power_iteration(A[i], 1000, v[i]) for i in range(batch)],
+            repeat=1,
+        )
+        t_batched = best_time(lambda: batched_power_iteration(A, 1000, v))
+        print(f"{batch:>6} {n:>4} {t_loop:>10.4f} {t_batched:>12.4f}")
+
+
+if __name__ == "__main__":
+    benchmark_rayleigh_quotient_step()
+    benchmark_rayleigh_quotient()
+    benchmark_batched()
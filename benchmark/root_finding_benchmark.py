@@ -0,0 +1,88 @@
+import math
+import time
+from typing import Callable
+
+import numpy as np
+
+from common.evaluation import CountingFunction
+from root_finding.single_variable import vectorized
+from root_finding.single_variable.bisection import bisection
+from root_finding.single_variable.muller import muller_method
+from root_finding.single_variable.newton import (
+    false_position,
+    newton_method,
+    secant_method,
+)
+
+
+def best_time(f: Callable, repeat: int = 3) -> float:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_newton(m=10**6, scalar_equations=10**4, seed=0):
+    """Solve cos(x) = c x for m values of c, the scalar loop is timed on fewer equations."""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(0.5, 2.0, m)
+    f = lambda x, c: np.cos(x) - c * x
+    df = lambda x, c: -np.sin(x) - c
+
+    t_scalar = best_time(
+        lambda: [
+            newton_method(
+                lambda x: math.cos(x) - ci * x,
+                lambda x: -math.sin(x) - ci,
+                0.5,
+                tol=1e-10,
+            )
+            for ci in c[:scalar_equations]
+        ],
+        repeat=1,
+    )
+    t_vectorized = best_time(
+        lambda: vectorized.newton_method(f, df, 0.5, tol=1e-10, args=(c,))
+    )
+    _, iterations, status = vectorized.newton_method(f, df, 0.5, tol=1e-10, args=(c,))
+    assert np.all(status == vectorized.CONVERGED)
+
+    # extrapolate the scalar loop to all m equations
+    print(
+        f"{'m':>8} {'scalar loop (s)':>16} {'vectorized (s)':>15} {'max iterations':>15}"
+    )
+    print(
+        f"{m:>8} {t_scalar * m / scalar_equations:>16.2f} "
+        f"{t_vectorized:>15.4f} {iterations.max():>15}"
+    )
+
+
+def benchmark_evaluations():
+    """Count the calls of f, every method must evaluate each point exactly once."""
+    g = lambda x: math.cos(x) - x
+    dg = lambda x: -math.sin(x) - 1
+    # method and its expected number of calls of f for cos(x) = x
+    methods = {
+        "bisection": (lambda f: bisection(f, 0.0, math.pi / 2, 1e-10), 34),
+        "newton": (lambda f: newton_method(f, CountingFunction(dg), 0.5, 1e-10), 5),
+        "secant": (lambda f: secant_method(f, 0.5, math.pi / 4, 1e-10), 6),
+        "false position": (
+            lambda f: false_position(f, 0.5, math.pi / 4, 1e-10),
+            7,
+        ),
+        "muller": (lambda f: muller_method(f, 0.5, 0.6, math.pi / 4, 1e-10), 6),
+    }
+    print(f"{'method':>15} {'calls':>6} {'repeated':>9}")
+    for name, (method, expected_calls) in methods.items():
+        f = CountingFunction(g)
+        method(f)
+        print(f"{name:>15} {f.calls:>6} {f.repeated:>9}")
+        assert f.repeated == 0, name
+        assert f.calls == expected_calls, (name, f.calls)
+
+
+if __name__ == "__main__":
+    benchmark_newton()
+    benchmark_evaluations()
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+import numpy as np
+
+from common.rng import spawn
+from LU_decomposition import gaxpy_LU
+from benchmark.LU_decomposition_benchmark import random_matrix, timeit
+
+
+def general_solve_gaxpy_lu(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """gaxpy_LU with a general solve per column, the O(n^4) reference."""
+    n = A.shape[0]
+    L = np.eye(n)
+    U = np.zeros((n, n))
+    v = A[:, 0:1].copy()
+    for i in range(n):
+        if i > 0:
+            a = A[:, i : i + 1]
+            z = np.linalg.solve(L[:i, :i], a[:i])
+            U[:i, i : i + 1] = z
+            v[i:] = a[i:] - L[i:, :i] @ z
+        U[i, i] = v[i, 0]
+        L[i + 1 :, i : i + 1] = v[i + 1 :] / v[i, 0]
+    return (L, U)
+
+
+def benchmark_gaxpy_scaling(sizes=(128, 256, 512, 1024), seed=0):
+    """Print the time of each doubling of n, ~8x is O(n^3) and ~16x is O(n^4)."""
+    print(
+        f"{'n':>6} {'solve (s)':>10} {'ratio':>6} {'substitution (s)':>17} {'ratio':>6}"
+    )
+    previous = None
+    for n, rng in zip(sizes, spawn(seed, len(sizes))):
+        A = random_matrix(n, rng)
+        t_solve = timeit(general_solve_gaxpy_lu, A, repeat=1)
+        t_sub = timeit(gaxpy_LU, A, repeat=1)
+        if previous is None:
+            ratios = ("-", "-")
+        else:
+            ratios = (
+                f"{t_solve / previous[0]:.1f}",
+                f"{t_sub / previous[1]:.1f}",
+            )
+        print(f"{n:>6} {t_solve:>10.4f} {ratios[0]:>6} {t_sub:>17.4f} {ratios[1]:>6}")
+        previous = (t_solve, t_sub)
+
+
+if __name__ == "__main__":
+    benchmark_gaxpy_scaling()
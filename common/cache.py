@@ -0,0 +1,132 @@
+import pickle
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+
+class EvaluationCache:
+    """
+    Memoizes an expensive function of a scalar or an array.
+
+    The results are kept in a bounded LRU cache. With tol > 0 the arguments
+    are quantized to a grid of spacing tol before the lookup, so arguments
+    that round to the same grid point share one evaluation. This is only
+    sound when the function can be considered constant at the scale of tol.
+    The cache can be saved to disk and loaded in a later run of the same
+    model. Array results are returned read-only, since every hit shares
+    the cached array.
+
+    Attributes:
+        f (Callable): The cached function.
+        max_size (int): The maximum number of cached results.
+        tol (float): The spacing of the quantization grid, 0 for exact keys.
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls which evaluated f.
+    """
+
+    def __init__(self, f: Callable, max_size: int = 1024, tol: float = 0.0):
+        if max_size < 1:
+            raise ValueError("The cache must hold at least one entry.")
+        if tol < 0:
+            raise ValueError("The tolerance must be nonnegative.")
+        self.f = f
+        self.max_size = max_size
+        self.tol = tol
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hit_rate(self) -> float:
+        """float: the fraction of calls answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Drops all cached results and resets the statistics."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def key(self, x: Any) -> Hashable:
+        """
+        Computes the cache key of an argument.
+
+        Parameters:
+            x (Any): A real or complex scalar or array.
+
+        Returns:
+            Hashable: The shape and the quantized entries of x, or its shape,
+                dtype and exact entries when tol = 0, x is not finite, or x
+                is too large for the grid.
+        """
+        x = np.asarray(x)
+        if self.tol > 0:
+            # the real and imaginary parts are rounded separately, kept as
+            # floats so that large arguments do not wrap around
+            parts = np.stack([x.real, x.imag]).astype(float)
+            with np.errstate(over="ignore", invalid="ignore"):
+                # + 0.0 turns -0.0 into 0.0, so both sides of 0 share a key
+                grid = np.round(parts / self.tol) + 0.0
+            if np.all(np.isfinite(grid)):
+                return (x.shape, "tol", grid.tobytes())
+            # non-finite arguments, or too large for the grid, are exact keys
+        return (x.shape, x.dtype.str, x.tobytes())
+
+    def __call__(self, x: Any) -> Any:
+        key = self.key(x)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+
+        self.misses += 1
+        value = self.f(x)
+        if isinstance(value, np.ndarray):
+            # the cached array is shared by every hit, so it must not change,
+            # and is copied so that f keeps its own array writable
+            value = value.copy()
+            value.setflags(write=False)
+        self._cache[key] = value
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return value
+
+    def save(self, path: str) -> None:
+        """
+        Writes the cached results to a file.
+
+        Parameters:
+            path (str): The file to write.
+        """
+        with open(path, "wb") as file:
+            pickle.dump({"tol": self.tol, "cache": self._cache}, file)
+
+    def load(self, path: str) -> None:
+        """
+        Adds the results saved by save to the cache, as the most recently used.
+
+        Only load files written for the same function, the function itself
+        is not saved. The file is unpickled, which can run arbitrary code, so
+        only load files from a trusted source.
+
+        Parameters:
+            path (str): The file written by save.
+
+        Raises:
+            ValueError: If the file was saved with another tolerance.
+        """
+        with open(path, "rb") as file:
+            saved = pickle.load(file)
+        if saved["tol"] != self.tol:
+            raise ValueError("The cache was saved with another tolerance.")
+        for key, value in saved["cache"].items():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def float_dtype(*arrays_and_dtypes) -> np.dtype:
+    """
+    Determines the floating point dtype a computation on the inputs runs in.
+
+    Floating point (and complex) inputs keep their precision, so float32 data
+    is factored in float32. Any other input, e.g. an integer matrix, is
+    promoted to float64 instead of being truncated by in-place division.
+
+    Parameters:
+        *arrays_and_dtypes: The arrays or dtypes taking part in the computation.
+
+    Returns:
+        np.dtype: The dtype of the result.
+    """
+    dtype = np.result_type(*arrays_and_dtypes)
+    if np.issubdtype(dtype, np.inexact):
+        return dtype
+    return np.dtype(np.float64)
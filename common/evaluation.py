@@ -0,0 +1,35 @@
+from typing import Any, Callable, List
+
+
+class CountingFunction:
+    """
+    Wraps a function and records every call, to measure how many evaluations
+    of an expensive function a method needs.
+
+    Attributes:
+        f (Callable): The wrapped function.
+        calls (int): The number of calls so far.
+        arguments (List[Any]): The argument of every call, in order.
+    """
+
+    def __init__(self, f: Callable):
+        self.f = f
+        self.calls = 0
+        self.arguments: List[Any] = []
+
+    def __call__(self, x: Any) -> Any:
+        self.calls += 1
+        self.arguments.append(x)
+        return self.f(x)
+
+    @property
+    def repeated(self) -> int:
+        """int: the number of calls at an argument which was already evaluated."""
+        return self.calls - len(set(self.arguments))
+
+    def reset(self) -> None:
+        """
+        Clears the recorded calls.
+        """
+        self.calls = 0
+        self.arguments = []
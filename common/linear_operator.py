@@ -0,0 +1,57 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+class LinearOperator:
+    """
+    A linear map known only through its action on vectors.
+
+    Any object exposing shape and matvec (and optionally matmat), such as a
+    scipy.sparse.linalg.LinearOperator, can be used where the eigen solvers
+    expect a matrix, so the matrix never has to be formed.
+
+    Attributes:
+        shape (Tuple[int, int]): The shape of the matrix the operator represents.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        matvec: Callable[[np.ndarray], np.ndarray],
+        matmat: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    ):
+        self.shape = shape
+        self._matvec = matvec
+        self._matmat = matmat
+
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        """Computes A @ v for a vector v of size n."""
+        return self._matvec(v)
+
+    def matmat(self, V: np.ndarray) -> np.ndarray:
+        """Computes A @ V for a matrix V of size n-by-k."""
+        if self._matmat is not None:
+            return self._matmat(V)
+        return np.column_stack([self._matvec(V[:, j]) for j in range(V.shape[1])])
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return self.matvec(x) if x.ndim == 1 else self.matmat(x)
+
+
+def aslinearoperator(A) -> LinearOperator:
+    """
+    Wraps a matrix or a matrix-free operator as a LinearOperator.
+
+    Parameters:
+        A: A dense or sparse matrix supporting A @ x, or any object exposing
+            shape and matvec (and optionally matmat).
+
+    Returns:
+        LinearOperator: The operator, A itself if it already is one.
+    """
+    if isinstance(A, LinearOperator):
+        return A
+    if hasattr(A, "matvec"):
+        return LinearOperator(A.shape, A.matvec, getattr(A, "matmat", None))
+    return LinearOperator(A.shape, lambda v: A @ v, lambda V: A @ V)
@@ -0,0 +1,31 @@
+from typing import Optional
+
+
+def check_pivot(pivot, tol: float = 1e-8, min_pivot: Optional[float] = None):
+    """
+    Returns the pivot to divide by in an elimination step.
+
+    Without min_pivot, a pivot of magnitude at most tol means the matrix is
+    singular to working precision. With min_pivot, a smaller pivot is
+    replaced by one of magnitude min_pivot and the same phase instead, as
+    inverse iteration does for nearly singular shifted matrices.
+
+    Parameters:
+        pivot: The real or complex pivot.
+        tol (float, optional): The singularity threshold. Defaults to 1e-8.
+        min_pivot (float, optional): The floor of the pivot magnitudes.
+            Defaults to None.
+
+    Returns:
+        The pivot, floored if min_pivot is given.
+
+    Raises:
+        ZeroDivisionError: If |pivot| <= tol and min_pivot is None.
+    """
+    if min_pivot is not None:
+        if abs(pivot) >= min_pivot:
+            return pivot
+        return min_pivot * pivot / abs(pivot) if pivot != 0 else min_pivot
+    if abs(pivot) <= tol:
+        raise ZeroDivisionError("pivot should not be zero")
+    return pivot
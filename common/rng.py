@@ -0,0 +1,41 @@
+from typing import List, Optional, Union
+
+import numpy as np
+
+# anything np.random.default_rng accepts, None draws fresh OS entropy
+SeedLike = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+
+def default_rng(rng: SeedLike = None) -> np.random.Generator:
+    """
+    Normalizes the rng argument of the iterative solvers to a Generator.
+
+    A Generator is returned as is, so a caller threading one generator
+    through several solves gets one reproducible stream, while an int seeds
+    a new generator.
+
+    Parameters:
+        rng (SeedLike): A Generator, a seed, or None for fresh entropy.
+
+    Returns:
+        np.random.Generator: The generator to draw from.
+    """
+    return np.random.default_rng(rng)
+
+
+def spawn(rng: SeedLike, n: int) -> List[np.random.Generator]:
+    """
+    Creates n statistically independent child generators.
+
+    Give every worker (or every item of a batch processed in chunks) its own
+    child instead of sharing one generator, so results do not depend on the
+    order in which the workers draw.
+
+    Parameters:
+        rng (SeedLike): The parent Generator or seed.
+        n (int): The number of children.
+
+    Returns:
+        List[np.random.Generator]: The child generators.
+    """
+    return default_rng(rng).spawn(n)
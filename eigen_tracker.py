@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import numpy as np
+
+from common.rng import SeedLike, default_rng
+from power_iteration import orthogonal_iteration, power_iteration
+
+
+class EigenTracker:
+    """
+    Warm-starts eigen solvers for matrices which change slowly between calls.
+
+    The last eigenvector (or subspace) computed for a key is kept in a bounded
+    LRU cache, and the next solve for the same key starts from it instead of
+    a random guess. The iterations of the first, cold, solve of a key are the
+    baseline from which the saved iterations of later solves are counted.
+
+    Attributes:
+        max_size (int): The maximum number of cached keys.
+        rng (np.random.Generator): Draws the initial guesses of cold solves.
+        hits (int): The number of solves which were warm-started.
+        misses (int): The number of solves which started from a random guess.
+        saved_iterations (int): The iterations saved by warm starts.
+    """
+
+    def __init__(self, max_size: int = 128, rng: SeedLike = None):
+        if max_size < 1:
+            raise ValueError("The cache must hold at least one entry.")
+        self.max_size = max_size
+        # one stream for the cold starts of all keys
+        self.rng = default_rng(rng)
+        self.hits = 0
+        self.misses = 0
+        self.saved_iterations = 0
+        # (method, key) -> (vector or subspace, iterations of the cold solve)
+        self._cache: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def hit_rate(self) -> float:
+        """float: the fraction of solves which were warm-started."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Drops all cached entries and resets the statistics."""
+        self._cache.clear()
+        self.hits = self.misses = self.saved_iterations = 0
+
+    def _lookup(self, key: Tuple, shape: Tuple[int, ...]):
+        entry = self._cache.get(key)
+        if entry is None or entry[0].shape != shape:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _store(self, key: Tuple, entry, value: np.ndarray, iterations: int) -> None:
+        if entry is None:
+            cold_iterations = iterations
+        else:
+            cold_iterations = entry[1]
+            self.saved_iterations += max(cold_iterations - iterations, 0)
+        self._cache[key] = (value, cold_iterations)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def power_iteration(
+        self,
+        key: Hashable,
+        A: np.ndarray,
+        max_iterations: int = 100,
+        tol: float = 1e-10,
+    ) -> Tuple[float, np.ndarray]:
+        """Runs power_iteration on A, warm-started from the last result for key.
+
+        Parameters:
+            key (Hashable): Identifies the slowly varying matrix.
+            A (np.ndarray): An n-by-n matrix or operator, see power_iteration.
+            max_iterations (int, optional): Maximum iterations. Defaults to 100.
+            tol (float, optional): The tolerance of power_iteration.
+                Defaults to 1e-10.
+
+        Returns:
+            Tuple[float, np.ndarray]: The maximum eigenvalue and its eigenvector.
+        """
+        entry = self._lookup(("power", key), (A.shape[1],))
+        v = None if entry is None else entry[0]
+        lamb, v, history = power_iteration(
+            A,
+            max_iterations=max_iterations,
+            v=v,
+            tol=tol,
+            return_history=True,
+            rng=self.rng,
+        )
+        self._store(("power", key), entry, v, history.iterations)
+        return lamb, v
+
+    def orthogonal_iteration(
+        self,
+        key: Hashable,
+        A: np.ndarray,
+        k: int = 1,
+        max_iterations: int = 100,
+        tol: float = 1e-10,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Runs orthogonal_iteration on A, warm-started from the last subspace for key.
+
+        Parameters:
+            key (Hashable): Identifies the slowly varying matrix.
+            A (np.ndarray): An n-by-n matrix or operator, see orthogonal_iteration.
+            k (int, optional): The dimension of the subspace. Defaults to 1.
+            max_iterations (int, optional): Maximum iterations. Defaults to 100.
+            tol (float, optional): The tolerance of orthogonal_iteration.
+                Defaults to 1e-10.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Q and R, see orthogonal_iteration.
+        """
+        entry = self._lookup(("orthogonal", key), (A.shape[1], k))
+        V = None if entry is None else entry[0]
+        Q, R, history = orthogonal_iteration(
+            A,
+            k,
+            max_iterations=max_iterations,
+            V=V,
+            tol=tol,
+            return_history=True,
+            rng=self.rng,
+        )
+        self._store(("orthogonal", key), entry, Q, history.iterations)
+        return Q, R
@@ -0,0 +1,110 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from LU_decomposition import LUFactorization, _working_copy
+from common.dtype import float_dtype
+from common.pivot import check_pivot
+
+
+def house(x: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Compute the Householder vector v and beta with (I - beta v v^T) x = alpha e_1
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 5.1.1
+    """
+    v = np.array(x, dtype=float_dtype(x))
+    alpha = np.linalg.norm(x)
+    if alpha == 0:
+        return v, 0.0
+    # choose the sign which avoids cancellation in v[0]
+    v[0] += np.copysign(alpha, x[0])
+    return v, 2.0 / (v @ v)
+
+
+def hessenberg_reduction(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Use Householder reflections to reduce A to upper Hessenberg form
+
+    If A is symmetric, H is symmetric tridiagonal (up to rounding errors).
+
+    Args:
+        A (np.ndarray): an square matrix of size n-by-n
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: H and the orthogonal Q with A = Q H Q^T.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 7.4.2
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("Hessenberg reduction is only valid for square matrix.")
+
+    H = np.array(A, dtype=float_dtype(A))
+    Q = np.eye(n, dtype=H.dtype)
+    for k in range(n - 2):
+        v, beta = house(H[k + 1 :, k])
+        if beta == 0:
+            continue
+        H[k + 1 :, k:] -= beta * np.outer(v, v @ H[k + 1 :, k:])
+        H[:, k + 1 :] -= beta * np.outer(H[:, k + 1 :] @ v, v)
+        Q[:, k + 1 :] -= beta * np.outer(Q[:, k + 1 :] @ v, v)
+        H[k + 2 :, k] = 0.0
+
+    return (H, Q)
+
+
+def hessenberg_lu(
+    H: np.ndarray,
+    overwrite_h: bool = False,
+    tol: float = 1e-8,
+    min_pivot: Optional[float] = None,
+) -> LUFactorization:
+    """Use partial pivoting to compute the LU decomposition of a Hessenberg matrix
+
+    Only row k + 1 has a nonzero below the diagonal in column k, so every step
+    compares two candidate pivots and updates a single row in O(n), for a
+    total cost of O(n^2).
+
+    Args:
+        H (np.ndarray): an upper Hessenberg matrix of size n-by-n
+        overwrite_h (bool, optional): factor H in place instead of a copy.
+            Defaults to False.
+        tol (float, optional): pivots of magnitude at most tol are treated
+            as zero, also by solve. Defaults to 1e-8.
+        min_pivot (float, optional): floor pivots smaller than min_pivot in
+            magnitude at min_pivot, keeping their phase, instead of raising,
+            see common.pivot.check_pivot. Defaults to None.
+
+    Raises:
+        ValueError: raises if H is not a square matrix.
+        ZeroDivisionError: raises if H is singular and min_pivot is None
+
+    Returns:
+        LUFactorization: the packed factors and the row permutation perm
+            such that H[perm] = L @ U.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 4.3.4
+    """
+    m, n = H.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    H = _working_copy(H, overwrite_h)
+    perm = np.arange(n)
+    for k in range(n):
+        if k + 1 < n and abs(H[k + 1, k]) > abs(H[k, k]):
+            H[[k, k + 1]] = H[[k + 1, k]]
+            perm[[k, k + 1]] = perm[[k + 1, k]]
+        pivot = H[k, k] = check_pivot(H[k, k], tol, min_pivot)
+        if k + 1 < n:
+            H[k + 1, k] /= pivot
+            H[k + 1, k + 1 :] -= H[k + 1, k] * H[k, k + 1 :]
+
+    return LUFactorization(H, perm, tol=tol if min_pivot is None else 0.0)
@@ -0,0 +1,132 @@
+from typing import Optional
+
+import numpy as np
+
+from common.dtype import float_dtype
+
+
+class BarycentricInterpolator:
+    """
+    The Lagrange interpolating polynomial in barycentric form.
+
+    The weights w_i = 1 / prod_{j != i} (x_i - x_j) are computed once in
+    O(n^2), after which the polynomial is evaluated at m points in O(n m) by
+
+        P(x) = sum_i w_i y_i / (x - x_i) / sum_i w_i / (x - x_i).
+
+    The weights are accumulated as sums of logarithms of the differences,
+    scaled by 4 / (b - a), so that the weights of thousands of nodes neither
+    overflow nor underflow. Any common factor of the weights cancels in the
+    quotient.
+
+    Attributes:
+    - nodes (np.ndarray): The n distinct interpolation nodes.
+    - values (np.ndarray): The values at the nodes, of shape (n,) or (n, d).
+    - weights (np.ndarray): The barycentric weights, normalized to max |w_i| = 1.
+
+    Reference:
+        Berrut, Jean-Paul, and Lloyd N. Trefethen. Barycentric Lagrange
+        Interpolation. SIAM Review 46.3 (2004)
+    """
+
+    def __init__(self, nodes: np.ndarray, values: np.ndarray):
+        """
+        Parameters:
+        - nodes (np.ndarray): An array of shape (n,) of distinct nodes.
+        - values (np.ndarray): An array of shape (n,) or (n, d) of the values at the nodes.
+
+        Raises:
+        - ValueError: If the nodes are not distinct or do not match the values.
+        """
+        nodes, values = np.asarray(nodes), np.asarray(values)
+        nodes = nodes.astype(float_dtype(nodes), copy=False)
+        values = values.astype(float_dtype(values), copy=False)
+        if nodes.ndim != 1 or values.shape[0] != nodes.size:
+            raise ValueError("The nodes and values must have the same length.")
+
+        length = np.ptp(nodes) if nodes.size > 1 else 0.0
+        self._scale = 4.0 / length if length > 0 else 1.0
+        # sum logarithms, a product of thousands of differences overflows,
+        # and go by chunks of rows to keep the n-by-n differences out of memory
+        n = nodes.size
+        log_weights = np.empty(n, dtype=nodes.dtype)
+        signs = np.empty(n, dtype=nodes.dtype)
+        chunk_size = max(1, 2**20 // n)
+        for start in range(0, n, chunk_size):
+            rows = np.arange(start, min(start + chunk_size, n))
+            diff = self._scale * (nodes[rows, None] - nodes[None, :])
+            diff[rows - start, rows] = 1.0
+            if np.any(diff == 0):
+                raise ValueError("The interpolation nodes must be distinct.")
+            log_weights[rows] = -np.sum(np.log(np.abs(diff)), axis=1)
+            signs[rows] = 1 - 2 * (np.sum(diff < 0, axis=1) % 2)
+
+        self.nodes = nodes
+        self.values = values
+        # the weights are kept as exp(log_factor) times the true (scaled) weights
+        self._log_factor = -np.max(log_weights)
+        self.weights = signs * np.exp(log_weights + self._log_factor)
+
+    def add_node(self, node: float, value) -> None:
+        """
+        Adds an interpolation node in O(n) by updating the existing weights.
+
+        Parameters:
+        - node (float): The new node, distinct from the existing ones.
+        - value: The value at the new node, a scalar or an array of shape (d,).
+
+        Raises:
+        - ValueError: If the node already exists.
+        """
+        diff = self._scale * (self.nodes - node)
+        if np.any(diff == 0):
+            raise ValueError("The interpolation nodes must be distinct.")
+
+        log_weight = self._log_factor - np.sum(np.log(np.abs(diff)))
+        weight = (1 - 2 * (np.sum(diff > 0) % 2)) * np.exp(log_weight)
+        weights = np.append(self.weights / diff, weight)
+        norm = np.max(np.abs(weights))
+        self.weights = weights / norm
+        self._log_factor -= np.log(norm)
+        self.nodes = np.append(self.nodes, node)
+        self.values = np.concatenate([self.values, [value]])
+
+    def __call__(self, x: np.ndarray, chunk_size: Optional[int] = None) -> np.ndarray:
+        """
+        Evaluates the interpolating polynomial.
+
+        The evaluation points are processed in chunks, so the temporary
+        chunk_size-by-n arrays bound the memory however large x is.
+
+        Parameters:
+        - x (np.ndarray): The points to evaluate at, of any shape.
+        - chunk_size (int, optional): The number of points per chunk.
+            Defaults to about 2^20 / n.
+
+        Returns:
+        - np.ndarray: The values of shape x.shape, followed by (d,) for vector values.
+        """
+        x = np.asarray(x)
+        n = self.nodes.size
+        if chunk_size is None:
+            chunk_size = max(1, 2**20 // n)
+
+        points = x.reshape(-1)
+        values = self.values.reshape(n, -1)
+        result = np.empty(
+            (points.size, values.shape[1]), dtype=float_dtype(points, values)
+        )
+        for start in range(0, points.size, chunk_size):
+            chunk = points[start : start + chunk_size]
+            diff = chunk[:, None] - self.nodes[None, :]
+            exact = diff == 0
+            diff[exact] = 1.0
+            C = self.weights / diff
+            result[start : start + chunk.size] = (C @ values) / np.sum(
+                C, axis=1, keepdims=True
+            )
+            # at a node the formula is 0 / 0, the value is known
+            rows, cols = np.nonzero(exact)
+            result[start + rows] = values[cols]
+
+        return result.reshape(x.shape + self.values.shape[1:])
@@ -0,0 +1,137 @@
+from typing import Callable
+
+import numpy as np
+
+from common.dtype import float_dtype
+
+
+def chebyshev_points(n: int, a: float = -1.0, b: float = 1.0) -> np.ndarray:
+    """
+    Generates the Chebyshev points of the second kind on [a, b].
+
+    The points x_j = cos(pi j / (n - 1)), j = 0, ..., n - 1, are the extrema
+    of T_{n-1}, mapped linearly to [a, b]. They run from b down to a.
+
+    Parameters:
+    - n (int): The number of points, at least 2.
+    - a (float, optional): The left end of the interval. Defaults to -1.0.
+    - b (float, optional): The right end of the interval. Defaults to 1.0.
+
+    Returns:
+    - np.ndarray: An array of shape (n,) of the points.
+    """
+    if n < 2:
+        raise ValueError("At least two Chebyshev points are needed.")
+    t = np.cos(np.pi * np.arange(n) / (n - 1))
+    return 0.5 * (a + b) + 0.5 * (b - a) * t
+
+
+def chebyshev_coefficients(values: np.ndarray) -> np.ndarray:
+    """
+    Computes the Chebyshev coefficients of the interpolant of values at the Chebyshev points.
+
+    With N = n - 1, the values at cos(pi j / N) are extended evenly to a
+    sequence of length 2N, whose real FFT gives the coefficients of
+    p(t) = sum_k c_k T_k(t) in O(n log n).
+
+    Parameters:
+    - values (np.ndarray): An array of shape (n,) of the values at chebyshev_points(n).
+
+    Returns:
+    - np.ndarray: An array of shape (n,) of the coefficients c_k.
+    """
+    values = np.asarray(values)
+    values = values.astype(float_dtype(values), copy=False)
+    N = values.size - 1
+    if N < 1:
+        raise ValueError("At least two values are needed.")
+    extended = np.concatenate([values, values[-2:0:-1]])
+    coefficients = np.fft.rfft(extended).real[: N + 1] / N
+    coefficients[0] /= 2
+    coefficients[N] /= 2
+    return coefficients
+
+
+def clenshaw(coefficients: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Evaluates sum_k c_k T_k(t) with Clenshaw's recurrence.
+
+    The recurrence b_k = c_k + 2t b_{k+1} - b_{k+2} is run for all points at
+    once, so the cost is O(n m) with O(m) memory.
+
+    Parameters:
+    - coefficients (np.ndarray): An array of shape (n,) of the coefficients c_k.
+    - t (np.ndarray): The points in [-1, 1], of any shape.
+
+    Returns:
+    - np.ndarray: The values of the series, of shape t.shape.
+    """
+    t = np.asarray(t)
+    t = t.astype(float_dtype(t, coefficients), copy=False)
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for c in coefficients[:0:-1]:
+        b1, b2 = c + 2 * t * b1 - b2, b1
+    return coefficients[0] + t * b1 - b2
+
+
+class ChebyshevInterpolant:
+    """
+    The polynomial interpolating data at the Chebyshev points of [a, b].
+
+    Unlike equispaced interpolation, the interpolant at Chebyshev points
+    converges for every Lipschitz function, so thousands of nodes are fine.
+
+    Attributes:
+    - a (float): The left end of the interval.
+    - b (float): The right end of the interval.
+    - coefficients (np.ndarray): The Chebyshev coefficients on [a, b].
+
+    Reference:
+        Trefethen, Lloyd N. Approximation Theory and Approximation Practice.
+        Chapter 3 and 4
+    """
+
+    def __init__(self, values: np.ndarray, a: float = -1.0, b: float = 1.0):
+        """
+        Parameters:
+        - values (np.ndarray): An array of shape (n,) of the values at chebyshev_points(n, a, b).
+        - a (float, optional): The left end of the interval. Defaults to -1.0.
+        - b (float, optional): The right end of the interval. Defaults to 1.0.
+        """
+        if not a < b:
+            raise ValueError("The interval [a, b] must satisfy a < b.")
+        self.a = a
+        self.b = b
+        self.coefficients = chebyshev_coefficients(values)
+
+    @classmethod
+    def from_function(
+        cls, f: Callable, n: int, a: float = -1.0, b: float = 1.0
+    ) -> "ChebyshevInterpolant":
+        """
+        Samples a vectorized function f at n Chebyshev points and interpolates it.
+
+        Parameters:
+        - f (Callable): The function, evaluated once on an array of points.
+        - n (int): The number of points.
+        - a (float, optional): The left end of the interval. Defaults to -1.0.
+        - b (float, optional): The right end of the interval. Defaults to 1.0.
+
+        Returns:
+        - ChebyshevInterpolant: The interpolant.
+        """
+        return cls(f(chebyshev_points(n, a, b)), a, b)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the interpolant.
+
+        Parameters:
+        - x (np.ndarray): The points in [a, b], of any shape.
+
+        Returns:
+        - np.ndarray: The values of shape x.shape.
+        """
+        t = (2 * np.asarray(x) - (self.a + self.b)) / (self.b - self.a)
+        return clenshaw(self.coefficients, t)
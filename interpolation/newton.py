@@ -0,0 +1,118 @@
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+
+class NewtonInterpolant:
+    """
+    The interpolating polynomial in Newton form for a stream of data points.
+
+    With nodes x_0, ..., x_n (oldest first) only the last row of the divided
+    difference table, r_j = f[x_{n-j}, ..., x_n], is kept, and the polynomial
+    is written with the newest node first:
+
+        P(x) = r_0 + r_1 (x - x_n) + ... + r_n (x - x_n) ... (x - x_1).
+
+    Appending a node computes the next row from the last one in O(n).
+    Dropping the oldest node x_0 only removes the last term r_n, which is the
+    interpolant of the remaining nodes, so a sliding window costs O(1).
+
+    Attributes:
+    - max_nodes (Optional[int]): The size of the sliding window, None for no limit.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Section 3.3, Algorithm 3.2
+    """
+
+    def __init__(
+        self,
+        nodes: np.ndarray = (),
+        values: np.ndarray = (),
+        max_nodes: Optional[int] = None,
+    ):
+        """
+        Parameters:
+        - nodes (np.ndarray, optional): The initial nodes, oldest first.
+        - values (np.ndarray, optional): The values at the initial nodes.
+        - max_nodes (int, optional): Keep only the newest max_nodes nodes.
+            Defaults to None.
+
+        Raises:
+        - ValueError: If nodes and values differ in length or max_nodes < 1.
+        """
+        if len(nodes) != len(values):
+            raise ValueError("The nodes and values must have the same length.")
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("The window must hold at least one node.")
+        self.max_nodes = max_nodes
+        self._nodes: deque = deque()
+        self._row: deque = deque()
+        for node, value in zip(nodes, values):
+            self.append(node, value)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """np.ndarray: the current nodes, oldest first."""
+        return np.array(self._nodes, dtype=float)
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """np.ndarray: the divided differences r_j = f[x_{n-j}, ..., x_n]."""
+        return np.array(self._row, dtype=float)
+
+    def append(self, node: float, value: float) -> None:
+        """
+        Adds a data point in O(n), dropping the oldest one if the window is full.
+
+        Parameters:
+        - node (float): The new node, distinct from the current ones.
+        - value (float): The value at the new node.
+
+        Raises:
+        - ValueError: If the node is already present.
+        """
+        row = deque([float(value)])
+        # r'_j = (r'_{j-1} - r_{j-1}) / (x_new - x_{n+1-j}), newest node first
+        for r, x in zip(self._row, reversed(self._nodes)):
+            if x == node:
+                raise ValueError("The interpolation nodes must be distinct.")
+            row.append((row[-1] - r) / (node - x))
+
+        self._row = row
+        self._nodes.append(float(node))
+        if self.max_nodes is not None and len(self._nodes) > self.max_nodes:
+            self.drop_oldest()
+
+    def drop_oldest(self) -> None:
+        """
+        Removes the oldest data point in O(1).
+        """
+        if not self._nodes:
+            raise IndexError("drop from an empty interpolant")
+        self._nodes.popleft()
+        self._row.pop()
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the interpolant with nested multiplication at all points at once.
+
+        Parameters:
+        - x (np.ndarray): The points to evaluate at, of any shape.
+
+        Returns:
+        - np.ndarray: The values of shape x.shape.
+        """
+        if not self._nodes:
+            raise ValueError("The interpolant has no nodes.")
+        x = np.asarray(x, dtype=float)
+        nodes, row = self.nodes, self.coefficients
+        n = nodes.size - 1
+        result = np.full(x.shape, row[n])
+        for j in range(n - 1, -1, -1):
+            result = row[j] + (x - nodes[n - j]) * result
+        return result
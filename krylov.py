@@ -0,0 +1,262 @@
+from typing import Tuple
+
+import numpy as np
+
+from common.linear_operator import aslinearoperator
+from common.rng import SeedLike, default_rng
+
+# Ritz values are ordered by these keys, the wanted ones come first. The
+# real ("A") orderings of lanczos and the complex ("R") orderings of arnoldi
+# follow scipy.sparse.linalg.eigsh and eigs.
+_SYMMETRIC_SORT_KEYS = {
+    "LM": lambda values: -np.abs(values),
+    "LA": lambda values: -values,
+    "SA": lambda values: values,
+}
+_SORT_KEYS = {
+    "LM": lambda values: -np.abs(values),
+    "LR": lambda values: -values.real,
+    "SR": lambda values: values.real,
+}
+
+
+def _close_pairs(theta: np.ndarray, s: int) -> int:
+    """Extend the prefix theta[:s] so that it never splits a conjugate pair."""
+    if s < len(theta) and np.sum(theta[:s].imag > 0) != np.sum(theta[:s].imag < 0):
+        return s + 1
+    return s
+
+
+def _real_basis(theta: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """Orthonormal real basis of the span of the eigenvectors Y.
+
+    A conjugate pair of eigenvectors is replaced by its real and imaginary
+    parts, so the basis spans the same invariant subspace in real arithmetic.
+    """
+    columns = []
+    for i in range(len(theta)):
+        if theta[i].imag == 0:
+            columns.append(Y[:, i].real)
+        elif theta[i].imag > 0:
+            columns.extend([Y[:, i].real, Y[:, i].imag])
+    Q, _ = np.linalg.qr(np.column_stack(columns))
+    return Q
+
+
+def _krylov_schur(
+    A,
+    k: int,
+    m: int,
+    v: np.ndarray,
+    tol: float,
+    max_restarts: int,
+    which: str,
+    symmetric: bool,
+    rng: SeedLike,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    A = aslinearoperator(A)
+    n, n_cols = A.shape
+    if n != n_cols:
+        raise ValueError("Krylov methods only support square matrix.")
+    if not 0 < k < n:
+        raise ValueError("The number of eigenvalues k must satisfy 0 < k < n.")
+    sort_keys = _SYMMETRIC_SORT_KEYS if symmetric else _SORT_KEYS
+    if which not in sort_keys:
+        raise ValueError(f"which must be one of {', '.join(sort_keys)}.")
+    key = sort_keys[which]
+
+    if m is None:
+        m = min(n, max(2 * k + 1, 20))
+    if not k < m <= n:
+        raise ValueError("The basis size m must satisfy k < m <= n.")
+
+    rng = default_rng(rng)
+    if v is None:
+        v = rng.standard_normal(n)
+    elif v.shape != (n,):
+        raise ValueError("The shape of initialization vector does not match the input.")
+
+    # A V[:, :m] = V[:, :m + 1] H is kept as an invariant, the first `locked`
+    # columns of V span converged Ritz pairs which are no longer updated.
+    V = np.zeros((n, m + 1))
+    H = np.zeros((m + 1, m))
+    V[:, 0] = v / np.linalg.norm(v)
+    start = 0
+    locked = 0
+    for restart in range(max_restarts):
+        for j in range(start, m):
+            w = A.matvec(V[:, j])
+            # two passes of classical Gram-Schmidt keep V orthonormal
+            h = V[:, : j + 1].T @ w
+            w = w - V[:, : j + 1] @ h
+            c = V[:, : j + 1].T @ w
+            w -= V[:, : j + 1] @ c
+            h += c
+            H[: j + 1, j] = h
+            beta = np.linalg.norm(w)
+            if beta <= np.finfo(float).eps * np.linalg.norm(h):
+                # the Krylov subspace is invariant, continue with a new direction
+                beta = 0.0
+                w = rng.standard_normal(n)
+                w -= V[:, : j + 1] @ (V[:, : j + 1].T @ w)
+                w -= V[:, : j + 1] @ (V[:, : j + 1].T @ w)
+            H[j + 1, j] = beta
+            V[:, j + 1] = w / np.linalg.norm(w)
+
+        # Rayleigh-Ritz on the active block, H[locked:, :locked] is zero
+        active = H[locked:m, locked:m]
+        if symmetric:
+            theta, Y = np.linalg.eigh((active + active.T) / 2)
+        else:
+            theta, Y = np.linalg.eig(active)
+        order = np.argsort(key(theta), kind="stable")
+        theta, Y = theta[order], Y[:, order]
+        residuals = np.abs(H[m, m - 1] * Y[-1])
+        scale = max(np.max(np.abs(theta)), np.finfo(float).tiny)
+
+        wanted = k - locked
+        n_lock = 0
+        while n_lock < wanted and residuals[n_lock] <= tol * scale:
+            n_lock += 1
+        n_lock = _close_pairs(theta, n_lock)
+
+        if locked + n_lock < k and restart == max_restarts - 1:
+            break
+
+        # thick restart: keep the wanted Ritz vectors and a few more
+        keep = max(n_lock, min(wanted + (m - locked - wanted) // 2, m - locked - 1))
+        closed = _close_pairs(theta, keep)
+        keep = closed if locked + closed < m else keep - 1
+        if symmetric:
+            Z = Y[:, :keep]
+        else:
+            Z = _real_basis(theta[:keep], Y[:, :keep])
+        keep = Z.shape[1]
+
+        V[:, locked : locked + keep] = V[:, locked:m] @ Z
+        V[:, locked + keep] = V[:, m]
+        H[:locked, locked : locked + keep] = H[:locked, locked:m] @ Z
+        H[:locked, locked + keep :] = 0.0
+        block = Z.T @ H[locked:m, locked:m] @ Z
+        coupling = H[m, m - 1] * Z[-1]
+        # lock only the leading basis vectors whose own residual is small,
+        # for non-normal A these can lag behind the Ritz vectors
+        small = np.abs(coupling[:n_lock]) <= tol * scale
+        if not small.all():
+            n_lock = int(np.argmin(small))
+            if _close_pairs(theta, n_lock) != n_lock:
+                n_lock -= 1
+        H[locked:, :] = 0.0
+        H[locked : locked + keep, locked : locked + keep] = block
+        H[locked + keep, locked : locked + keep] = coupling
+        # deflation: the converged vectors are decoupled from the residual
+        H[locked + keep, locked : locked + n_lock] = 0.0
+        start = locked + keep
+        locked += n_lock
+        if locked >= k:
+            break
+
+    size = locked if locked >= k else m
+    T = H[:size, :size]
+    if symmetric:
+        theta, Y = np.linalg.eigh((T + T.T) / 2)
+    else:
+        theta, Y = np.linalg.eig(T)
+    order = np.argsort(key(theta), kind="stable")[:k]
+    theta, Y = theta[order], Y[:, order]
+    X = V[:, :size] @ Y
+    X /= np.linalg.norm(X, axis=0)
+    residuals = np.linalg.norm(A.matmat(X) - X * theta, axis=0)
+    return (theta, X, residuals)
+
+
+def lanczos(
+    A,
+    k: int = 6,
+    m: int = None,
+    v: np.ndarray = None,
+    tol: float = 1e-10,
+    max_restarts: int = 100,
+    which: str = "LM",
+    rng: SeedLike = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find k eigenpairs of a symmetric matrix with thick-restart Lanczos
+
+    The Lanczos basis is built with full reorthogonalization. Whenever it
+    reaches m vectors the wanted Ritz vectors are kept and the rest is
+    discarded, so memory stays at n-by-(m + 1). Converged Ritz pairs are
+    locked: they are no longer updated and are decoupled from the residual,
+    so the remaining pairs converge in the deflated space.
+
+    Args:
+        A (np.ndarray): a symmetric n-by-n matrix, or any operator exposing
+            shape and matvec, see common.linear_operator.
+        k (int, optional): the number of eigenpairs. Defaults to 6.
+        m (int, optional): the maximum basis size, k < m <= n.
+            Defaults to max(2k + 1, 20).
+        v (np.ndarray, optional): initial vector of size n. Defaults to None.
+        tol (float, optional): a Ritz pair is converged once its residual is
+            below tol times the largest Ritz value. Defaults to 1e-10.
+        max_restarts (int, optional): maximum restarts. Defaults to 100.
+        which (str, optional): "LM" for the largest magnitude, "LA"/"SA" for
+            the largest/smallest algebraic eigenvalues. Defaults to "LM".
+        rng (SeedLike, optional): a Generator or seed for the initial vector,
+            see common.rng. Defaults to None.
+
+    Raises:
+        ValueError: raises if A is not square or k, m, v, which are invalid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: the k eigenvalues, the
+            eigenvectors of size n-by-k and the residuals ||Ax - lambda x||.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 10.1 and 10.3
+    """
+    return _krylov_schur(A, k, m, v, tol, max_restarts, which, True, rng)
+
+
+def arnoldi(
+    A,
+    k: int = 6,
+    m: int = None,
+    v: np.ndarray = None,
+    tol: float = 1e-10,
+    max_restarts: int = 100,
+    which: str = "LM",
+    rng: SeedLike = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find k eigenpairs of a general matrix with restarted Arnoldi
+
+    The restart keeps an orthonormal real basis of the wanted Ritz vectors,
+    which spans an invariant subspace of the Hessenberg matrix, as in the
+    Krylov-Schur method. A complex conjugate pair is always kept, locked or
+    discarded together.
+
+    Args:
+        A (np.ndarray): an n-by-n matrix, or any operator exposing shape and
+            matvec, see common.linear_operator.
+        k (int, optional): the number of eigenpairs. Defaults to 6.
+        m (int, optional): the maximum basis size, k < m <= n.
+            Defaults to max(2k + 1, 20).
+        v (np.ndarray, optional): initial vector of size n. Defaults to None.
+        tol (float, optional): a Ritz pair is converged once its residual is
+            below tol times the largest Ritz value. Defaults to 1e-10.
+        max_restarts (int, optional): maximum restarts. Defaults to 100.
+        which (str, optional): "LM" for the largest magnitude, "LR"/"SR" for
+            the largest/smallest real part. Defaults to "LM".
+        rng (SeedLike, optional): a Generator or seed for the initial vector,
+            see common.rng. Defaults to None.
+
+    Raises:
+        ValueError: raises if A is not square or k, m, v, which are invalid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: the k (possibly complex)
+            eigenvalues, the eigenvectors of size n-by-k and the residuals
+            ||Ax - lambda x||.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 10.5
+    """
+    return _krylov_schur(A, k, m, v, tol, max_restarts, which, False, rng)
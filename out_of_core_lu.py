@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from LU_decomposition import LUFactorization, out_product_kernel
+from triangular_solve import forward_substitution
+
+
+def _prefetched_reads(
+    A: np.ndarray, ranges: List[Tuple[int, int]]
+) -> Iterator[np.ndarray]:
+    """Read the row panels A[start:end] in order, one read ahead of the consumer.
+
+    The read of the next panel runs in a background thread while the caller
+    processes the current one. Every read is a contiguous block of rows.
+    """
+
+    def read(start: int, end: int) -> np.ndarray:
+        return np.array(A[start:end])
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(read, *ranges[0]) if ranges else None
+        for i in range(len(ranges)):
+            panel = future.result()
+            if i + 1 < len(ranges):
+                future = pool.submit(read, *ranges[i + 1])
+            yield panel
+
+
+def out_of_core_lu(
+    A: Union[np.memmap, str],
+    shape: Optional[Tuple[int, int]] = None,
+    dtype: np.dtype = np.float64,
+    memory_budget: int = 2**28,
+) -> LUFactorization:
+    """Compute the packed LU decomposition of a matrix stored on disk
+
+    A is processed by panels of rows, top to bottom. Panel i is read, every
+    earlier panel of the packed factors is streamed through to eliminate
+    its left part (X U_kk = A_ik, then the Schur update of the rest of the
+    row panel), the remaining wide block is factored by the out product
+    method and the panel is written back in place. Only row panels are read
+    and written, which are contiguous blocks of a C-ordered file, and the
+    next panel is prefetched while the current one is being used.
+
+    Args:
+        A (Union[np.memmap, str]): a writable C-ordered np.memmap of size
+            n-by-n, or the path of a raw file holding it.
+        shape (Tuple[int, int], optional): the shape of the matrix if A is
+            a path. Defaults to None.
+        dtype (np.dtype, optional): the float dtype of the matrix if A is
+            a path. Defaults to np.float64.
+        memory_budget (int, optional): the number of bytes the three row
+            panels held in memory at once may use. Defaults to 256 MiB.
+
+    Raises:
+        ValueError: raises if A is not a square matrix, is not C-ordered, or
+            the budget cannot hold three rows.
+        ZeroDivisionError: raises if A is not invertible
+
+    Returns:
+        LUFactorization: the packed factors, backed by the memmap.
+    """
+    if isinstance(A, str):
+        if shape is None:
+            raise ValueError("The shape is required when A is a path.")
+        A = np.memmap(A, dtype=dtype, mode="r+", shape=shape)
+
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+    if not A.flags.c_contiguous:
+        raise ValueError("Out-of-core LU decomposition requires C-ordered storage.")
+    if n == 0:
+        return LUFactorization(A)
+
+    r = memory_budget // (3 * n * A.itemsize)
+    if r < 1:
+        raise ValueError("The memory budget is too small for the matrix.")
+    r = min(r, n)
+
+    panels = [(start, min(start + r, n)) for start in range(0, n, r)]
+    ranges = []
+    for i, panel in enumerate(panels):
+        ranges.append(panel)
+        ranges.extend(panels[:i])
+
+    reads = _prefetched_reads(A, ranges)
+    for i, (i0, i1) in enumerate(panels):
+        R = next(reads)
+        for k0, k1 in panels[:i]:
+            P = next(reads)
+            # L_ik solves X U_kk = R[:, k0:k1], i.e. U_kk^T X^T = R[:, k0:k1]^T
+            R[:, k0:k1] = forward_substitution(P[:, k0:k1].T, R[:, k0:k1].T).T
+            R[:, k1:] -= R[:, k0:k1] @ P[:, k1:]
+        out_product_kernel(R[:, i0:])
+        A[i0:i1] = R
+
+    if isinstance(A, np.memmap):
+        A.flush()
+
+    return LUFactorization(A)
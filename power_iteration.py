@@ -1,64 +1,373 @@
 import numpy as np
-from typing import Tuple
+from typing import List, Tuple, Union
+
+from LU_decomposition import partial_pivot_out_product_lu
+from banded_lu import banded_lu
+from common.dtype import float_dtype
+from common.linear_operator import LinearOperator, aslinearoperator
+from common.rng import SeedLike, default_rng
+from hessenberg import hessenberg_lu, hessenberg_reduction
+
+
+class ConvergenceHistory:
+    """The per-iteration record of an eigen solver.
+
+    Attributes:
+        eigenvalues (List[float]): the eigenvalue estimate of every iteration,
+            an array of estimates for subspace methods.
+        residuals (List[float]): the residual norm ||Av - lambda v|| of every
+            iteration.
+        converged (bool): whether the tolerance was reached.
+    """
+
+    def __init__(self):
+        self.eigenvalues: List[float] = []
+        self.residuals: List[float] = []
+        self.converged: bool = False
+
+    @property
+    def iterations(self) -> int:
+        return len(self.residuals)
+
+    @property
+    def ratio(self) -> float:
+        """float: the estimated |lambda_2 / lambda_1|.
+
+        The residual of power iteration decays like |lambda_2 / lambda_1|^k,
+        the ratio is the geometric mean decay over the last few iterations.
+        """
+        residuals = [r for r in self.residuals[-5:] if r > 0]
+        if len(residuals) < 2:
+            return np.nan
+        return (residuals[-1] / residuals[0]) ** (1 / (len(residuals) - 1))
+
+    def append(self, eigenvalue: float, residual: float) -> None:
+        self.eigenvalues.append(eigenvalue)
+        self.residuals.append(residual)
 
 
 def power_iteration(
-    A: np.ndarray, max_iterations: int = 100, v: np.ndarray = None
-) -> Tuple[float, np.ndarray]:
+    A: np.ndarray,
+    max_iterations: int = 100,
+    v: np.ndarray = None,
+    tol: float = 1e-10,
+    return_history: bool = False,
+    rng: SeedLike = None,
+) -> Union[Tuple[float, np.ndarray], Tuple[float, np.ndarray, ConvergenceHistory]]:
     """Find the maximum eigenvalue and corresponding eigenvector
 
+    Every iteration does a single matrix-vector product w = Av, which gives
+    both the Rayleigh quotient v^T w and the residual ||w - lambda v|| of the
+    current vector before w is normalized into the next one.
+
     Args:
-        A (np.ndarray): an n-by-n matrix
+        A (np.ndarray): an n-by-n matrix, or any operator exposing shape and
+            matvec, see common.linear_operator.
         max_iterations (int, optional): maximum iterations. Defaults to 100.
         v (np.ndarray): initial guess. Defaults to None.
+        tol (float, optional): stop once the residual is at most tol times
+            the magnitude of the eigenvalue. Defaults to 1e-10.
+        return_history (bool, optional): also return the convergence history.
+            Defaults to False.
+        rng (SeedLike, optional): a Generator or seed for the initial guess,
+            see common.rng. Defaults to None.
+
+    Raises:
+        ValueError: raises if A is not square or max_iterations < 1.
 
     Returns:
-        Tuple[float, np.ndarray]: the maximum eigenvalue and corresponding eigenvector.
+        Tuple[float, np.ndarray]: the maximum eigenvalue and corresponding eigenvector,
+            followed by a ConvergenceHistory if return_history is True. Without
+            convergence the eigenvalue is the Rayleigh quotient of the returned
+            vector.
     """
+    A = aslinearoperator(A)
     m, n = A.shape
     if m != n:
         raise ValueError("Power iteration only supports square matrix.")
+    if max_iterations < 1:
+        raise ValueError("max_iterations should be a positive integer.")
 
     if v is None:
-        v = np.random.rand(n)
+        v = default_rng(rng).random(n)
 
-    for _ in range(max_iterations):
-        v = A @ v
-        norm_v = np.linalg.norm(v)
-        v /= norm_v
-        lamb = v.T @ A @ v
+    v = v / np.linalg.norm(v)
+    history = ConvergenceHistory()
+    for i in range(max_iterations):
+        w = A.matvec(v)
+        lamb = v.T @ w
+        history.append(lamb, np.linalg.norm(w - lamb * v))
+        if history.residuals[-1] <= tol * abs(lamb):
+            history.converged = True
+            break
+        # keep the last v, whose Rayleigh quotient is lamb
+        if i + 1 < max_iterations:
+            v = w / np.linalg.norm(w)
 
+    if return_history:
+        return lamb, v, history
     return lamb, v
 
 
+def batched_power_iteration(
+    A: np.ndarray,
+    max_iterations: int = 100,
+    v: np.ndarray = None,
+    tol: float = 1e-10,
+    rng: SeedLike = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Run power iteration on a stack of independent matrices at once
+
+    Every iteration is one broadcast matmul over the items which have not
+    converged yet. Once some items converge, the remaining ones are compacted
+    so that finished items stop costing work.
+
+    Args:
+        A (np.ndarray): a stack of square matrices of size batch-by-n-by-n
+        max_iterations (int, optional): maximum iterations. Defaults to 100.
+        v (np.ndarray, optional): initial guesses of size batch-by-n.
+            Defaults to None.
+        tol (float, optional): item i stops once its residual is at most tol
+            times the magnitude of its eigenvalue. Defaults to 1e-10.
+        rng (SeedLike, optional): a Generator or seed for the initial guesses,
+            see common.rng. Defaults to None.
+
+    Raises:
+        ValueError: raises if A is not a stack of square matrices or the
+            shape of v does not match.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        eigenvalues (np.ndarray): the maximum eigenvalue of every item.
+        eigenvectors (np.ndarray): the eigenvectors of size batch-by-n.
+        iterations (np.ndarray): the number of matrix-vector products of every item.
+        converged (np.ndarray): whether the tolerance was reached for every item.
+    """
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Batched power iteration expects a stack of square matrix.")
+    batch, n, _ = A.shape
+
+    if v is None:
+        v = default_rng(rng).random((batch, n))
+    elif v.shape != (batch, n):
+        raise ValueError("The shape of initial guesses does not match the input.")
+
+    dtype = float_dtype(A, v)
+    V = v / np.linalg.norm(v, axis=1, keepdims=True)
+    V = V.astype(dtype, copy=False)
+    eigenvalues = np.zeros(batch, dtype=dtype)
+    iterations = np.zeros(batch, dtype=int)
+    converged = np.zeros(batch, dtype=bool)
+
+    # the active items are kept contiguous, index maps them back to the batch
+    index = np.arange(batch)
+    A_active, V_active = A, V.copy()
+    for _ in range(max_iterations):
+        W = np.matmul(A_active, V_active[..., None])[..., 0]
+        lamb = np.einsum("bi,bi->b", V_active, W)
+        residuals = np.linalg.norm(W - lamb[:, None] * V_active, axis=1)
+        done = residuals <= tol * np.abs(lamb)
+
+        eigenvalues[index] = lamb
+        iterations[index] += 1
+        V[index] = V_active
+        converged[index[done]] = True
+
+        if done.any():
+            keep = ~done
+            if not keep.any():
+                break
+            index = index[keep]
+            A_active, W = A[index], W[keep]
+        V_active = W / np.linalg.norm(W, axis=1, keepdims=True)
+
+    return (eigenvalues, V, iterations, converged)
+
+
+def _tridiagonal_matvec(
+    lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, x: np.ndarray
+) -> np.ndarray:
+    """Multiply a tridiagonal matrix given by its diagonals with x in O(n)."""
+    y = diagonal * x
+    y[:-1] += upper * x[1:]
+    y[1:] += lower * x[:-1]
+    return y
+
+
+def _gmres(matvec, b: np.ndarray, tol: float = 1e-12, max_iterations: int = 50):
+    """Approximately solve Mx = b by GMRES without restarts.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 11.4.2
+    """
+    n = b.size
+    k = min(max_iterations, n)
+    beta = np.linalg.norm(b)
+    Q = np.zeros((n, k + 1), dtype=b.dtype)
+    H = np.zeros((k + 1, k), dtype=b.dtype)
+    Q[:, 0] = b / beta
+    e1 = np.zeros(k + 1)
+    e1[0] = beta
+    for j in range(k):
+        w = matvec(Q[:, j])
+        # modified Gram-Schmidt against the Krylov basis
+        for i in range(j + 1):
+            H[i, j] = Q[:, i] @ w
+            w = w - H[i, j] * Q[:, i]
+        H[j + 1, j] = np.linalg.norm(w)
+        y = np.linalg.lstsq(H[: j + 2, : j + 1], e1[: j + 2], rcond=None)[0]
+        if H[j + 1, j] <= tol * beta:
+            break
+        if np.linalg.norm(H[: j + 2, : j + 1] @ y - e1[: j + 2]) <= tol * beta:
+            break
+        Q[:, j + 1] = w / H[j + 1, j]
+
+    return Q[:, : y.size] @ y
+
+
+def _shifted_factorization(H: np.ndarray, shift: float, structure: str):
+    """Factor H - shift * I, where H is dense, Hessenberg or tridiagonal.
+
+    All three factorizations pivot, as H - shift * I is indefinite. Near
+    convergence the shift is an eigenvalue to working precision, so a tiny
+    pivot is expected: it is floored at eps * ||H - shift * I||, which only
+    amplifies the solve in the wanted eigenvector direction.
+    """
+    norm = max(np.max(np.abs(H)), abs(shift)) or 1.0
+    min_pivot = np.finfo(H.dtype).eps * norm
+    if structure == "tridiagonal":
+        n = H.shape[0]
+        ab = np.zeros((3, n), dtype=H.dtype)
+        ab[0, 1:] = np.diagonal(H, 1)
+        ab[1] = np.diagonal(H) - shift
+        ab[2, :-1] = np.diagonal(H, -1)
+        return banded_lu(ab, 1, 1, pivoting=True, min_pivot=min_pivot)
+
+    M = H - shift * np.eye(H.shape[0], dtype=H.dtype)
+    if structure == "hessenberg":
+        return hessenberg_lu(M, overwrite_h=True, min_pivot=min_pivot)
+    return partial_pivot_out_product_lu(M, overwrite_a=True, min_pivot=min_pivot)
+
+
 def rayleigh_quotient_iteration(
-    A: np.ndarray, max_iterations: int = 100, v: np.ndarray = None
+    A: np.ndarray,
+    max_iterations: int = 100,
+    v: np.ndarray = None,
+    tol: float = 1e-12,
+    shift_update_interval: int = 1,
+    hessenberg: bool = True,
+    rng: SeedLike = None,
 ) -> Tuple[float, np.ndarray]:
-    m, n = A.shape
+    """Find an eigenvalue and eigenvector close to the initial guess
+
+    Every iteration solves (A - lambda I) y = v with an LU factorization of
+    the shifted matrix. With hessenberg=True, A = Q H Q^T is reduced once in
+    O(n^3) and the iteration runs on H, where a factorization costs O(n^2),
+    or O(n) if A is symmetric and H is tridiagonal. The shift may be kept for
+    several iterations so that one factorization serves several solves.
+
+    Matrix-free operators are supported: the shifted systems are then solved
+    approximately by GMRES, which only needs matrix-vector products.
+
+    Args:
+        A (np.ndarray): an n-by-n matrix, or any operator exposing shape and
+            matvec, see common.linear_operator.
+        max_iterations (int, optional): maximum iterations. Defaults to 100.
+        v (np.ndarray): initial guess. Defaults to None.
+        tol (float, optional): stop once the residual ||Av - lambda v|| is at
+            most tol times the magnitude of the eigenvalue. Defaults to 1e-12.
+        shift_update_interval (int, optional): the number of iterations a
+            shift and its factorization are reused for. Defaults to 1.
+        hessenberg (bool, optional): reduce a dense A to Hessenberg form
+            first. Defaults to True.
+        rng (SeedLike, optional): a Generator or seed for the initial guess,
+            see common.rng. Defaults to None.
+
+    Returns:
+        Tuple[float, np.ndarray]: the eigenvalue and corresponding eigenvector.
+    """
+    dense = isinstance(A, np.ndarray)
+    op = aslinearoperator(A)
+    m, n = op.shape
     if m != n:
         raise ValueError("Rayleigh quotient iteration only supports square matrix.")
+    if shift_update_interval < 1:
+        raise ValueError("shift_update_interval should be a positive integer.")
 
     if v is None:
-        v = np.random.randn(n)
+        v = default_rng(rng).standard_normal(n)
     elif v.ndim != 1:
         raise ValueError("The initialization vector should be 1 dimensional.")
 
+    Q = None
+    structure = "dense"
+    if dense and hessenberg:
+        if np.allclose(A, A.T, rtol=0, atol=1e-12 * np.max(np.abs(A))):
+            A, Q = hessenberg_reduction((A + A.T) / 2)
+            structure = "tridiagonal"
+            diagonals = (np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1))
+            op = LinearOperator(A.shape, lambda x: _tridiagonal_matvec(*diagonals, x))
+        else:
+            A, Q = hessenberg_reduction(A)
+            structure = "hessenberg"
+            op = aslinearoperator(A)
+        v = Q.T @ v
+
     v = v / np.linalg.norm(v)
-    lamb: float = v.T @ A @ v
+    for i in range(max_iterations):
+        w = op.matvec(v)
+        lamb: float = v.T @ w
+        if np.linalg.norm(w - lamb * v) <= tol * abs(lamb):
+            break
 
-    for _ in range(max_iterations):
-        v = np.linalg.inv(A - lamb * np.eye(n)) @ v
+        if not dense:
+            v = _gmres(lambda x: op.matvec(x) - lamb * x, v)
+        else:
+            if i % shift_update_interval == 0:
+                factor = _shifted_factorization(A, lamb, structure)
+            v = factor.solve(v)
         v /= np.linalg.norm(v)
-        lamb = v.T @ A @ v
-
-        # residual = A @ v - lamb * v
+    else:
+        lamb = v.T @ op.matvec(v)
 
+    if Q is not None:
+        v = Q @ v
     return lamb, v
 
 
 def orthogonal_iteration(
-    A: np.ndarray, k: int = 1, max_iterations: int = 100, V: np.ndarray = None
-) -> Tuple[np.ndarray, np.ndarray]:
+    A: np.ndarray,
+    k: int = 1,
+    max_iterations: int = 100,
+    V: np.ndarray = None,
+    tol: float = None,
+    return_history: bool = False,
+    rng: SeedLike = None,
+) -> Union[
+    Tuple[np.ndarray, np.ndarray],
+    Tuple[np.ndarray, np.ndarray, ConvergenceHistory],
+]:
+    """Find an orthonormal basis of the dominant k-dimensional invariant subspace
+
+    Args:
+        A (np.ndarray): an n-by-n matrix, or any operator exposing shape and
+            matvec/matmat, see common.linear_operator.
+        k (int, optional): the dimension of the subspace. Defaults to 1.
+        max_iterations (int, optional): maximum iterations. Defaults to 100.
+        V (np.ndarray): initial basis of size n-by-k. Defaults to None.
+        tol (float, optional): stop once ||AQ - Q(Q^T AQ)|| is at most tol
+            times ||Q^T AQ||. Defaults to None, which runs all iterations.
+        return_history (bool, optional): also return the convergence history,
+            whose eigenvalues are the diagonals of Q^T AQ. Defaults to False.
+        rng (SeedLike, optional): a Generator or seed for the initial basis,
+            see common.rng. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Q of size n-by-k and the upper
+            triangular R of size k-by-k such that AQ is close to QR,
+            followed by a ConvergenceHistory if return_history is True.
+    """
+    A = aslinearoperator(A)
     m, n = A.shape
     if m != n:
         raise ValueError("Orthogonal iteration only supports square matrix.")
@@ -69,12 +378,22 @@ def orthogonal_iteration(
                 "The shape of initialization space does not match the input."
             )
     else:
-        V = np.random.randn(n, k)
+        V = default_rng(rng).standard_normal((n, k))
 
+    history = ConvergenceHistory()
     for i in range(max_iterations):
         Q, R = np.linalg.qr(V, "reduced")
         Q /= np.linalg.norm(Q, axis=0)
-        V = A @ Q
+        V = A.matmat(Q)
+
+        if tol is None and not return_history:
+            continue
+        T = Q.T @ V
+        history.append(np.diag(T), np.linalg.norm(V - Q @ T))
+        if tol is not None and history.residuals[-1] <= tol * np.linalg.norm(T):
+            history.converged = True
+            break
 
-        # residual = V - Q @ eigs
+    if return_history:
+        return Q, R, history
     return (Q, R)
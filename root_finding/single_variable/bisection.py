@@ -26,14 +26,18 @@ def bisection(
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Algorithm 2.1
     """
-    if f(a) * f(b) >= 0:
+    # carry f(a) along, so every iteration evaluates f only at the midpoint
+    fa, fb = f(a), f(b)
+    if fa * fb >= 0:
         raise ValueError("Bisection method fails.")
 
     p = (a + b) / 2
-    while abs(f(p)) > tol:
-        if f(a) * f(p) < 0:
+    fp = f(p)
+    while abs(fp) > tol:
+        if fa * fp < 0:
             b = p
         else:
-            a = p
+            a, fa = p, fp
         p = (a + b) / 2
-    return p, f(p)
+        fp = f(p)
+    return p, fp
@@ -22,10 +22,17 @@ def fix_point(f: Callable, x0: float, tol: float = 1e-6) -> float:
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Algorithm 2.2; Theorem 2.4
     """
-    x = x0
-    while abs(f(x) - x) > tol:
-        if abs(difference.numerical_gradient(f, x)) > 1:
+    # f is evaluated once per iteration: after the first step, the slope of
+    # f between the last two iterates, (f(x) - f(x_prev)) / (x - x_prev),
+    # replaces the numerical gradient and needs no extra evaluation
+    x, fx = x0, f(x0)
+    slope = difference.numerical_gradient(f, x0)
+    while abs(fx - x) > tol:
+        if abs(slope) > 1:
             raise ValueError("The fix point does not converge.")
-        x = f(x)
+        x_prev, fx_prev = x, fx
+        x = fx
+        fx = f(x)
+        slope = (fx - fx_prev) / (x - x_prev)
 
     return x
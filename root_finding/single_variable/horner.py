@@ -2,36 +2,83 @@ from typing import Callable, Tuple
 
 import numpy as np
 
+from common.dtype import float_dtype
 
-def horner(coeff_P: np.ndarray, x0: float) -> np.ndarray:
+
+def horner(coeff_P: np.ndarray, x0) -> np.ndarray:
     """
     Compute the evaluation of a polynomial P(x) using the Horner's method.
 
     Parameters:
         coeff_P (np.ndarray): The array of polynomial coefficients.
-            coeff_P[i] is the coefficient of x^i
-        x0 (float): The value at which the polynomial is evaluated.
+            coeff_P[..., i] is the coefficient of x^i, leading dimensions
+            hold a stack of polynomials.
+        x0 (float or np.ndarray): The value(s) at which the polynomial is evaluated,
+            broadcast against the leading dimensions of coeff_P.
 
     Returns:
         np.ndarray: The array of coefficients of the resulting polynomial Q(x) after the evaluation
             such that P(x) = (x - x0)Q(x) + P(x0)
 
     Remark:
-        coeff_Q.size = coeff_P.size - 1
+        coeff_Q.shape[-1] = coeff_P.shape[-1] - 1
 
     Reference:
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Theorem 2.19
     """
-    n = coeff_P.size - 1
-    coeff_Q = np.zeros(n)
-    coeff_Q[-1] = coeff_P[-1]
+    coeff_P = np.asarray(coeff_P)
+    x0 = np.asarray(x0)
+    n = coeff_P.shape[-1] - 1
+    shape = np.broadcast_shapes(coeff_P.shape[:-1], x0.shape)
+    coeff_Q = np.zeros(shape + (n,), dtype=float_dtype(coeff_P, x0))
+    coeff_Q[..., -1] = coeff_P[..., -1]
     for i in range(n - 2, -1, -1):
-        coeff_Q[i] = coeff_P[i + 1] + x0 * coeff_Q[i + 1]
+        coeff_Q[..., i] = coeff_P[..., i + 1] + x0 * coeff_Q[..., i + 1]
 
     return coeff_Q
 
 
+def horner_evaluate(coeff_P: np.ndarray, x, derivatives: int = 1) -> np.ndarray:
+    """
+    Evaluates polynomials and their derivatives at arrays of points using the Horner's method.
+
+    The recurrence runs once over the degree, every step updating the value
+    and all requested derivatives at every point at once.
+
+    Parameters:
+        coeff_P (np.ndarray): The array of polynomial coefficients in ascending order.
+            coeff_P[..., i] is the coefficient of x^i, leading dimensions
+            hold a stack of polynomials.
+        x (float or np.ndarray): The points, broadcast against the leading dimensions of coeff_P.
+        derivatives (int, optional): The number of derivatives to compute. Defaults to 1.
+
+    Returns:
+        np.ndarray: An array of shape (derivatives + 1,) + the broadcast shape,
+            whose k-th entry is the k-th derivative of P at the points.
+
+    Reference:
+        Press, William H., et al. Numerical Recipes. 3rd ed. Section 5.1
+    """
+    coeff_P = np.asarray(coeff_P)
+    x = np.asarray(x)
+    n = coeff_P.shape[-1] - 1
+    shape = np.broadcast_shapes(coeff_P.shape[:-1], x.shape)
+    # result[k] accumulates P^(k)(x) / k!
+    result = np.zeros((derivatives + 1,) + shape, dtype=float_dtype(coeff_P, x))
+    result[0] = coeff_P[..., n]
+    for i in range(n - 1, -1, -1):
+        for k in range(min(derivatives, n - i), 0, -1):
+            result[k] = result[k] * x + result[k - 1]
+        result[0] = result[0] * x + coeff_P[..., i]
+
+    factorial = 1
+    for k in range(2, derivatives + 1):
+        factorial *= k
+        result[k] *= factorial
+    return result
+
+
 def horner_method(coeff_P: np.ndarray, x0: float) -> Tuple[float, float]:
     """
     Calculates the value of a polynomial and its derivative at a given point using the Horner's Method.
@@ -40,21 +87,23 @@ def horner_method(coeff_P: np.ndarray, x0: float) -> Tuple[float, float]:
         coeff_P (np.ndarray): An array containing the coefficients of the polynomial in ascending order.
             coeff_P[i] is the coefficient of x^i
         x0 (float): The value at which the polynomial and its derivative are evaluated.
+            Arrays of points (or stacks of coefficients) give arrays of values,
+            see horner_evaluate.
 
     Returns:
         Tuple[float, float]: A tuple containing the value of the polynomial and its derivative at `x0`.
     """
-    coeff_Q = horner(coeff_P, x0)
-    n = coeff_P.size - 1
+    if np.ndim(x0) > 0 or np.ndim(coeff_P) > 1:
+        P_x0, dP_x0 = horner_evaluate(coeff_P, x0, derivatives=1)
+        return P_x0, dP_x0
 
-    P_x0 = coeff_P[-1]
+    # a scalar loop is cheaper than array operations for a single point
+    n = coeff_P.size - 1
+    P_x0, dP_x0 = coeff_P[-1], 0.0
     for i in range(n - 1, -1, -1):
+        dP_x0 = P_x0 + x0 * dP_x0
         P_x0 = coeff_P[i] + x0 * P_x0
 
-    dP_x0 = coeff_Q[-1]
-    for i in range(n - 2, -1, -1):
-        dP_x0 = coeff_Q[i] + x0 * dP_x0
-
     return P_x0, dP_x0
 
 
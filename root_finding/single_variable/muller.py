@@ -30,36 +30,37 @@ def muller_method(
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Algorithm 2.8
     """
+    # carry the function values along, one evaluation per iteration
+    f0, f1, f2 = f(x0), f(x1), f(x2)
     h1 = x1 - x0
     h2 = x2 - x1
-    delta1 = (f(x1) - f(x0)) / h1
-    delta2 = (f(x2) - f(x1)) / h2
+    delta1 = (f1 - f0) / h1
+    delta2 = (f2 - f1) / h2
     d = (delta2 - delta1) / (h2 + h1)
     iters = 3
 
     while iters <= max_iterations:
         b = delta2 + h2 * d
-        D = (b**2 - 4 * f(x2) * d) ** 0.5  # maybe complex
+        D = (b**2 - 4 * f2 * d) ** 0.5  # maybe complex
 
         if abs(b - D) < abs(b + D):
             E = b + D
         else:
-            E = b = D
+            E = b - D
 
-        h = -2 * f(x2) / E
+        h = -2 * f2 / E
         x = x2 + h
-        print(f"Iteration {iters}: x = {x:.2f}, f(x) = {f(x):.2f}")
 
         if abs(h) < tol:
             return x
 
-        x0 = x1
-        x1 = x2
-        x2 = x
+        x0, f0 = x1, f1
+        x1, f1 = x2, f2
+        x2, f2 = x, f(x)
         h1 = x1 - x0
         h2 = x2 - x1
-        delta1 = (f(x1) - f(x0)) / h1
-        delta2 = (f(x2) - f(x1)) / h2
+        delta1 = (f1 - f0) / h1
+        delta2 = (f2 - f1) / h2
         d = (delta2 - delta1) / (h2 + h1)
         iters += 1
 
@@ -27,15 +27,15 @@ def newton_method(
         Algorithm 2.3
 
     """
-    if df(x0) == 0:
-        raise ValueError("The derivative is zero.")
-    x = x0 - f(x0) / df(x0)
-    while abs(x - x0) > tol:
-        x0 = x
-        if df(x0) == 0:
+    f_x0, df_x0 = f(x0), df(x0)
+    while True:
+        if df_x0 == 0:
             raise ValueError("The derivative is zero.")
-        x = x0 - f(x0) / df(x0)
-    return x
+        x = x0 - f_x0 / df_x0
+        if abs(x - x0) <= tol:
+            return x
+        x0 = x
+        f_x0, df_x0 = f(x0), df(x0)
 
 
 def secant_method(
@@ -60,16 +60,16 @@ def secant_method(
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Algorithm 2.4
     """
-    if f(x0) == f(x1):
-        raise ValueError("The function is not differentiable.")
-    x = x1 - (f(x1) * (x1 - x0)) / (f(x1) - f(x0))
-    while abs(x - x1) > tol:
-        x0 = x1
-        x1 = x
-        if f(x1) == f(x0):
+    # carry the function values along, one evaluation per iteration
+    f_x0, f_x1 = f(x0), f(x1)
+    while True:
+        if f_x0 == f_x1:
             raise ValueError("The function is not differentiable.")
-        x = x1 - (f(x1) * (x1 - x0)) / (f(x1) - f(x0))
-    return x
+        x = x1 - (f_x1 * (x1 - x0)) / (f_x1 - f_x0)
+        if abs(x - x1) <= tol:
+            return x
+        x0, f_x0 = x1, f_x1
+        x1, f_x1 = x, f(x)
 
 
 def false_position(
@@ -94,17 +94,18 @@ def false_position(
         Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
         Algorithm 2.5
     """
-    if f(x0) == f(x1):
-        raise ValueError("The function is not differentiable.")
-    x = x1 - (f(x1) * (x1 - x0)) / (f(x1) - f(x0))
-    while abs(x - x1) > tol:
-        if f(x) * f(x1) < 0:
-            x0 = x1
-        x1 = x
-        if f(x1) == f(x0):
+    # carry the function values along, one evaluation per iteration
+    f_x0, f_x1 = f(x0), f(x1)
+    while True:
+        if f_x0 == f_x1:
             raise ValueError("The function is not differentiable.")
-        x = x1 - (f(x1) * (x1 - x0)) / (f(x1) - f(x0))
-    return x
+        x = x1 - (f_x1 * (x1 - x0)) / (f_x1 - f_x0)
+        if abs(x - x1) <= tol:
+            return x
+        f_x = f(x)
+        if f_x * f_x1 < 0:
+            x0, f_x0 = x1, f_x1
+        x1, f_x1 = x, f_x
 
 
 def newton_multiple_roots(
@@ -114,7 +115,46 @@ def newton_multiple_roots(
     x0: float,
     tol: float = 1e-6,
 ) -> float:
-    pass
+    """
+    Performs the modified Newton's method, which converges quadratically to multiple roots as well.
+
+    Newton's method is applied to mu(x) = f(x) / f'(x), whose roots are the
+    roots of f but all simple, which gives
+
+        x = x0 - f(x0) f'(x0) / (f'(x0)^2 - f(x0) f''(x0)).
+
+    Args:
+        f (Callable[[float], float]): The function for which we want to find the root.
+        df (Callable[[float], float]): The derivative of the function.
+        ddf (Callable[[float], float]): The second derivative of the function.
+        x0 (float): The initial guess for the root.
+        tol (float, optional): The tolerance for convergence. Defaults to 1e-6.
+
+    Returns:
+        float: The estimated root of the function.
+
+    Raises:
+        ValueError: If the denominator vanishes at any point during the iteration.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Section 2.4, Equation (2.13)
+    """
+
+    def step(x0: float) -> float:
+        f_x0, df_x0 = f(x0), df(x0)
+        if f_x0 == 0:
+            return x0
+        denominator = df_x0**2 - f_x0 * ddf(x0)
+        if denominator == 0:
+            raise ValueError("The denominator is zero.")
+        return x0 - f_x0 * df_x0 / denominator
+
+    x = step(x0)
+    while abs(x - x0) > tol:
+        x0 = x
+        x = step(x0)
+    return x
 
 
 if __name__ == "__main__":
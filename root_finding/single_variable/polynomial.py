@@ -0,0 +1,83 @@
+import numpy as np
+
+from root_finding.single_variable.horner import horner_evaluate
+
+
+def _newton_correction(coeff_P: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Computes P(z) / P'(z) without overflow for large |z|.
+
+    Outside the unit disk the reversed polynomial R(y) = y^n P(1/y) is
+    evaluated at y = 1/z instead, where P / P' = z R / (n R - y R').
+    """
+    n = coeff_P.size - 1
+    correction = np.empty_like(z)
+    inside = np.abs(z) <= 1
+    P, dP = horner_evaluate(coeff_P, z[inside])
+    correction[inside] = P / np.where(dP == 0, np.finfo(float).eps, dP)
+
+    y = 1 / z[~inside]
+    R, dR = horner_evaluate(coeff_P[::-1], y)
+    denominator = n * R - y * dR
+    denominator = np.where(denominator == 0, np.finfo(float).eps, denominator)
+    correction[~inside] = z[~inside] * R / denominator
+    return correction
+
+
+def polynomial_roots(
+    coeff_P: np.ndarray, tol: float = 1e-14, max_iterations: int = 500
+) -> np.ndarray:
+    """
+    Finds all real and complex roots of a polynomial with the Aberth-Ehrlich method.
+
+    All roots are refined simultaneously: every iteration evaluates P / P'
+    at all approximations at once with horner_evaluate, then applies
+
+        w_k = (P / P')(z_k) / (1 - (P / P')(z_k) sum_{j != k} 1 / (z_k - z_j)),
+
+    which converges cubically to simple roots without any deflation. Roots
+    whose correction falls below tol stop being updated. Zero roots, from
+    vanishing trailing coefficients, are split off exactly.
+
+    Parameters:
+        coeff_P (np.ndarray): The coefficients in ascending order, coeff_P[i] is the coefficient of x^i.
+        tol (float, optional): A root is converged once |w_k| <= tol |z_k|. Defaults to 1e-14.
+        max_iterations (int, optional): The maximum number of iterations. Defaults to 500.
+
+    Returns:
+        np.ndarray: The complex array of the n roots, with multiplicity.
+
+    Raises:
+        ValueError: If all coefficients are zero.
+
+    Reference:
+        Bini, Dario A. Numerical computation of polynomial zeros by means of
+        Aberth's method. Numerical Algorithms 13 (1996)
+    """
+    coeff_P = np.trim_zeros(np.asarray(coeff_P), "b")
+    if coeff_P.size == 0:
+        raise ValueError("The zero polynomial has no isolated roots.")
+    n_zero = coeff_P.size - np.trim_zeros(coeff_P, "f").size
+    coeff_P = coeff_P[n_zero:].astype(complex)
+    n = coeff_P.size - 1
+    if n == 0:
+        return np.zeros(n_zero, dtype=complex)
+
+    # start on a circle of radius the geometric mean of the root moduli,
+    # with an offset so that no start is real
+    radius = np.abs(coeff_P[0] / coeff_P[-1]) ** (1.0 / n)
+    z = radius * np.exp(1j * (2 * np.pi * np.arange(n) / n + 0.4))
+    active = np.ones(n, dtype=bool)
+    for _ in range(max_iterations):
+        correction = _newton_correction(coeff_P, z[active])
+        diff = z[active][:, None] - z[None, :]
+        diff[np.arange(diff.shape[0]), np.nonzero(active)[0]] = np.inf
+        w = correction / (1 - correction * np.sum(1 / diff, axis=1))
+        z[active] -= w
+
+        converged = np.abs(w) <= tol * np.abs(z[active])
+        active[np.nonzero(active)[0][converged]] = False
+        if not active.any():
+            break
+
+    return np.concatenate([np.zeros(n_zero, dtype=complex), z])
@@ -0,0 +1,260 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from common.dtype import float_dtype
+
+# status codes of every lane
+CONVERGED = 0
+MAX_ITERATIONS = 1
+ZERO_DERIVATIVE = 2  # the derivative, or the slope of the secant, vanished
+SIGN_ERROR = 3  # f(a) and f(b) do not have opposite signs
+
+ArrayFunction = Callable[..., np.ndarray]
+
+
+def _lanes(*arrays, args: Tuple = ()) -> Tuple[np.ndarray, ...]:
+    """Broadcast the inputs to flat float arrays over the lanes, after their shape.
+
+    The shape of the lanes is the broadcast shape of the inputs and args.
+    """
+    shape = np.broadcast_shapes(*[np.shape(x) for x in arrays + tuple(args)])
+    dtype = float_dtype(*[np.asarray(x) for x in arrays])
+    arrays = [np.broadcast_to(np.asarray(x, dtype=dtype), shape) for x in arrays]
+    return (shape,) + tuple(x.ravel().copy() for x in arrays)
+
+
+def _lane_function(f: ArrayFunction, args: Tuple, shape: Tuple[int, ...]):
+    """Bind the per-lane parameters, f(x, index) calls f(x, *args[index])."""
+    args = [np.broadcast_to(arg, shape).ravel() for arg in args]
+    return lambda x, index: f(x, *[arg[index] for arg in args])
+
+
+def bisection(
+    f: ArrayFunction,
+    a: np.ndarray,
+    b: np.ndarray,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+    args: Tuple = (),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Performs the bisection method on many independent brackets at once.
+
+    f is called once per iteration on the midpoints of the lanes which are
+    still active, converged lanes are retired from the arrays.
+
+    Parameters:
+        f (Callable[..., np.ndarray]): A vectorized function f(x, *args).
+        a (np.ndarray): The lower bounds of the intervals.
+        b (np.ndarray): The upper bounds of the intervals, broadcast with a.
+        tol (float, optional): A lane converges once |f(p)| <= tol. Defaults to 1e-6.
+        max_iterations (int, optional): The maximum number of iterations. Defaults to 100.
+        args (Tuple, optional): Per-lane parameters broadcast with the lanes, f is
+            called as f(x, *args) with the entries of the active lanes. Defaults to ().
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The roots, the number of
+            iterations and the status code of every lane, NaN roots for lanes
+            with SIGN_ERROR.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 2.1
+    """
+    shape, a, b = _lanes(a, b, args=args)
+    f = _lane_function(f, args, shape)
+    fa, fb = f(a, slice(None)), f(b, slice(None))
+    roots = np.full(a.size, np.nan, dtype=a.dtype)
+    iterations = np.zeros(a.size, dtype=int)
+    status = np.full(a.size, MAX_ITERATIONS)
+    bad = fa * fb >= 0
+    status[bad] = SIGN_ERROR
+
+    index = np.nonzero(~bad)[0]
+    a, b, fa = a[index], b[index], fa[index]
+    for _ in range(max_iterations):
+        if index.size == 0:
+            break
+        p = (a + b) / 2
+        fp = f(p, index)
+        roots[index] = p
+        iterations[index] += 1
+
+        done = np.abs(fp) <= tol
+        status[index[done]] = CONVERGED
+        left = fa * fp < 0
+        b = np.where(left, p, b)
+        a = np.where(left, a, p)
+        fa = np.where(left, fa, fp)
+
+        keep = ~done
+        index, a, b, fa = index[keep], a[keep], b[keep], fa[keep]
+
+    return roots.reshape(shape), iterations.reshape(shape), status.reshape(shape)
+
+
+def newton_method(
+    f: ArrayFunction,
+    df: ArrayFunction,
+    x0: np.ndarray,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+    args: Tuple = (),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Performs the Newton's method from many initial guesses at once.
+
+    f and df are each called once per iteration on the lanes which are still
+    active, converged lanes are retired from the arrays.
+
+    Parameters:
+        f (Callable[..., np.ndarray]): A vectorized function f(x, *args).
+        df (Callable[..., np.ndarray]): Its vectorized derivative df(x, *args).
+        x0 (np.ndarray): The initial guesses.
+        tol (float, optional): A lane converges once |x_{k+1} - x_k| <= tol. Defaults to 1e-6.
+        max_iterations (int, optional): The maximum number of iterations. Defaults to 100.
+        args (Tuple, optional): Per-lane parameters broadcast with the lanes, f is
+            called as f(x, *args) with the entries of the active lanes. Defaults to ().
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The roots, the number of
+            iterations and the status code of every lane.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 2.3
+    """
+    shape, x = _lanes(x0, args=args)
+    f, df = _lane_function(f, args, shape), _lane_function(df, args, shape)
+    iterations = np.zeros(x.size, dtype=int)
+    status = np.full(x.size, MAX_ITERATIONS)
+
+    index = np.arange(x.size)
+    for _ in range(max_iterations):
+        if index.size == 0:
+            break
+        fx, dfx = f(x[index], index), df(x[index], index)
+        iterations[index] += 1
+        zero = dfx == 0
+        step = fx / np.where(zero, 1, dfx)
+        x[index] -= np.where(zero, 0, step)
+
+        done = np.abs(step) <= tol
+        status[index[zero]] = ZERO_DERIVATIVE
+        status[index[done & ~zero]] = CONVERGED
+        index = index[~(done | zero)]
+
+    return x.reshape(shape), iterations.reshape(shape), status.reshape(shape)
+
+
+def _secant_iteration(
+    f: ArrayFunction,
+    x0: np.ndarray,
+    x1: np.ndarray,
+    tol: float,
+    max_iterations: int,
+    args: Tuple,
+    false_position: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    shape, x0, x1 = _lanes(x0, x1, args=args)
+    f = _lane_function(f, args, shape)
+    f0, f1 = f(x0, slice(None)), f(x1, slice(None))
+    x = x1.copy()
+    iterations = np.zeros(x.size, dtype=int)
+    status = np.full(x.size, MAX_ITERATIONS)
+
+    index = np.arange(x.size)
+    for _ in range(max_iterations):
+        if index.size == 0:
+            break
+        flat = f1 == f0
+        p = x1 - f1 * (x1 - x0) / np.where(flat, 1, f1 - f0)
+        x[index] = np.where(flat, x1, p)
+        iterations[index] += 1
+
+        done = np.abs(p - x1) <= tol
+        status[index[flat]] = ZERO_DERIVATIVE
+        status[index[done & ~flat]] = CONVERGED
+        keep = ~(done | flat)
+        index, p = index[keep], p[keep]
+        x0, f0, x1, f1 = x0[keep], f0[keep], x1[keep], f1[keep]
+
+        fp = f(p, index)
+        if false_position:
+            # keep the root bracketed by [x0, x1]
+            switch = fp * f1 < 0
+            x0, f0 = np.where(switch, x1, x0), np.where(switch, f1, f0)
+        else:
+            x0, f0 = x1, f1
+        x1, f1 = p, fp
+
+    return x.reshape(shape), iterations.reshape(shape), status.reshape(shape)
+
+
+def secant_method(
+    f: ArrayFunction,
+    x0: np.ndarray,
+    x1: np.ndarray,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+    args: Tuple = (),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Performs the secant method from many pairs of initial guesses at once.
+
+    f is called once per iteration on the lanes which are still active,
+    converged lanes are retired from the arrays.
+
+    Parameters:
+        f (Callable[..., np.ndarray]): A vectorized function f(x, *args).
+        x0 (np.ndarray): The first initial guesses.
+        x1 (np.ndarray): The second initial guesses, broadcast with x0.
+        tol (float, optional): A lane converges once |x_{k+1} - x_k| <= tol. Defaults to 1e-6.
+        max_iterations (int, optional): The maximum number of iterations. Defaults to 100.
+        args (Tuple, optional): Per-lane parameters broadcast with the lanes, f is
+            called as f(x, *args) with the entries of the active lanes. Defaults to ().
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The roots, the number of
+            iterations and the status code of every lane.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 2.4
+    """
+    return _secant_iteration(f, x0, x1, tol, max_iterations, args, False)
+
+
+def false_position(
+    f: ArrayFunction,
+    x0: np.ndarray,
+    x1: np.ndarray,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+    args: Tuple = (),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Performs the false position method on many independent brackets at once.
+
+    f is called once per iteration on the lanes which are still active,
+    converged lanes are retired from the arrays.
+
+    Parameters:
+        f (Callable[..., np.ndarray]): A vectorized function f(x, *args).
+        x0 (np.ndarray): The first ends of the brackets.
+        x1 (np.ndarray): The second ends of the brackets, broadcast with x0.
+        tol (float, optional): A lane converges once |x_{k+1} - x_k| <= tol. Defaults to 1e-6.
+        max_iterations (int, optional): The maximum number of iterations. Defaults to 100.
+        args (Tuple, optional): Per-lane parameters broadcast with the lanes, f is
+            called as f(x, *args) with the entries of the active lanes. Defaults to ().
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The roots, the number of
+            iterations and the status code of every lane.
+
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Algorithm 2.5
+    """
+    return _secant_iteration(f, x0, x1, tol, max_iterations, args, True)
@@ -0,0 +1,108 @@
+from typing import Tuple
+
+import numpy as np
+
+from common.dtype import float_dtype
+
+from banded_lu import BandedLUFactorization, banded_lu
+
+
+def _symmetric_structure(
+    indptr: np.ndarray, indices: np.ndarray, n: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the CSR structure of the graph of A + A^T without self loops."""
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    edges = np.concatenate([rows * n + indices, indices * n + rows])
+    edges = np.unique(edges)
+    rows, cols = edges // n, edges % n
+    rows, cols = rows[rows != cols], cols[rows != cols]
+    indptr = np.zeros(n + 1, dtype=int)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return (indptr, cols)
+
+
+def reverse_cuthill_mckee(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Order the nodes of a symmetric sparsity pattern to reduce its bandwidth
+
+    Each connected component is traversed breadth first from a node of
+    minimum degree, visiting neighbours by increasing degree, and the
+    resulting order is reversed.
+
+    Args:
+        indptr (np.ndarray): the CSR row pointer of a symmetric pattern.
+        indices (np.ndarray): the CSR column indices of a symmetric pattern.
+
+    Returns:
+        np.ndarray: perm such that A[perm][:, perm] has a small bandwidth.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Section 11.1.3
+    """
+    n = indptr.size - 1
+    degree = np.diff(indptr)
+    visited = np.zeros(n, dtype=bool)
+    order = []
+    for start in np.argsort(degree, kind="stable"):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            neighbours = indices[indptr[node] : indptr[node + 1]]
+            neighbours = neighbours[~visited[neighbours]]
+            neighbours = neighbours[np.argsort(degree[neighbours], kind="stable")]
+            visited[neighbours] = True
+            queue.extend(neighbours.tolist())
+        order.extend(queue)
+
+    return np.array(order[::-1], dtype=int)
+
+
+def sparse_lu(A) -> BandedLUFactorization:
+    """Compute the LU decomposition of a sparse matrix stored in CSR/CSC format
+
+    The matrix is reordered symmetrically by reverse Cuthill-McKee, which
+    confines the entries, and therefore all the fill-in of elimination
+    without pivoting, to a narrow band. The permuted entries are scattered
+    directly into band storage and factored by banded_lu, so the dense
+    matrix is never formed.
+
+    Args:
+        A: an square sparse matrix providing tocsr(), e.g. a scipy.sparse
+            CSR or CSC matrix. No pivoting is done, so A should not need it
+            (e.g. diagonally dominant or symmetric positive definite).
+
+    Raises:
+        ValueError: raises if A is not a square matrix.
+        ZeroDivisionError: raises if a pivot of the reordered matrix is zero
+
+    Returns:
+        BandedLUFactorization: the factors of A[perm][:, perm] and perm.
+    """
+    m, n = A.shape
+
+    if m != n:
+        raise ValueError("LU decomposition is only valid for square matrix.")
+
+    csr = A.tocsr()
+    indptr = np.asarray(csr.indptr)
+    indices = np.asarray(csr.indices)
+    perm = reverse_cuthill_mckee(*_symmetric_structure(indptr, indices, n))
+
+    inverse = np.empty(n, dtype=int)
+    inverse[perm] = np.arange(n)
+    i = inverse[np.repeat(np.arange(n), np.diff(indptr))]
+    j = inverse[indices]
+    kl = int(max(np.max(i - j, initial=0), 0))
+    ku = int(max(np.max(j - i, initial=0), 0))
+
+    ab = np.zeros((kl + ku + 1, n), dtype=float_dtype(csr.dtype))
+    # duplicated entries of the CSR format are summed
+    np.add.at(ab, (ku + i - j, j), csr.data)
+
+    factor = banded_lu(ab, kl, ku, overwrite_ab=True)
+    factor.perm = perm
+    return factor
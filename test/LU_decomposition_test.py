@@ -4,6 +4,14 @@ import numpy as np
 
 from LU_decomposition import out_product_lu, gaussian_lu, gaxpy_LU
 from LU_decomposition import rectangular_lu
+from LU_decomposition import recursive_block_lu, non_recursive_block_lu
+from LU_decomposition import lu_factor, parallel_block_lu
+from LU_decomposition import partial_pivot_out_product_lu, partial_pivot_gaxpy_lu
+from LU_decomposition import complete_pivot_out_product_lu, complete_pivot_gaxpy_lu
+from LU_decomposition import rook_pivot_out_product_lu
+from LU_decomposition import batched_out_product_lu, batched_partial_pivot_lu
+from LU_decomposition import solve_refined
+from common.pivot import check_pivot
 
 
 class TestLUDecomposition(unittest.TestCase):
@@ -78,6 +86,175 @@ class TestLUDecomposition(unittest.TestCase):
         np.testing.assert_array_almost_equal(real_L, test_L, decimal=3)
         np.testing.assert_array_almost_equal(real_U, test_U, decimal=3)
 
+    def test_recursive_block(self):
+        for block_size in [1, 2, 5]:
+            test_L, test_U = recursive_block_lu(self.P.T @ self.B, block_size)
+            np.testing.assert_array_almost_equal(self.real_L, test_L, decimal=3)
+            np.testing.assert_array_almost_equal(self.real_U, test_U, decimal=3)
+
+    def test_non_recursive_block(self):
+        for block_size in [1, 2, 5]:
+            test_L, test_U = non_recursive_block_lu(self.P.T @ self.B, block_size)
+            np.testing.assert_array_almost_equal(self.real_L, test_L, decimal=3)
+            np.testing.assert_array_almost_equal(self.real_U, test_U, decimal=3)
+
+    def test_block_large(self):
+        n = 100
+        A = np.random.rand(n, n) + n * np.eye(n)
+        real_L, real_U = out_product_lu(A.copy())
+        for lu in [recursive_block_lu, non_recursive_block_lu]:
+            test_L, test_U = lu(A.copy(), block_size=16)
+            np.testing.assert_array_almost_equal(real_L, test_L)
+            np.testing.assert_array_almost_equal(real_U, test_U)
+
+    def test_parallel_block(self):
+        n = 100
+        A = np.random.rand(n, n) + n * np.eye(n)
+        real_L, real_U = out_product_lu(A.copy())
+        for block_size, n_workers in [(7, 1), (16, 4), (128, 2)]:
+            test_L, test_U = parallel_block_lu(A.copy(), block_size, n_workers)
+            np.testing.assert_array_almost_equal(real_L, test_L)
+            np.testing.assert_array_almost_equal(real_U, test_U)
+
+        factor = lu_factor(A, block_size=10, n_workers=3)
+        np.testing.assert_array_almost_equal(real_U, factor.U)
+
+    def test_lu_factor(self):
+        A = self.P.T @ self.B
+        factor = lu_factor(A, block_size=2)
+        np.testing.assert_array_almost_equal(self.real_L, factor.L, decimal=3)
+        np.testing.assert_array_almost_equal(self.real_U, factor.U, decimal=3)
+        np.testing.assert_array_equal(A, self.P.T @ self.B)
+
+        test_L, test_U = factor
+        np.testing.assert_array_almost_equal(test_L @ test_U, A, decimal=3)
+
+    def test_lu_factor_in_place(self):
+        A = self.P.T @ self.B
+        factor = lu_factor(A, overwrite_a=True)
+        self.assertIs(factor.lu, A)
+        np.testing.assert_array_almost_equal(self.real_U, np.triu(A), decimal=3)
+
+        out = np.empty_like(A)
+        factor = lu_factor(self.P.T @ self.B, out=out)
+        self.assertIs(factor.lu, out)
+        np.testing.assert_array_almost_equal(self.real_L, factor.L, decimal=3)
+
+    def test_partial_pivot(self):
+        for lu in [partial_pivot_out_product_lu, partial_pivot_gaxpy_lu]:
+            factor = lu(self.A)
+            np.testing.assert_array_almost_equal(self.real_L, factor.L, decimal=3)
+            np.testing.assert_array_almost_equal(self.real_U, factor.U, decimal=3)
+            np.testing.assert_array_almost_equal(
+                factor.L @ factor.U, self.A[factor.perm], decimal=3
+            )
+            np.testing.assert_array_equal(self.A, self.B)
+
+    def test_solve(self):
+        b = np.arange(5.0)
+        B = np.random.rand(5, 3)
+        for lu in [partial_pivot_out_product_lu, partial_pivot_gaxpy_lu]:
+            factor = lu(self.A)
+            np.testing.assert_array_almost_equal(
+                factor.solve(b), np.linalg.solve(self.A, b)
+            )
+            np.testing.assert_array_almost_equal(
+                factor.solve(B), np.linalg.solve(self.A, B)
+            )
+
+        factor = lu_factor(self.P.T @ self.A)
+        np.testing.assert_array_almost_equal(
+            factor.solve(b), np.linalg.solve(self.P.T @ self.A, b)
+        )
+
+    def test_two_sided_pivot(self):
+        b = np.arange(5.0)
+        for lu in [
+            complete_pivot_out_product_lu,
+            complete_pivot_gaxpy_lu,
+            rook_pivot_out_product_lu,
+        ]:
+            factor = lu(self.A)
+            L, U = factor
+            np.testing.assert_array_almost_equal(
+                L @ U, self.A[factor.perm][:, factor.col_perm], decimal=3
+            )
+            # each pivot dominates its row and column of the Schur complement.
+            self.assertTrue(np.all(np.abs(L) <= 1.0))
+            for k in range(5):
+                self.assertTrue(np.all(np.abs(U[k, k:]) <= abs(U[k, k])))
+            np.testing.assert_array_almost_equal(
+                factor.solve(b), np.linalg.solve(self.A, b)
+            )
+
+    def test_complete_pivot(self):
+        factor = complete_pivot_out_product_lu(self.A)
+        self.assertEqual(abs(factor.U[0, 0]), np.max(np.abs(self.A)))
+
+    def test_batched_out_product(self):
+        A = np.stack([self.P.T @ self.A, np.zeros((5, 5)), self.P.T @ self.A])
+        test_L, test_U, info = batched_out_product_lu(A)
+        np.testing.assert_array_equal(info, [0, 1, 0])
+        for i in [0, 2]:
+            np.testing.assert_array_almost_equal(self.real_L, test_L[i], decimal=3)
+            np.testing.assert_array_almost_equal(self.real_U, test_U[i], decimal=3)
+
+    def test_batched_partial_pivot(self):
+        A = np.random.randn(20, 4, 4)
+        A[7, :, 2] = 0.0
+        test_L, test_U, perm, info = batched_partial_pivot_lu(A)
+        self.assertEqual(info[7], 3)
+        for i in range(20):
+            if i == 7:
+                continue
+            self.assertEqual(info[i], 0)
+            P, real_L, real_U = la.lu(A[i])
+            np.testing.assert_array_almost_equal(real_L, test_L[i])
+            np.testing.assert_array_almost_equal(real_U, test_U[i])
+            np.testing.assert_array_almost_equal(A[i][perm[i]], P.T @ A[i])
+
+    def test_dtype(self):
+        A = (self.P.T @ self.A).astype(np.float32)
+        for lu in [gaussian_lu, out_product_lu, gaxpy_LU, non_recursive_block_lu]:
+            test_L, test_U = lu(A.copy())
+            self.assertEqual(test_L.dtype, np.float32)
+            self.assertEqual(test_U.dtype, np.float32)
+            np.testing.assert_array_almost_equal(self.real_U, test_U, decimal=2)
+        factor = partial_pivot_out_product_lu(self.A.astype(np.float32))
+        self.assertEqual(factor.lu.dtype, np.float32)
+
+        # integer input is promoted instead of being truncated.
+        A = np.array([[2, 1], [1, 3]])
+        test_L, test_U = out_product_lu(A)
+        np.testing.assert_array_almost_equal(test_L, [[1, 0], [0.5, 1]])
+        np.testing.assert_array_almost_equal(test_U, [[2, 1], [0, 2.5]])
+
+    def test_pivot_threshold(self):
+        # the threshold reaches the triangular solves, too
+        A = np.array([[1.0, 1.0], [1.0, 1.0 + 1e-10]])
+        with self.assertRaises(ZeroDivisionError):
+            partial_pivot_out_product_lu(A)
+        factor = partial_pivot_out_product_lu(A, tol=1e-12)
+        np.testing.assert_array_almost_equal(A @ factor.solve(A[:, 0]), A[:, 0])
+
+        factor = partial_pivot_out_product_lu(np.ones((2, 2)), min_pivot=1e-10)
+        self.assertEqual(1e-10, factor.lu[1, 1])
+        np.testing.assert_array_almost_equal([1.0, 0.0], factor.solve(np.ones(2)))
+
+        # a floored pivot keeps its phase
+        self.assertAlmostEqual(1e-6j, check_pivot(1e-12j, min_pivot=1e-6))
+        self.assertEqual(1e-6, check_pivot(0.0, min_pivot=1e-6))
+        self.assertEqual(-0.5, check_pivot(-0.5, min_pivot=1e-6))
+
+    def test_solve_refined(self):
+        A = np.random.randn(50, 50)
+        x = np.random.randn(50)
+        test_x, iterations, residual_norms = solve_refined(A, A @ x)
+        self.assertEqual(test_x.dtype, np.float64)
+        self.assertEqual(residual_norms.size, iterations + 1)
+        self.assertLess(residual_norms[-1], residual_norms[0])
+        np.testing.assert_array_almost_equal(x, test_x, decimal=10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,106 @@
+import scipy.sparse as sp
+import unittest
+import numpy as np
+
+from LU_decomposition import lu_factor, out_product_lu
+from banded_lu import BandedLUFactorization, banded_lu, bandwidth, to_banded
+from banded_lu import thomas_algorithm
+from sparse_lu import sparse_lu
+
+
+class TestBandedLU(unittest.TestCase):
+    def setUp(self):
+        self.n = 60
+        self.rng = np.random.default_rng(0)
+        self.kl, self.ku = 3, 2
+        A = self.rng.random((self.n, self.n)) + 10 * np.eye(self.n)
+        self.A = np.triu(np.tril(A, self.ku), -self.kl)
+        self.b = self.rng.random(self.n)
+
+    def test_bandwidth(self):
+        self.assertEqual(bandwidth(self.A), (self.kl, self.ku))
+        self.assertEqual(bandwidth(self.A, chunk_size=7), (self.kl, self.ku))
+        self.assertEqual(bandwidth(np.eye(4)), (0, 0))
+
+    def test_banded_lu(self):
+        real_L, real_U = out_product_lu(self.A.copy())
+        factor = banded_lu(to_banded(self.A, self.kl, self.ku), self.kl, self.ku)
+        np.testing.assert_array_almost_equal(real_L, factor.L)
+        np.testing.assert_array_almost_equal(real_U, factor.U)
+        np.testing.assert_array_almost_equal(
+            factor.solve(self.b), np.linalg.solve(self.A, self.b)
+        )
+
+    def test_banded_lu_pivoting(self):
+        # a zero diagonal needs row interchanges
+        A = self.A - np.diag(np.diagonal(self.A))
+        factor = banded_lu(
+            to_banded(A, self.kl, self.ku), self.kl, self.ku, pivoting=True
+        )
+        self.assertEqual(factor.ku, self.kl + self.ku)
+        np.testing.assert_array_almost_equal(A[factor.row_perm], factor.L @ factor.U)
+        np.testing.assert_array_almost_equal(
+            factor.solve(self.b), np.linalg.solve(A, self.b)
+        )
+        with self.assertRaises(ZeroDivisionError):
+            banded_lu(to_banded(A, self.kl, self.ku), self.kl, self.ku)
+
+    def test_banded_lu_min_pivot(self):
+        # a singular tridiagonal matrix, inverse iteration style
+        T = np.diag(np.ones(5)) - np.diag(np.ones(4), 1)
+        T[-1, -1] = 0.0
+        with self.assertRaises(ZeroDivisionError):
+            banded_lu(to_banded(T, 1, 1), 1, 1, pivoting=True)
+        factor = banded_lu(to_banded(T, 1, 1), 1, 1, pivoting=True, min_pivot=1e-12)
+        x = factor.solve(np.ones(5))
+        # the solution points along the null vector of T
+        np.testing.assert_array_almost_equal(x / np.linalg.norm(x), np.ones(5) / 5**0.5)
+
+    def test_thomas(self):
+        T = np.triu(np.tril(self.A, 1), -1)
+        diagonals = (np.diagonal(T, -1), np.diagonal(T), np.diagonal(T, 1))
+        x = thomas_algorithm(*diagonals, self.b)
+        np.testing.assert_array_almost_equal(T @ x, self.b)
+        B = self.rng.random((self.n, 3))
+        X = thomas_algorithm(*diagonals, B)
+        np.testing.assert_array_almost_equal(T @ X, B)
+
+    def test_sparse_lu(self):
+        perm = self.rng.permutation(self.n)
+        A = sp.csc_matrix(self.A[perm][:, perm])
+        factor = sparse_lu(A)
+        self.assertLessEqual(factor.kl + factor.ku, 2 * (self.kl + self.ku))
+        np.testing.assert_array_almost_equal(A @ factor.solve(self.b), self.b)
+
+    def test_lu_factor_structure(self):
+        for structure in ["auto", "banded"]:
+            factor = lu_factor(self.A, structure=structure)
+            self.assertIsInstance(factor, BandedLUFactorization)
+            self.assertEqual((factor.kl, factor.ku), (self.kl, self.ku))
+        self.assertIsInstance(lu_factor(sp.csr_matrix(self.A)), BandedLUFactorization)
+        for factor in [
+            lu_factor(self.A, structure="dense"),
+            lu_factor(self.A.copy(), overwrite_a=True),
+        ]:
+            self.assertNotIsInstance(factor, BandedLUFactorization)
+            np.testing.assert_array_almost_equal(
+                factor.solve(self.b), np.linalg.solve(self.A, self.b)
+            )
+        with self.assertRaises(ValueError):
+            lu_factor(self.A, out=np.empty_like(self.A), structure="banded")
+
+    def test_lu_factor_tridiagonal(self):
+        # the Thomas fast path honors the contract of the dense factors
+        T = np.triu(np.tril(self.A, 1), -1)
+        factor = lu_factor(T)
+        self.assertEqual((factor.kl, factor.ku), (1, 1))
+        L, U = factor
+        np.testing.assert_array_almost_equal(L @ U, T)
+        np.testing.assert_array_almost_equal(T @ factor.solve(self.b), self.b)
+        A = T.copy()
+        factor = lu_factor(A, overwrite_a=True)
+        self.assertIs(factor.lu, A)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+
+from interpolation.barycentric import BarycentricInterpolator
+
+
+class TestBarycentricInterpolator(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.nodes = np.cos(np.pi * np.arange(21) / 20)
+        self.x = np.linspace(-1.0, 1.0, 1001)
+
+    def test_polynomial(self):
+        coeff = self.rng.standard_normal(21)
+        P = BarycentricInterpolator(self.nodes, np.polyval(coeff, self.nodes))
+        np.testing.assert_array_almost_equal(P(self.x), np.polyval(coeff, self.x))
+        # the nodes themselves are reproduced exactly
+        np.testing.assert_array_equal(P(self.nodes), P.values)
+
+    def test_runge(self):
+        nodes = np.cos(np.pi * np.arange(201) / 200)
+        P = BarycentricInterpolator(nodes, 1.0 / (1.0 + 25.0 * nodes**2))
+        np.testing.assert_array_almost_equal(
+            P(self.x), 1.0 / (1.0 + 25.0 * self.x**2), decimal=10
+        )
+
+    def test_many_nodes(self):
+        nodes = np.cos(np.pi * np.arange(3000) / 2999)
+        P = BarycentricInterpolator(nodes, np.sin(nodes))
+        self.assertTrue(np.all(np.isfinite(P.weights)))
+        np.testing.assert_array_almost_equal(P(self.x), np.sin(self.x), decimal=12)
+
+    def test_add_node(self):
+        P = BarycentricInterpolator(self.nodes[:-1], np.exp(self.nodes[:-1]))
+        P.add_node(self.nodes[-1], np.exp(self.nodes[-1]))
+        Q = BarycentricInterpolator(self.nodes, np.exp(self.nodes))
+        np.testing.assert_array_almost_equal(P.weights, Q.weights)
+        np.testing.assert_array_almost_equal(P(self.x), Q(self.x))
+        with self.assertRaises(ValueError):
+            P.add_node(self.nodes[0], 0.0)
+
+    def test_chunks_and_shapes(self):
+        values = np.column_stack([np.sin(self.nodes), np.cos(self.nodes)])
+        P = BarycentricInterpolator(self.nodes, values)
+        x = self.x.reshape(7, 11, 13)
+        result = P(x, chunk_size=100)
+        self.assertEqual((7, 11, 13, 2), result.shape)
+        np.testing.assert_array_almost_equal(result, P(x))
+        np.testing.assert_array_almost_equal(result[..., 0], np.sin(x))
+
+    def test_duplicate_nodes(self):
+        with self.assertRaises(ValueError):
+            BarycentricInterpolator([0.0, 1.0, 0.0], [1.0, 2.0, 3.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
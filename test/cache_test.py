@@ -0,0 +1,87 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from common.cache import EvaluationCache
+from common.evaluation import CountingFunction
+
+
+class TestEvaluationCache(unittest.TestCase):
+    def setUp(self):
+        self.f = CountingFunction(lambda x: np.sin(x))
+
+    def test_hits(self):
+        cache = EvaluationCache(self.f)
+        for x in [1.0, 2.0, 1.0, 1.0]:
+            self.assertEqual(math.sin(x), cache(x))
+        self.assertEqual((2, 2, 2), (self.f.calls, cache.hits, cache.misses))
+        self.assertEqual(0.5, cache.hit_rate)
+
+        x = np.array([1.0, 2.0])
+        np.testing.assert_array_equal(np.sin(x), cache(x))
+        cache(x.copy())
+        self.assertEqual(3, self.f.calls)
+
+    def test_lru(self):
+        cache = EvaluationCache(self.f, max_size=2)
+        for x in [1.0, 2.0, 1.0, 3.0, 1.0, 2.0]:
+            cache(x)
+        # 2.0 was evicted by 3.0, 1.0 was kept as recently used
+        self.assertEqual(4, self.f.calls)
+        self.assertEqual(2, len(cache))
+        cache.clear()
+        self.assertEqual((0, 0, 0), (len(cache), cache.hits, cache.misses))
+
+    def test_tolerance(self):
+        cache = EvaluationCache(self.f, tol=1e-6)
+        cache(1.0)
+        cache(1.0 + 1e-8)
+        cache(1.0 + 1e-8j)
+        cache(1.0 + 1e-3)
+        self.assertEqual(2, self.f.calls)
+        cache(1e-12)
+        cache(-1e-12)
+        self.assertEqual(3, self.f.calls)
+
+    def test_large_and_non_finite(self):
+        f = CountingFunction(lambda x: x)
+        cache = EvaluationCache(f, tol=1e-9)
+        for x in [1e10, 2e10, -5e12, 1e300, np.inf, -np.inf, np.nan]:
+            np.testing.assert_array_equal(x, cache(x))
+        self.assertEqual(7, f.calls)
+        np.testing.assert_array_equal(np.nan, cache(np.nan))
+        self.assertEqual(1e300, cache(1e300))
+        self.assertEqual(2, cache.hits)
+
+    def test_read_only(self):
+        x = np.array([1.0, 2.0])
+        cache = EvaluationCache(self.f)
+        with self.assertRaises(ValueError):
+            cache(x)[0] = 0.0
+        np.testing.assert_array_equal(np.sin(x), cache(x))
+
+    def test_persistence(self):
+        cache = EvaluationCache(self.f, tol=1e-9)
+        cache(1.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.pkl")
+            cache.save(path)
+            restored = EvaluationCache(self.f, tol=1e-9)
+            restored.load(path)
+            self.assertEqual(math.sin(1.0), restored(1.0))
+            self.assertEqual((1, 1), (self.f.calls, restored.hits))
+
+            cache(np.array([1.0, 2.0]))
+            cache.save(path)
+            restored.load(path)
+            with self.assertRaises(ValueError):
+                restored(np.array([1.0, 2.0]))[0] = 0.0
+            with self.assertRaises(ValueError):
+                EvaluationCache(self.f).load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
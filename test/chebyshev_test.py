@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+
+from interpolation.chebyshev import (
+    ChebyshevInterpolant,
+    chebyshev_coefficients,
+    chebyshev_points,
+    clenshaw,
+)
+
+
+class TestChebyshev(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.x = np.linspace(-1.0, 1.0, 1001)
+
+    def test_coefficients(self):
+        coefficients = self.rng.standard_normal(16)
+        values = np.polynomial.chebyshev.chebval(chebyshev_points(16), coefficients)
+        np.testing.assert_array_almost_equal(
+            chebyshev_coefficients(values), coefficients
+        )
+
+    def test_clenshaw(self):
+        coefficients = self.rng.standard_normal(30)
+        np.testing.assert_array_almost_equal(
+            clenshaw(coefficients, self.x),
+            np.polynomial.chebyshev.chebval(self.x, coefficients),
+        )
+
+    def test_interpolant(self):
+        p = ChebyshevInterpolant.from_function(np.exp, 30, 0.0, 2.0)
+        x = np.linspace(0.0, 2.0, 1001).reshape(7, 11, 13)
+        np.testing.assert_array_almost_equal(p(x), np.exp(x), decimal=12)
+
+        # the Runge function, hopeless for equispaced nodes
+        runge = lambda x: 1.0 / (1.0 + 25.0 * x**2)
+        p = ChebyshevInterpolant.from_function(runge, 2000)
+        np.testing.assert_array_almost_equal(p(self.x), runge(self.x), decimal=12)
+        np.testing.assert_array_almost_equal(
+            p(chebyshev_points(2000)), runge(chebyshev_points(2000))
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            chebyshev_points(1)
+        with self.assertRaises(ValueError):
+            ChebyshevInterpolant(np.ones(3), 1.0, -1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
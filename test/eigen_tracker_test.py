@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+from eigen_tracker import EigenTracker
+
+
+class TestEigenTracker(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        n = 20
+        Q, _ = np.linalg.qr(self.rng.standard_normal((n, n)))
+        self.A = Q @ np.diag(np.linspace(1.0, 2.0, n)) @ Q.T
+        self.E = self.rng.standard_normal((n, n))
+        self.E = (self.E + self.E.T) * 1e-4
+
+    def test_power_iteration(self):
+        tracker = EigenTracker()
+        for t in range(5):
+            A = self.A + t * self.E
+            lamb, v = tracker.power_iteration("A", A, max_iterations=5000)
+            self.assertAlmostEqual(np.max(np.linalg.eigvalsh(A)), lamb, places=6)
+            np.testing.assert_array_almost_equal(A @ v, lamb * v, decimal=4)
+        self.assertEqual(1, tracker.misses)
+        self.assertEqual(4, tracker.hits)
+        self.assertAlmostEqual(0.8, tracker.hit_rate)
+        self.assertGreater(tracker.saved_iterations, 0)
+
+    def test_orthogonal_iteration(self):
+        tracker = EigenTracker()
+        for t in range(3):
+            A = self.A + t * self.E
+            Q, _ = tracker.orthogonal_iteration("A", A, k=3, max_iterations=5000)
+            np.testing.assert_array_almost_equal(Q @ (Q.T @ A @ Q), A @ Q, decimal=4)
+        self.assertEqual(2, tracker.hits)
+        self.assertGreater(tracker.saved_iterations, 0)
+        # a different subspace dimension cannot be warm-started
+        tracker.orthogonal_iteration("A", self.A, k=2, max_iterations=5000)
+        self.assertEqual(2, tracker.misses)
+
+    def test_lru(self):
+        tracker = EigenTracker(max_size=2)
+        for key in ["a", "b", "a", "c", "b"]:
+            tracker.power_iteration(key, self.A, max_iterations=10)
+        # "b" was evicted by "c" since "a" was used more recently
+        self.assertEqual(1, tracker.hits)
+        self.assertEqual(4, tracker.misses)
+        self.assertEqual(2, len(tracker))
+        tracker.clear()
+        self.assertEqual(0, len(tracker))
+        self.assertEqual(0.0, tracker.hit_rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+
+from hessenberg import hessenberg_lu, hessenberg_reduction
+
+
+class TestHessenberg(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.A = self.rng.standard_normal((10, 10))
+
+    def test_hessenberg_reduction(self):
+        H, Q = hessenberg_reduction(self.A)
+        np.testing.assert_array_almost_equal(Q @ H @ Q.T, self.A)
+        np.testing.assert_array_almost_equal(Q.T @ Q, np.eye(10))
+        np.testing.assert_array_equal(np.tril(H, -2), np.zeros((10, 10)))
+
+    def test_tridiagonal(self):
+        H, _ = hessenberg_reduction(self.A + self.A.T)
+        np.testing.assert_array_almost_equal(np.triu(H, 2), np.zeros((10, 10)))
+
+    def test_hessenberg_lu(self):
+        H, _ = hessenberg_reduction(self.A)
+        factor = hessenberg_lu(H)
+        np.testing.assert_array_almost_equal(factor.L @ factor.U, H[factor.perm])
+        self.assertTrue(np.all(np.abs(factor.L) <= 1.0))
+        b = self.rng.standard_normal(10)
+        np.testing.assert_array_almost_equal(H @ factor.solve(b), b)
+
+
+if __name__ == "__main__":
+    unittest.main()
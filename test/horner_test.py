@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+
+from root_finding.single_variable.horner import horner, horner_evaluate, horner_method
+
+
+class TestHorner(unittest.TestCase):
+    """
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Section 2.6, Example 2
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.coeff_P = np.array([-4.0, 3.0, -3.0, 0.0, 2.0])
+
+    def test_horner_method(self):
+        P_x0, dP_x0 = horner_method(self.coeff_P, -2.0)
+        self.assertAlmostEqual(10.0, P_x0)
+        self.assertAlmostEqual(-49.0, dP_x0)
+        np.testing.assert_array_almost_equal(
+            horner(self.coeff_P, -2.0), [-7.0, 5.0, -4.0, 2.0]
+        )
+
+    def test_horner_evaluate(self):
+        coeff_P = self.rng.standard_normal(51)
+        x = np.linspace(-1.0, 1.0, 1001).reshape(7, 11, 13)
+        result = horner_evaluate(coeff_P, x, derivatives=3)
+        self.assertEqual((4, 7, 11, 13), result.shape)
+        P = np.polynomial.Polynomial(coeff_P)
+        for k in range(4):
+            np.testing.assert_array_almost_equal(result[k], P.deriv(k)(x), decimal=8)
+
+    def test_stacks(self):
+        coeff_P = self.rng.standard_normal((5, 1, 8))
+        x = self.rng.standard_normal(6)
+        result = horner_evaluate(coeff_P, x, derivatives=8)
+        self.assertEqual((9, 5, 6), result.shape)
+        for i in range(5):
+            P = np.polynomial.Polynomial(coeff_P[i, 0])
+            for k in range(9):
+                np.testing.assert_array_almost_equal(result[k, i], P.deriv(k)(x))
+
+        coeff_Q = horner(coeff_P, x)
+        self.assertEqual((5, 6, 7), coeff_Q.shape)
+        # P(x) = (x - x0) Q(x) + P(x0)
+        y = 0.5
+        np.testing.assert_array_almost_equal(
+            horner_evaluate(coeff_P, np.full(6, y), 0)[0],
+            (y - x) * horner_evaluate(coeff_Q, y, 0)[0] + result[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import scipy.sparse as sp
+import unittest
+import numpy as np
+
+from common.linear_operator import LinearOperator
+
+from krylov import arnoldi, lanczos
+
+
+class TestKrylov(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        n = 200
+        Q, _ = np.linalg.qr(self.rng.standard_normal((n, n)))
+        self.eig_values = np.linspace(-8.0, 9.0, n)
+        self.eig_values[-4:] = [12.0, 14.0, 16.0, 18.0]
+        self.symmetric = Q @ np.diag(self.eig_values) @ Q.T
+
+        # a real block diagonal matrix with the conjugate pairs 25 +- 5i
+        # and 20 +- 2i on top of a real spectrum in [1, 10]
+        D = np.diag(np.linspace(1.0, 10.0, n))
+        D[:2, :2] = [[25.0, 5.0], [-5.0, 25.0]]
+        D[2:4, 2:4] = [[20.0, 2.0], [-2.0, 20.0]]
+        D[4, 4] = 30.0
+        X = Q + 0.1 * self.rng.standard_normal((n, n))
+        self.nonsymmetric = X @ D @ np.linalg.inv(X)
+
+    def check_eigen_pairs(self, A, eig_values, eig_vectors, residuals):
+        np.testing.assert_array_almost_equal(
+            A @ eig_vectors, eig_vectors * eig_values, decimal=6
+        )
+        np.testing.assert_array_almost_equal(
+            np.linalg.norm(eig_vectors, axis=0), np.ones(len(eig_values))
+        )
+        self.assertTrue(np.all(residuals < 1e-7))
+
+    def test_lanczos(self):
+        eig_values, eig_vectors, residuals = lanczos(self.symmetric, k=5, rng=self.rng)
+        order = np.argsort(-np.abs(self.eig_values))
+        np.testing.assert_array_almost_equal(eig_values, self.eig_values[order[:5]])
+        self.check_eigen_pairs(self.symmetric, eig_values, eig_vectors, residuals)
+
+        eig_values, eig_vectors, residuals = lanczos(
+            self.symmetric, k=3, which="SA", rng=self.rng
+        )
+        np.testing.assert_array_almost_equal(eig_values, np.sort(self.eig_values)[:3])
+        self.check_eigen_pairs(self.symmetric, eig_values, eig_vectors, residuals)
+
+    def test_arnoldi(self):
+        eig_values, eig_vectors, residuals = arnoldi(
+            self.nonsymmetric, k=5, rng=self.rng
+        )
+        np.testing.assert_array_almost_equal(
+            eig_values, [30.0, 25.0 + 5.0j, 25.0 - 5.0j, 20.0 + 2.0j, 20.0 - 2.0j]
+        )
+        self.check_eigen_pairs(self.nonsymmetric, eig_values, eig_vectors, residuals)
+
+        eig_values, eig_vectors, residuals = arnoldi(
+            self.nonsymmetric, k=2, which="SR", rng=self.rng
+        )
+        np.testing.assert_array_almost_equal(
+            eig_values, np.linspace(1.0, 10.0, 200)[5:7]
+        )
+
+    def test_linear_operators(self):
+        n = 1000
+        d = np.arange(1.0, n + 1.0)
+        count = [0]
+
+        def matvec(x):
+            count[0] += 1
+            return d * x
+
+        for A in [sp.diags(d).tocsr(), LinearOperator((n, n), matvec)]:
+            eig_values, _, residuals = lanczos(A, k=4, which="LA", rng=self.rng)
+            np.testing.assert_array_almost_equal(eig_values, d[:-5:-1])
+            self.assertTrue(np.all(residuals < 1e-6))
+        # orthogonal_iteration needs far more products for the same spectrum
+        self.assertLess(count[0], 4 * 200)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            lanczos(np.ones((3, 4)))
+        with self.assertRaises(ValueError):
+            lanczos(self.symmetric, k=200, rng=self.rng)
+        with self.assertRaises(ValueError):
+            arnoldi(self.nonsymmetric, k=5, m=5)
+        with self.assertRaises(ValueError):
+            arnoldi(self.nonsymmetric, which="XY")
+        # the orderings of one method are invalid for the other
+        with self.assertRaises(ValueError):
+            lanczos(self.symmetric, which="LR", rng=self.rng)
+        with self.assertRaises(ValueError):
+            arnoldi(self.nonsymmetric, which="SA", rng=self.rng)
+
+
+if __name__ == "__main__":
+    unittest.main()
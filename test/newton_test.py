@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+
+from interpolation.barycentric import BarycentricInterpolator
+from interpolation.newton import NewtonInterpolant
+
+
+class TestNewtonInterpolant(unittest.TestCase):
+    """
+    Reference:
+        Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+        Section 3.3, Example 1
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.nodes = np.array([1.0, 1.3, 1.6, 1.9, 2.2])
+        self.values = np.array([0.7651977, 0.6200860, 0.4554022, 0.2818186, 0.1103623])
+
+    def test_newton(self):
+        P = NewtonInterpolant(self.nodes, self.values)
+        self.assertAlmostEqual(0.5118200, P(1.5), places=7)
+        np.testing.assert_array_almost_equal(P(self.nodes), self.values)
+        # f[x_0, ..., x_4], the leading coefficient of the table in the book
+        self.assertAlmostEqual(0.0018251, P.coefficients[-1], places=7)
+
+    def test_append(self):
+        P = NewtonInterpolant()
+        for node, value in zip(self.nodes, self.values):
+            P.append(node, value)
+        x = np.linspace(1.0, 2.2, 77).reshape(7, 11)
+        Q = BarycentricInterpolator(self.nodes, self.values)
+        np.testing.assert_array_almost_equal(P(x), Q(x))
+        with self.assertRaises(ValueError):
+            P.append(1.3, 0.0)
+
+    def test_sliding_window(self):
+        nodes = np.cumsum(self.rng.random(40) + 0.1)
+        values = np.sin(nodes)
+        P = NewtonInterpolant(max_nodes=6)
+        for i in range(len(nodes)):
+            P.append(nodes[i], values[i])
+            start = max(0, i - 5)
+            self.assertEqual(i + 1 - start, len(P))
+            Q = NewtonInterpolant(nodes[start : i + 1], values[start : i + 1])
+            np.testing.assert_array_almost_equal(P.nodes, Q.nodes)
+            x = np.linspace(nodes[start], nodes[i], 9)
+            np.testing.assert_array_almost_equal(P(x), Q(x))
+
+        P.drop_oldest()
+        np.testing.assert_array_almost_equal(P(nodes[-5:]), values[-5:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from LU_decomposition import out_product_lu
+from out_of_core_lu import out_of_core_lu
+
+
+class TestOutOfCoreLU(unittest.TestCase):
+    def setUp(self):
+        self.n = 120
+        self.rng = np.random.default_rng(0)
+        self.A = self.rng.random((self.n, self.n)) + self.n * np.eye(self.n)
+        self.real_L, self.real_U = out_product_lu(self.A.copy())
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "A.bin")
+        mm = np.memmap(self.path, dtype=np.float64, mode="w+", shape=self.A.shape)
+        mm[:] = self.A
+        mm.flush()
+        del mm
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_memmap(self):
+        mm = np.memmap(self.path, dtype=np.float64, mode="r+", shape=self.A.shape)
+        # 13 rows per panel, the last panel is narrower.
+        factor = out_of_core_lu(mm, memory_budget=3 * 13 * self.n * 8)
+        self.assertIs(factor.lu, mm)
+        np.testing.assert_array_almost_equal(self.real_L, factor.L)
+        np.testing.assert_array_almost_equal(self.real_U, factor.U)
+        del factor, mm
+
+    def test_path(self):
+        out_of_core_lu(self.path, shape=self.A.shape, memory_budget=3 * self.n * 8)
+        packed = np.fromfile(self.path).reshape(self.A.shape)
+        np.testing.assert_array_almost_equal(self.real_U, np.triu(packed))
+        np.testing.assert_array_almost_equal(
+            self.real_L, np.tril(packed, -1) + np.eye(self.n)
+        )
+
+    def test_empty(self):
+        A = np.empty((0, 0))
+        factor = out_of_core_lu(A)
+        self.assertIs(factor.lu, A)
+        self.assertEqual(factor.solve(np.empty(0)).shape, (0,))
+
+    def test_budget(self):
+        with self.assertRaises(ValueError):
+            out_of_core_lu(self.path, shape=self.A.shape, memory_budget=100)
+
+
+if __name__ == "__main__":
+    unittest.main()
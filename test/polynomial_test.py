@@ -0,0 +1,53 @@
+import math
+import unittest
+import numpy as np
+
+from root_finding.single_variable.newton import newton_multiple_roots
+from root_finding.single_variable.polynomial import polynomial_roots
+
+
+class TestPolynomialRoots(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def assertSameRoots(self, expected, actual, decimal=6):
+        self.assertEqual(len(expected), len(actual))
+        remaining = list(expected)
+        for root in actual:
+            i = int(np.argmin(np.abs(np.array(remaining) - root)))
+            self.assertAlmostEqual(remaining.pop(i), root, places=decimal)
+
+    def test_random_polynomials(self):
+        for n in [1, 2, 10, 200]:
+            coeff_P = self.rng.standard_normal(n + 1)
+            roots = polynomial_roots(coeff_P)
+            self.assertSameRoots(np.roots(coeff_P[::-1]), roots, decimal=8)
+
+    def test_special_roots(self):
+        # P(x) = x^2 (x - 1)^2 (x^2 + 9), a zero and a double root
+        coeff_P = np.poly([0.0, 0.0, 1.0, 1.0, 3j, -3j]).real[::-1]
+        self.assertSameRoots([0.0, 0.0, 1.0, 1.0, 3j, -3j], polynomial_roots(coeff_P))
+        self.assertSameRoots([2.0], polynomial_roots([-2.0, 1.0, 0.0, 0.0]))
+        with self.assertRaises(ValueError):
+            polynomial_roots([0.0, 0.0])
+
+    def test_newton_multiple_roots(self):
+        """
+        Reference:
+            Burden, Richard L., and J. Douglas Faires. Numerical Analysis. 9th ed.
+            Section 2.4, Example 3
+        """
+        f = lambda x: math.exp(x) - x - 1
+        df = lambda x: math.exp(x) - 1
+        ddf = lambda x: math.exp(x)
+        self.assertAlmostEqual(0.0, newton_multiple_roots(f, df, ddf, 1.0), places=6)
+
+        # (x - 1)^3 (x + 2), a triple root
+        f = lambda x: (x - 1) ** 3 * (x + 2)
+        df = lambda x: 3 * (x - 1) ** 2 * (x + 2) + (x - 1) ** 3
+        ddf = lambda x: 6 * (x - 1) * (x + 2) + 6 * (x - 1) ** 2
+        self.assertAlmostEqual(1.0, newton_multiple_roots(f, df, ddf, 2.0), places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
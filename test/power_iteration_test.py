@@ -1,7 +1,12 @@
+import scipy.sparse as sp
+import scipy.sparse.linalg as spl
 import unittest
 import numpy as np
 
+from common.linear_operator import LinearOperator
+
 from power_iteration import (
+    batched_power_iteration,
     power_iteration,
     rayleigh_quotient_iteration,
     orthogonal_iteration,
@@ -10,16 +15,19 @@ from power_iteration import (
 
 class TestPowerIterations(unittest.TestCase):
     def setUp(self):
+        self.rng = np.random.default_rng(0)
         n = 5
-        eig_vectors = np.random.randn(n, n)
+        eig_vectors = self.rng.standard_normal((n, n))
         eig_vectors /= np.linalg.norm(eig_vectors, axis=0)
-        eig_values = np.sort(np.random.rand(n))
+        eig_values = np.sort(self.rng.random(n))
         self.A = eig_vectors @ np.diag(eig_values) @ np.linalg.inv(eig_vectors)
         self.real_lamb = eig_values[-1]
         self.real_eigenvector = eig_vectors[:, -1]
 
     def test_power_iterations(self):
-        test_lamb, test_eigenvector = power_iteration(self.A, max_iterations=1000)
+        test_lamb, test_eigenvector = power_iteration(
+            self.A, max_iterations=1000, rng=self.rng
+        )
         test_eigenvector /= np.linalg.norm(test_eigenvector)
         self.assertAlmostEqual(self.real_lamb, test_lamb, places=3)
         try:
@@ -32,6 +40,69 @@ class TestPowerIterations(unittest.TestCase):
                 np.zeros_like(test_eigenvector),
             )
 
+    def test_power_iteration_history(self):
+        Q, _ = np.linalg.qr(self.rng.standard_normal((6, 6)))
+        A = Q @ np.diag([4.0, 2.0, 1.0, 0.5, 0.2, 0.1]) @ Q.T
+        test_lamb, test_eigenvector, history = power_iteration(
+            A, max_iterations=1000, tol=1e-8, return_history=True, rng=self.rng
+        )
+        self.assertAlmostEqual(4.0, test_lamb)
+        self.assertTrue(history.converged)
+        self.assertLess(history.iterations, 1000)
+        self.assertEqual(len(history.eigenvalues), history.iterations)
+        self.assertLessEqual(history.residuals[-1], 1e-8 * abs(test_lamb))
+        self.assertAlmostEqual(0.5, history.ratio, places=2)
+
+    def test_power_iteration_not_converged(self):
+        # the eigenvalue and eigenvector come from the same iterate
+        test_lamb, test_eigenvector, history = power_iteration(
+            self.A, max_iterations=2, tol=0.0, return_history=True, rng=self.rng
+        )
+        self.assertFalse(history.converged)
+        self.assertAlmostEqual(
+            test_lamb, test_eigenvector @ self.A @ test_eigenvector, places=12
+        )
+        with self.assertRaises(ValueError):
+            power_iteration(self.A, max_iterations=0)
+
+    def test_reproducible(self):
+        for solver in [power_iteration, orthogonal_iteration]:
+            first = solver(self.A, max_iterations=20, rng=7)
+            second = solver(self.A, max_iterations=20, rng=7)
+            for x, y in zip(first, second):
+                np.testing.assert_array_equal(x, y)
+        # a shared generator keeps drawing new initial guesses
+        rng = np.random.default_rng(7)
+        _, first = power_iteration(self.A, max_iterations=1, rng=rng)
+        _, second = power_iteration(self.A, max_iterations=1, rng=rng)
+        self.assertFalse(np.allclose(first, second))
+
+    def test_batched_power_iteration(self):
+        batch, n = 50, 6
+        eig_vectors = self.rng.standard_normal((batch, n, n))
+        eig_values = self.rng.random((batch, n))
+        eig_values[:, 0] = 2.0 + np.arange(batch)
+        A = eig_vectors @ (eig_values[..., None] * np.linalg.inv(eig_vectors))
+        # the first item starts from its eigenvector and converges at once
+        v = self.rng.random((batch, n))
+        v[0] = eig_vectors[0, :, 0]
+        test_lamb, test_eigenvectors, iterations, converged = batched_power_iteration(
+            A, max_iterations=1000, v=v
+        )
+        self.assertTrue(np.all(converged))
+        self.assertEqual(1, iterations[0])
+        np.testing.assert_array_almost_equal(eig_values[:, 0], test_lamb)
+        np.testing.assert_array_almost_equal(
+            np.einsum("bij,bj->bi", A, test_eigenvectors),
+            test_lamb[:, None] * test_eigenvectors,
+        )
+        for i in [1, batch - 1]:
+            lamb, _, history = power_iteration(
+                A[i], max_iterations=1000, v=v[i], return_history=True
+            )
+            self.assertAlmostEqual(lamb, test_lamb[i])
+            self.assertEqual(history.iterations, iterations[i])
+
     def test_rayleigh_quotient_iterations(self):
         # remark: the result depends on the initialization.
         v = self.real_eigenvector
@@ -49,10 +120,54 @@ class TestPowerIterations(unittest.TestCase):
                 np.zeros_like(test_eigenvector),
             )
 
+    def test_rayleigh_quotient_variants(self):
+        Q, _ = np.linalg.qr(self.rng.standard_normal((30, 30)))
+        X = Q + 0.1 * self.rng.standard_normal((30, 30))
+        eig_values = np.arange(1.0, 31.0)
+        symmetric = Q @ np.diag(eig_values) @ Q.T
+        nonsymmetric = X @ np.diag(eig_values) @ np.linalg.inv(X)
+        for A, V in [(symmetric, Q), (nonsymmetric, X)]:
+            v = V[:, 11] / np.linalg.norm(V[:, 11]) + 0.02 * self.rng.standard_normal(
+                30
+            )
+            for hessenberg in [True, False]:
+                for interval in [1, 3]:
+                    test_lamb, test_eigenvector = rayleigh_quotient_iteration(
+                        A,
+                        max_iterations=50,
+                        v=v.copy(),
+                        hessenberg=hessenberg,
+                        shift_update_interval=interval,
+                    )
+                    self.assertAlmostEqual(12.0, test_lamb, places=6)
+                    np.testing.assert_array_almost_equal(
+                        A @ test_eigenvector, test_lamb * test_eigenvector
+                    )
+
     def test_orthogonal_iterations(self):
-        Q, sigma = orthogonal_iteration(self.A, k=5, max_iterations=1000)
+        Q, sigma = orthogonal_iteration(self.A, k=5, max_iterations=1000, rng=self.rng)
         np.testing.assert_array_almost_equal(self.A, Q @ sigma @ Q.T, decimal=3)
 
+    def test_linear_operators(self):
+        n = 100
+        d = np.linspace(1.0, 2.0, n)
+        operators = [
+            sp.diags(d).tocsr(),
+            spl.LinearOperator((n, n), matvec=lambda x: d * x.ravel()),
+            LinearOperator((n, n), lambda x: d * x),
+        ]
+        for A in operators:
+            test_lamb, _ = power_iteration(A, max_iterations=5000, rng=self.rng)
+            self.assertAlmostEqual(2.0, test_lamb, places=6)
+
+            v = np.ones(n) * 1e-3
+            v[40] = 1.0
+            test_lamb, _ = rayleigh_quotient_iteration(A, max_iterations=10, v=v)
+            self.assertAlmostEqual(d[40], test_lamb, places=6)
+
+            _, R = orthogonal_iteration(A, k=2, max_iterations=2000, rng=self.rng)
+            np.testing.assert_array_almost_equal(np.abs(np.diag(R)), d[:-3:-1], 3)
+
 
 if __name__ == "__main__":
     # print the numpy array in float format
@@ -0,0 +1,70 @@
+import math
+import unittest
+
+from common.evaluation import CountingFunction
+from root_finding.single_variable.bisection import bisection
+from root_finding.single_variable.fix_point import fix_point
+from root_finding.single_variable.muller import muller_method
+from root_finding.single_variable.newton import (
+    false_position,
+    newton_method,
+    secant_method,
+)
+
+
+class TestRootFinding(unittest.TestCase):
+    def setUp(self):
+        self.f = CountingFunction(lambda x: math.cos(x) - x)
+        self.root = 0.7390851332151607
+
+    def check(self, root):
+        self.assertAlmostEqual(self.root, root, places=8)
+        # f is evaluated once at every point
+        self.assertGreater(self.f.calls, 0)
+        self.assertEqual(0, self.f.repeated)
+
+    def test_bisection(self):
+        root, f_root = bisection(self.f, 0.0, math.pi / 2, 1e-10)
+        self.check(root)
+        self.assertEqual(f_root, self.f.f(root))
+
+    def test_newton(self):
+        df = CountingFunction(lambda x: -math.sin(x) - 1)
+        self.check(newton_method(self.f, df, 0.5, 1e-10))
+        self.assertEqual(self.f.calls, df.calls)
+        self.assertEqual(0, df.repeated)
+
+    def test_secant(self):
+        self.check(secant_method(self.f, 0.5, math.pi / 4, 1e-10))
+
+    def test_false_position(self):
+        self.check(false_position(self.f, 0.5, math.pi / 4, 1e-10))
+
+    def test_muller(self):
+        self.check(muller_method(self.f, 0.5, 0.6, math.pi / 4, 1e-10))
+
+    def test_muller_complex(self):
+        # real initial guesses reach the complex roots of x^2 + 1
+        root = muller_method(lambda x: x**2 + 1, 0.5, -0.5, 0.0, 1e-12)
+        self.assertAlmostEqual(1.0, abs(root.imag), places=10)
+        self.assertAlmostEqual(0.0, root.real, places=10)
+
+    def test_fix_point(self):
+        f = CountingFunction(math.cos)
+        x = fix_point(f, 0.5, 1e-10)
+        self.assertAlmostEqual(math.cos(x), x, places=9)
+        # every iterate is evaluated once
+        self.assertEqual(0, f.repeated)
+        with self.assertRaises(ValueError):
+            fix_point(lambda x: 3 * x, 1.0)
+
+    def test_counting_function(self):
+        self.f(1.0)
+        self.f(1.0)
+        self.assertEqual((2, 1), (self.f.calls, self.f.repeated))
+        self.f.reset()
+        self.assertEqual((0, []), (self.f.calls, self.f.arguments))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+
+from triangular_solve import forward_substitution, back_substitution
+
+
+class TestTriangularSolve(unittest.TestCase):
+    def setUp(self):
+        n = 150
+        self.rng = np.random.default_rng(0)
+        self.L = np.tril(self.rng.random((n, n))) + n * np.eye(n)
+        self.U = self.L.T.copy()
+        self.b = self.rng.random(n)
+        self.B = self.rng.random((n, 4))
+
+    def test_forward_substitution(self):
+        for block_size in [1, 16, 64, 200]:
+            x = forward_substitution(self.L, self.b, block_size=block_size)
+            np.testing.assert_array_almost_equal(self.L @ x, self.b)
+            X = forward_substitution(self.L, self.B, block_size=block_size)
+            np.testing.assert_array_almost_equal(self.L @ X, self.B)
+
+    def test_back_substitution(self):
+        for block_size in [1, 16, 64, 200]:
+            x = back_substitution(self.U, self.b, block_size=block_size)
+            np.testing.assert_array_almost_equal(self.U @ x, self.b)
+            X = back_substitution(self.U, self.B, block_size=block_size)
+            np.testing.assert_array_almost_equal(self.U @ X, self.B)
+
+    def test_unit_diagonal(self):
+        # only the strictly lower part of a packed matrix is referenced.
+        packed = self.L + np.triu(self.rng.random(self.L.shape))
+        L = np.tril(self.L, -1) + np.eye(self.L.shape[0])
+        x = forward_substitution(packed, self.b, unit_diagonal=True)
+        np.testing.assert_array_almost_equal(L @ x, self.b)
+
+    def test_overwrite_b(self):
+        b = self.b.copy()
+        x = back_substitution(self.U, b, overwrite_b=True)
+        self.assertIs(x, b)
+        b = np.arange(150)
+        x = back_substitution(self.U, b, overwrite_b=True)
+        self.assertIsNot(x, b)
+        np.testing.assert_array_almost_equal(self.U @ x, b)
+        # a float32 b cannot hold the float64 solution, only x is valid
+        B = self.B.astype(np.float32)
+        X = forward_substitution(self.L, B, overwrite_b=True)
+        self.assertEqual(X.dtype, np.float64)
+        np.testing.assert_array_almost_equal(self.L @ X, B)
+
+    def test_singular(self):
+        U = self.U.copy()
+        U[3, 3] = 0.0
+        with self.assertRaises(ZeroDivisionError):
+            back_substitution(U, self.b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import math
+import unittest
+import numpy as np
+
+from root_finding.single_variable import vectorized
+from root_finding.single_variable.bisection import bisection
+from root_finding.single_variable.newton import newton_method, secant_method
+
+
+class TestVectorizedRootFinding(unittest.TestCase):
+    def setUp(self):
+        # cos(x) = c x has a single root in [0, pi / 2] for every c > 0
+        self.c = np.linspace(0.5, 2.0, 12).reshape(3, 4)
+        self.sizes = []
+
+        def f(x, c):
+            self.sizes.append(x.size)
+            return np.cos(x) - c * x
+
+        self.f = f
+        self.df = lambda x, c: -np.sin(x) - c
+
+    def scalar_roots(self, method, *args):
+        return np.array(
+            [
+                method(lambda x: math.cos(x) - c * x, *args, tol=1e-10)
+                for c in self.c.ravel()
+            ]
+        ).reshape(self.c.shape)
+
+    def check(self, result, expected):
+        roots, iterations, status = result
+        self.assertEqual(self.c.shape, roots.shape)
+        np.testing.assert_array_almost_equal(roots, expected, decimal=8)
+        np.testing.assert_array_equal(status, vectorized.CONVERGED)
+        self.assertTrue(np.all(iterations > 0))
+        # every call only sees the lanes which are still active
+        self.assertEqual(self.sizes, sorted(self.sizes, reverse=True))
+        self.assertLess(self.sizes[-1], self.c.size)
+
+    def test_bisection(self):
+        result = vectorized.bisection(self.f, 0.0, np.pi / 2, tol=1e-10, args=(self.c,))
+        expected = self.scalar_roots(
+            lambda f, *args, tol: bisection(f, *args, tol)[0], 0.0, np.pi / 2
+        )
+        self.check(result, expected)
+
+    def test_newton(self):
+        result = vectorized.newton_method(
+            self.f, self.df, np.full(self.c.shape, np.pi / 4), tol=1e-10, args=(self.c,)
+        )
+        expected = [
+            newton_method(
+                lambda x: math.cos(x) - c * x,
+                lambda x: -math.sin(x) - c,
+                np.pi / 4,
+                tol=1e-10,
+            )
+            for c in self.c.ravel()
+        ]
+        self.check(result, np.reshape(expected, self.c.shape))
+
+    def test_secant_and_false_position(self):
+        expected = self.scalar_roots(secant_method, 0.5, np.pi / 4)
+        for method in [vectorized.secant_method, vectorized.false_position]:
+            self.sizes = []
+            result = method(self.f, 0.5, np.pi / 4, tol=1e-10, args=(self.c,))
+            self.check(result, expected)
+
+    def test_status(self):
+        roots, _, status = vectorized.bisection(
+            lambda x: x**2 - 2.0, [0.0, 2.0], [2.0, 3.0]
+        )
+        np.testing.assert_array_equal(
+            [vectorized.CONVERGED, vectorized.SIGN_ERROR], status
+        )
+        self.assertTrue(np.isnan(roots[1]))
+
+        _, iterations, status = vectorized.newton_method(
+            lambda x: x**2 - 2.0, lambda x: 2 * x, [0.0, 1.0], max_iterations=3
+        )
+        np.testing.assert_array_equal(
+            [vectorized.ZERO_DERIVATIVE, vectorized.MAX_ITERATIONS], status
+        )
+        np.testing.assert_array_equal([1, 3], iterations)
+
+
+if __name__ == "__main__":
+    unittest.main()
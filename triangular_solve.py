@@ -0,0 +1,137 @@
+import numpy as np
+
+from common.dtype import float_dtype
+
+
+def _forward_kernel(
+    L: np.ndarray, b: np.ndarray, unit_diagonal: bool, tol: float
+) -> None:
+    n = L.shape[0]
+    for i in range(n):
+        if i > 0:
+            b[i] -= L[i, :i] @ b[:i]
+        if not unit_diagonal:
+            if abs(L[i, i]) <= tol:
+                raise ZeroDivisionError("diagonal should not be zero")
+            b[i] /= L[i, i]
+
+
+def _back_kernel(U: np.ndarray, b: np.ndarray, unit_diagonal: bool, tol: float) -> None:
+    n = U.shape[0]
+    for i in range(n - 1, -1, -1):
+        if i < n - 1:
+            b[i] -= U[i, i + 1 :] @ b[i + 1 :]
+        if not unit_diagonal:
+            if abs(U[i, i]) <= tol:
+                raise ZeroDivisionError("diagonal should not be zero")
+            b[i] /= U[i, i]
+
+
+def _prepare(T: np.ndarray, b: np.ndarray, overwrite_b: bool) -> np.ndarray:
+    m, n = T.shape
+    if m != n:
+        raise ValueError("Triangular solve is only valid for square matrix.")
+    if b.shape[0] != n:
+        raise ValueError("The size of b does not match the matrix.")
+
+    dtype = float_dtype(T, b)
+    if overwrite_b and b.dtype == dtype:
+        return b
+    return np.array(b, dtype=dtype)
+
+
+def forward_substitution(
+    L: np.ndarray,
+    b: np.ndarray,
+    unit_diagonal: bool = False,
+    overwrite_b: bool = False,
+    block_size: int = 64,
+    tol: float = 1e-8,
+) -> np.ndarray:
+    """Solve the lower triangular system Lx = b by forward substitution
+
+    Only the lower triangle of L is referenced, so L may hold packed LU
+    factors. Systems larger than block_size are solved block by block: each
+    diagonal block is solved by the row-oriented algorithm and the remaining
+    right hand side is updated with one matrix product.
+
+    Args:
+        L (np.ndarray): a lower triangular matrix of size n-by-n
+        b (np.ndarray): a vector of size n or a matrix of size n-by-k
+        unit_diagonal (bool, optional): assume the diagonal of L is one
+            without reading it. Defaults to False.
+        overwrite_b (bool, optional): store the solution in b.
+            Only honored if b already has the dtype of the solution, so
+            callers must use the returned array. Defaults to False.
+        block_size (int, optional): the size of a diagonal block.
+            Defaults to 64.
+        tol (float, optional): diagonal entries of magnitude at most tol are
+            treated as zero. Defaults to 1e-8.
+
+    Raises:
+        ValueError: raises if L is not square or b does not match L.
+        ZeroDivisionError: raises if L is singular
+
+    Returns:
+        np.ndarray: the solution x with the same shape as b.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 3.1.1, Section 3.1.4
+    """
+    x = _prepare(L, b, overwrite_b)
+    n = L.shape[0]
+    for k in range(0, n, block_size):
+        e = min(k + block_size, n)
+        _forward_kernel(L[k:e, k:e], x[k:e], unit_diagonal, tol)
+        if e < n:
+            x[e:] -= L[e:, k:e] @ x[k:e]
+
+    return x
+
+
+def back_substitution(
+    U: np.ndarray,
+    b: np.ndarray,
+    unit_diagonal: bool = False,
+    overwrite_b: bool = False,
+    block_size: int = 64,
+    tol: float = 1e-8,
+) -> np.ndarray:
+    """Solve the upper triangular system Ux = b by back substitution
+
+    Only the upper triangle of U is referenced, so U may hold packed LU
+    factors. Systems larger than block_size are solved block by block from
+    the bottom right corner.
+
+    Args:
+        U (np.ndarray): an upper triangular matrix of size n-by-n
+        b (np.ndarray): a vector of size n or a matrix of size n-by-k
+        unit_diagonal (bool, optional): assume the diagonal of U is one
+            without reading it. Defaults to False.
+        overwrite_b (bool, optional): store the solution in b.
+            Only honored if b already has the dtype of the solution, so
+            callers must use the returned array. Defaults to False.
+        block_size (int, optional): the size of a diagonal block.
+            Defaults to 64.
+        tol (float, optional): diagonal entries of magnitude at most tol are
+            treated as zero. Defaults to 1e-8.
+
+    Raises:
+        ValueError: raises if U is not square or b does not match U.
+        ZeroDivisionError: raises if U is singular
+
+    Returns:
+        np.ndarray: the solution x with the same shape as b.
+
+    Reference:
+        <<Matrix Computations>> 4-th Edition, Algorithm 3.1.2, Section 3.1.4
+    """
+    x = _prepare(U, b, overwrite_b)
+    n = U.shape[0]
+    for e in range(n, 0, -block_size):
+        k = max(e - block_size, 0)
+        _back_kernel(U[k:e, k:e], x[k:e], unit_diagonal, tol)
+        if k > 0:
+            x[:k] -= U[:k, k:e] @ x[k:e]
+
+    return x